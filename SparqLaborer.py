@@ -5,22 +5,67 @@ import inspect
 import argparse
 import imp
 import csv
+import datetime
+import decimal
+import email.utils
 import json
 import logging
+import math
 import sys
 import time
 import os
-import regex
+import random
+import re
 import collections
-from httplib2 import Http
+import array
+import base64
+import concurrent.futures
+import contextlib
+import hashlib
+import codecs
+import functools
+import gzip
+import io
+import itertools
+import lzma
+import shutil
+import sqlite3
+import tempfile
+import threading
+import http.client
+import urllib.parse
+import urllib.request
+import xml.etree.ElementTree
+import xml.sax.saxutils
+from httplib2 import Http, HttpLib2Error
 import xlsxwriter
 from pathlib import Path
-from SPARQLWrapper import CSV, TSV, XML, JSON, SPARQLExceptions, SPARQLWrapper
+from SPARQLWrapper import CSV, TSV, XML, JSON, SPARQLExceptions
 from googleapiclient import discovery
+from googleapiclient.errors import HttpError
 from oauth2client import client, tools, file
 from oauth2client.client import GoogleCredentials
 # from SPARQLWrapper import SPARQLExceptions
 
+# pyarrow is only needed for writing parquet and arrow files
+try:
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+# zstandard is only needed for compressing result files with zstd
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# output formats which are written from the harmonized results (instead of the raw bytes returned by the endpoint),
+# their results are fetched as csv
+harmonized_output_formats = ["XLSX", "PARQUET", "ARROW"]
+
+
 def main():
 
     # argument parser
@@ -29,6 +74,10 @@ def main():
     parser.add_argument("-s", help="reads in a provided client_secret json file. If no client_secret.json is provided as argument, SparqLaborer will search the current folder for one. (A client_secret can be obtained by logging into the Google Developer Console where a projects needs to be registered.)")
     parser.add_argument("-c", help="reads in a provided credentials json file. If no credentials.json is provided as argument, SparqLaborer will search the current folder for one. If there does not exist a credentials file yet, you can create one by providing a client_secret, after which you should be directed to a google-login, the resulting credentials file will be saved in the current folder.")
     parser.add_argument("-t", action='store_true', help="creates a template file for showcasing the queries-layout")
+    parser.add_argument("-p", type=int, help="sets the maximum number of queries executed in parallel against the endpoint. Overrides 'max_parallel_queries' of the query collection file.")
+    parser.add_argument("--no-cache", action='store_true', help="neither reads from nor writes into the result cache, even if 'cache_ttl' is set in the query collection file")
+    parser.add_argument("--refresh", action='store_true', help="ignores cached results and executes all queries again, replacing the cached results with the fresh ones")
+    parser.add_argument("--resume", help="resumes an interrupted run from the specified folder, which it created in a local output_destination: the queries written completely according to the journal of the run are skipped, all others are executed and written into the same folder and summary. Runs the query collection file of the interrupted run, unless another one is given with '-r'.")
 
     if len(sys.argv) == 1:
         print("\nERROR: No arguments given!")
@@ -39,16 +88,27 @@ def main():
 
 
 
-    # user wants to run a queries file and does not want to create a template file
-    if args.r and not args.t:
+    # user wants to run a queries file (or resume an interrupted run) and does not want to create a template file
+    if (args.r or args.resume) and not args.t:
 
         logging.basicConfig(filename="SparqLaborer.log", filemode="w", level=logging.INFO)
 
+        # an interrupted run is resumed with its query collection file (unless another one is given), its timestamp
+        # and its variant, as recorded in its journal
+        query_collection_filename = args.r
+        timestamp_start = None
+        if args.resume:
+            run, header, queries = Run_journal.read(args.resume)
+            if query_collection_filename is None:
+                query_collection_filename = run["query_collection_file"]
+            timestamp_start = run["timestamp_start"]
+
         # read queries collection file
-        query_collection_module = imp.load_source('conf', args.r)
+        query_collection_module = imp.load_source('conf', query_collection_filename)
 
         # extract and validate data from the queries collection file
-        query_collection_data_object = read_query_collection_data_input(query_collection_module, args.r)
+        query_collection_data_object = read_query_collection_data_input(
+            query_collection_module, query_collection_filename, timestamp_start)
 
         ## google authentication cases
 
@@ -82,38 +142,82 @@ def main():
                 client_secret_path = False
 
 
-        # credentials for google api
+        set_run_arguments(query_collection_data_object, args, credentials_path, client_secret_path)
+
+
+        if args.resume:
+
+            # only the variant of the interrupted run is resumed, into its folder
+            query_collection_data_object.select_multi_value(run["variant"])
+            query_collection_data_object.resume_folder = args.resume
+            run_query_collection(query_collection_module, query_collection_data_object)
+
+        else:
+
+            # multi-value variants are run either one after another, or each in its own process at the same time
+
+            variants_count = query_collection_data_object._multi_value_length
+            max_parallel_variants = min(query_collection_data_object.max_parallel_variants, variants_count)
+
+            output_destinations = query_collection_data_object._output_destination
+            if type(output_destinations) is not list:
+                output_destinations = [output_destinations]
+
+            if max_parallel_variants > 1 and client_secret_path and \
+                    any("google.com" in output_destination for output_destination in output_destinations):
+                message = "Authenticating with a client_secret for google requires the variants to be run one after another."
+                logging.warning(message)
+                print(message)
+                max_parallel_variants = 1
+
+            # Queries which several variants would execute against the same endpoint are executed only once. Since their
+            # results are shared within a process, variants sharing any of them are run in the same process.
+            query_collection_data_object.shared_results_formats, variants_groups = \
+                plan_shared_results(query_collection_module, query_collection_data_object)
+
+            if max_parallel_variants > 1 and len(variants_groups) > 1:
+
+                message = "Running " + str(variants_count) + " variants in " + str(len(variants_groups)) + \
+                    " processes, " + str(max_parallel_variants) + " at the same time"
+                logging.info(message)
+                print(message)
+
+                with concurrent.futures.ProcessPoolExecutor(max_workers=max_parallel_variants) as executor:
 
-        query_collection_data_object.credentials_path = credentials_path
-        query_collection_data_object.client_secret_path = client_secret_path
+                    futures = [
+                        executor.submit(
+                            execute_variants, args.r, variants, query_collection_data_object.timestamp_start,
+                            args, credentials_path, client_secret_path)
+                        for variants in variants_groups ]
 
+                    for variants, future in zip(variants_groups, futures):
+                        future.result()
+                        message = "Finished variants: " + ", ".join([ str(variant + 1) for variant in variants ])
+                        logging.info(message)
+                        print(message)
 
-        # save original state of queries-list, since meta_functions could change it which then
-        # could interfere with multi-value iterations.
-        queries_original_state = query_collection_module.queries.copy()
+            else:
 
-        has_next = True
+                # save original state of queries-list, since meta_functions could change it which then
+                # could interfere with multi-value iterations.
+                queries_original_state = query_collection_module.queries.copy()
 
-        while has_next:
+                has_next = True
 
-            # output_writer setup
-            query_collection_data_object.output_writer = Output_writer(query_collection_data_object)
+                try:
 
-            # execute queries, get results with further query data returned
-            execute_queries(query_collection_data_object)
+                    while has_next:
 
-            # pass results to custom post processing method in the query collection file (if present)
-            if hasattr(query_collection_module, "custom_post_processing"):
-                query_collection_module.custom_post_processing(query_collection_data_object)
+                        run_query_collection(query_collection_module, query_collection_data_object)
 
-            # Close xlsx writer
-            query_collection_data_object.output_writer.close()
+                        has_next = query_collection_data_object.has_next()
+                        if has_next:
 
-            has_next = query_collection_data_object.has_next()
-            if has_next:
+                            # reset the queries list to its initial state
+                            query_collection_module.queries = queries_original_state
 
-                # reset the queries list to its initial state
-                query_collection_module.queries = queries_original_state
+                finally:
+                    query_collection_data_object.release_shared_results()
 
 
 
@@ -134,8 +238,161 @@ def main():
 
 
 
-def read_query_collection_data_input(query_collection_module, query_collection_filename):
-    """Reads input from query collection file and convert into usable data structure available throughout the entire program execution"""
+def set_run_arguments(query_collection_data_object, args, credentials_path, client_secret_path):
+    """Sets the paths of the google credentials and the command line arguments overriding settings of the query
+    collection file"""
+
+    # credentials for google api
+
+    query_collection_data_object.credentials_path = credentials_path
+    query_collection_data_object.client_secret_path = client_secret_path
+
+
+    # command line arguments overriding settings of the query collection file
+
+    if args.p is not None:
+        query_collection_data_object.max_parallel_queries = args.p
+        logging.info("max_parallel_queries overridden by command line: " + str(args.p))
+
+    query_collection_data_object.cache_disabled = args.no_cache
+    query_collection_data_object.cache_refresh = args.refresh
+
+
+def run_query_collection(query_collection_module, query_collection_data_object):
+    """Runs the current multi-value variant of a query collection: executes its queries, writes their results and
+    passes them to the custom post processing"""
+
+    # output_writer setup
+    query_collection_data_object.output_writer = Output_writer(query_collection_data_object)
+
+    # execute queries, get results with further query data returned
+    execute_queries(query_collection_data_object)
+
+    # pass results to custom post processing method in the query collection file (if present)
+    if hasattr(query_collection_module, "custom_post_processing"):
+        query_collection_module.custom_post_processing(query_collection_data_object)
+
+    # Close xlsx writer
+    query_collection_data_object.output_writer.close()
+
+
+def execute_variants(query_collection_filename, variants, timestamp_start, args, credentials_path, client_secret_path):
+    """Runs some multi-value variants of a query collection one after another within their own process. The query
+    collection file is read anew, and for each variant its multi-values are fixed to the ones of the variant, so that
+    no state is shared with the variants of other processes."""
+
+    logging.basicConfig(
+        filename="SparqLaborer (variant " + ", ".join([ str(variant + 1) for variant in variants ]) + ").log",
+        filemode="w", level=logging.INFO, force=True)
+
+    query_collection_module = imp.load_source('conf', query_collection_filename)
+    queries_original_state = query_collection_module.queries.copy()
+
+    query_collection_data_object = read_query_collection_data_input(
+        query_collection_module, query_collection_filename, timestamp_start)
+    set_run_arguments(query_collection_data_object, args, credentials_path, client_secret_path)
+    query_collection_data_object.shared_results_formats, variants_groups = \
+        plan_shared_results(query_collection_module, query_collection_data_object)
+
+    try:
+
+        for variant in variants:
+
+            query_collection_data_object.select_multi_value(variant)
+            run_query_collection(query_collection_module, query_collection_data_object)
+
+            # reset the queries list to its initial state
+            query_collection_module.queries = queries_original_state.copy()
+
+    finally:
+        query_collection_data_object.release_shared_results()
+
+
+def plan_shared_results(query_collection_module, query_collection_data_object):
+    """Finds the queries (and counts of all triples) which several multi-value variants of a query collection would
+    execute against the same endpoint, e.g. if the variants differ only by their output_format or output_destination.
+    These are executed only once, and their results are shared by the variants.
+    Returns the format they are fetched in by endpoint and query text (None for the count of all triples), and the
+    groups of variants sharing any of the queries, as lists of their indexes. Results are fetched in the format of their
+    variants if these agree on one, otherwise as json, which is converted into the other formats. Since converting
+    is only possible for the results of select queries, other queries are not shared in this case."""
+
+    variants_of_fetches = collections.defaultdict(set)
+    formats_of_fetches = collections.defaultdict(set)
+
+    current_multi_value = query_collection_data_object._current_multi_value
+    variants_count = query_collection_data_object._multi_value_length
+
+    for variant in range(0, variants_count):
+
+        query_collection_data_object.select_multi_value(variant)
+        endpoint = query_collection_data_object.endpoint
+
+        if query_collection_data_object.output_format in harmonized_output_formats:
+            results_format = CSV
+        else:
+            results_format = query_collection_data_object.output_format
+
+        variants_of_fetches[(endpoint, None)].add(variant)
+        formats_of_fetches[(endpoint, None)].add(JSON)
+
+        # queries are read the same way as when executing them, to get the same query text
+        for query_conf_module in query_collection_module.queries:
+
+            query_data_object = Query_data_object(query_collection_data_object)
+            try:
+                query_data_object.query = query_conf_module['query']
+            except (KeyError, ValueError):
+                continue
+
+            variants_of_fetches[(endpoint, query_data_object.query)].add(variant)
+            formats_of_fetches[(endpoint, query_data_object.query)].add(results_format)
+
+    query_collection_data_object.select_multi_value(current_multi_value)
+
+    shared_results_formats = {}
+    variants_groups = [ {variant} for variant in range(0, variants_count) ]
+
+    for fetch, variants in variants_of_fetches.items():
+
+        if len(variants) < 2:
+            continue
+
+        endpoint, query = fetch
+        if len(formats_of_fetches[fetch]) == 1:
+            shared_results_formats[fetch] = formats_of_fetches[fetch].pop()
+        elif get_query_for_count(query) is not None:
+            shared_results_formats[fetch] = JSON
+        else:
+            continue
+
+        # The count of all triples is shared only by the variants running in the same process. Since every process can
+        # count them itself, sharing it doesn't make its variants run in the same process.
+        if query is None:
+            continue
+
+        # merge the groups of all variants sharing this fetch
+        variants_group = set(variants)
+        variants_groups_remaining = []
+        for other_variants_group in variants_groups:
+            if variants_group & other_variants_group:
+                variants_group |= other_variants_group
+            else:
+                variants_groups_remaining.append(other_variants_group)
+        variants_groups = variants_groups_remaining + [variants_group]
+
+    queries_shared_count = len([ fetch for fetch in shared_results_formats if fetch[1] is not None ])
+    if queries_shared_count > 0:
+        message = "Sharing the results of " + str(queries_shared_count) + " queries between variants"
+        logging.info(message)
+        print(message)
+
+    return shared_results_formats, sorted([ sorted(variants_group) for variants_group in variants_groups ])
+
+
+def read_query_collection_data_input(query_collection_module, query_collection_filename, timestamp_start=None):
+    """Reads input from query collection file and convert into usable data structure available throughout the entire program execution.
+    The timestamp of the start of the run is taken, unless given (by the run the variants of which are read)."""
 
     # Since when they are accessed the current multi_value variable affects the read-out
     # in such a way that only the current value and not the whole list of values is returned
@@ -145,7 +402,9 @@ def read_query_collection_data_input(query_collection_module, query_collection_f
 
     query_collection_data_object.query_collection_module = query_collection_module
     query_collection_data_object.query_collection_filename = query_collection_filename
-    query_collection_data_object.timestamp_start = time.strftime('%y%m%d_%H%M%S')
+    if timestamp_start is None:
+        timestamp_start = time.strftime('%y%m%d_%H%M%S')
+    query_collection_data_object.timestamp_start = timestamp_start
     message = \
         "\n\n################################\n" + \
         "Reading query collection file: " + query_collection_filename + "\n" + \
@@ -225,6 +484,11 @@ def read_query_collection_data_input(query_collection_module, query_collection_f
     try:
         query_collection_data_object.cooldown_between_queries = query_collection_module.cooldown_between_queries
         logging.info("cooldown_between_queries: " + str(query_collection_data_object._cooldown_between_queries))
+        if query_collection_data_object._cooldown_between_queries not in (0, [0]):
+            message = "WARNING: cooldown_between_queries is deprecated, as the rate of requests is limited adaptively " + \
+                "now (see endpoint_rate_limit and google_sheets_rate_limit)."
+            logging.warning(message)
+            print(message)
     except AttributeError:
         message = "Did not find cooldown_between_queries in query collection file; assuming zero instead."
         logging.info(message)
@@ -258,6 +522,308 @@ def read_query_collection_data_input(query_collection_module, query_collection_f
         query_collection_data_object.count_the_results = True
 
 
+    # max_parallel_queries
+
+    logging.info("Reading max_parallel_queries")
+    try:
+        query_collection_data_object.max_parallel_queries = query_collection_module.max_parallel_queries
+        logging.info("max_parallel_queries: " + str(query_collection_data_object._max_parallel_queries))
+    except AttributeError:
+        message = "Did not find max_parallel_queries in query collection file; executing queries one after another."
+        logging.info(message)
+        print(message)
+        query_collection_data_object.max_parallel_queries = 1
+
+
+    # endpoint_pool_size
+
+    logging.info("Reading endpoint_pool_size")
+    try:
+        query_collection_data_object.endpoint_pool_size = query_collection_module.endpoint_pool_size
+        logging.info("endpoint_pool_size: " + str(query_collection_data_object._endpoint_pool_size))
+    except AttributeError:
+        message = "Did not find endpoint_pool_size in query collection file; using max_parallel_queries * max_parallel_pages instead."
+        logging.info(message)
+        print(message)
+        query_collection_data_object.endpoint_pool_size = None
+
+
+    # endpoint_idle_timeout
+
+    logging.info("Reading endpoint_idle_timeout")
+    try:
+        query_collection_data_object.endpoint_idle_timeout = query_collection_module.endpoint_idle_timeout
+        logging.info("endpoint_idle_timeout: " + str(query_collection_data_object._endpoint_idle_timeout))
+    except AttributeError:
+        message = "Did not find endpoint_idle_timeout in query collection file; assuming 30 seconds instead."
+        logging.info(message)
+        print(message)
+        query_collection_data_object.endpoint_idle_timeout = 30
+
+
+    # endpoint_timeout
+
+    logging.info("Reading endpoint_timeout")
+    try:
+        query_collection_data_object.endpoint_timeout = query_collection_module.endpoint_timeout
+        logging.info("endpoint_timeout: " + str(query_collection_data_object._endpoint_timeout))
+    except AttributeError:
+        message = "Did not find endpoint_timeout in query collection file; waiting for the endpoint without a timeout."
+        logging.info(message)
+        print(message)
+        query_collection_data_object.endpoint_timeout = None
+
+
+    # cache_ttl
+
+    logging.info("Reading cache_ttl")
+    try:
+        query_collection_data_object.cache_ttl = query_collection_module.cache_ttl
+        logging.info("cache_ttl: " + str(query_collection_data_object._cache_ttl))
+    except AttributeError:
+        message = "Did not find cache_ttl in query collection file; not caching any results."
+        logging.info(message)
+        print(message)
+        query_collection_data_object.cache_ttl = 0
+
+
+    # cache_folder
+
+    logging.info("Reading cache_folder")
+    try:
+        query_collection_data_object.cache_folder = query_collection_module.cache_folder
+        logging.info("cache_folder: " + str(query_collection_data_object._cache_folder))
+    except AttributeError:
+        logging.info("Did not find cache_folder in query collection file; using 'SparqLaborer_cache' instead.")
+        query_collection_data_object.cache_folder = "SparqLaborer_cache"
+
+
+    # cache_max_size
+
+    logging.info("Reading cache_max_size")
+    try:
+        query_collection_data_object.cache_max_size = query_collection_module.cache_max_size
+        logging.info("cache_max_size: " + str(query_collection_data_object._cache_max_size))
+    except AttributeError:
+        logging.info("Did not find cache_max_size in query collection file; assuming 1024 megabytes instead.")
+        query_collection_data_object.cache_max_size = 1024
+
+
+    # stream_results
+
+    logging.info("Reading stream_results")
+    try:
+        query_collection_data_object.stream_results = query_collection_module.stream_results
+        logging.info("stream_results: " + str(query_collection_data_object._stream_results))
+    except AttributeError:
+        message = "Did not find stream_results in query collection file; assuming False instead."
+        logging.info(message)
+        print(message)
+        query_collection_data_object.stream_results = False
+
+
+    # stream_buffer_size
+
+    logging.info("Reading stream_buffer_size")
+    try:
+        query_collection_data_object.stream_buffer_size = query_collection_module.stream_buffer_size
+        logging.info("stream_buffer_size: " + str(query_collection_data_object._stream_buffer_size))
+    except AttributeError:
+        logging.info("Did not find stream_buffer_size in query collection file; assuming 1024 kilobytes instead.")
+        query_collection_data_object.stream_buffer_size = 1024
+
+
+    # max_parallel_pages
+
+    logging.info("Reading max_parallel_pages")
+    try:
+        query_collection_data_object.max_parallel_pages = query_collection_module.max_parallel_pages
+        logging.info("max_parallel_pages: " + str(query_collection_data_object._max_parallel_pages))
+    except AttributeError:
+        message = "Did not find max_parallel_pages in query collection file; using 1 instead."
+        logging.info(message)
+        print(message)
+        query_collection_data_object.max_parallel_pages = 1
+
+
+    # page_retries
+
+    logging.info("Reading page_retries")
+    try:
+        query_collection_data_object.page_retries = query_collection_module.page_retries
+        logging.info("page_retries: " + str(query_collection_data_object._page_retries))
+    except AttributeError:
+        message = "Did not find page_retries in query collection file; using 2 instead."
+        logging.info(message)
+        print(message)
+        query_collection_data_object.page_retries = 2
+
+
+    # endpoint_max_rows
+
+    logging.info("Reading endpoint_max_rows")
+    try:
+        query_collection_data_object.endpoint_max_rows = query_collection_module.endpoint_max_rows
+        logging.info("endpoint_max_rows: " + str(query_collection_data_object._endpoint_max_rows))
+    except AttributeError:
+        logging.info("No endpoint_max_rows found; ignoring.")
+        query_collection_data_object.endpoint_max_rows = None
+
+
+    # google_flush_requests
+
+    logging.info("Reading google_flush_requests")
+    try:
+        query_collection_data_object.google_flush_requests = query_collection_module.google_flush_requests
+        logging.info("google_flush_requests: " + str(query_collection_data_object._google_flush_requests))
+    except AttributeError:
+        logging.info("Did not find google_flush_requests in query collection file; using 100 instead.")
+        query_collection_data_object.google_flush_requests = 100
+
+
+    # google_flush_cells
+
+    logging.info("Reading google_flush_cells")
+    try:
+        query_collection_data_object.google_flush_cells = query_collection_module.google_flush_cells
+        logging.info("google_flush_cells: " + str(query_collection_data_object._google_flush_cells))
+    except AttributeError:
+        logging.info("Did not find google_flush_cells in query collection file; using 50000 instead.")
+        query_collection_data_object.google_flush_cells = 50000
+
+
+    # max_parallel_uploads
+
+    logging.info("Reading max_parallel_uploads")
+    try:
+        query_collection_data_object.max_parallel_uploads = query_collection_module.max_parallel_uploads
+        logging.info("max_parallel_uploads: " + str(query_collection_data_object._max_parallel_uploads))
+    except AttributeError:
+        logging.info("Did not find max_parallel_uploads in query collection file; using 4 instead.")
+        query_collection_data_object.max_parallel_uploads = 4
+
+
+    # upload_retries
+
+    logging.info("Reading upload_retries")
+    try:
+        query_collection_data_object.upload_retries = query_collection_module.upload_retries
+        logging.info("upload_retries: " + str(query_collection_data_object._upload_retries))
+    except AttributeError:
+        logging.info("Did not find upload_retries in query collection file; using 2 instead.")
+        query_collection_data_object.upload_retries = 2
+
+
+    # endpoint_rate_limit
+
+    logging.info("Reading endpoint_rate_limit")
+    try:
+        query_collection_data_object.endpoint_rate_limit = query_collection_module.endpoint_rate_limit
+        logging.info("endpoint_rate_limit: " + str(query_collection_data_object._endpoint_rate_limit))
+    except AttributeError:
+        logging.info("No endpoint_rate_limit found; not limiting the rate of requests to the endpoint.")
+        query_collection_data_object.endpoint_rate_limit = None
+
+
+    # google_sheets_rate_limit
+
+    logging.info("Reading google_sheets_rate_limit")
+    try:
+        query_collection_data_object.google_sheets_rate_limit = query_collection_module.google_sheets_rate_limit
+        logging.info("google_sheets_rate_limit: " + str(query_collection_data_object._google_sheets_rate_limit))
+    except AttributeError:
+        logging.info("Did not find google_sheets_rate_limit in query collection file; using 1 instead.")
+        query_collection_data_object.google_sheets_rate_limit = 1
+
+
+    # google_drive_rate_limit
+
+    logging.info("Reading google_drive_rate_limit")
+    try:
+        query_collection_data_object.google_drive_rate_limit = query_collection_module.google_drive_rate_limit
+        logging.info("google_drive_rate_limit: " + str(query_collection_data_object._google_drive_rate_limit))
+    except AttributeError:
+        logging.info("Did not find google_drive_rate_limit in query collection file; using 10 instead.")
+        query_collection_data_object.google_drive_rate_limit = 10
+
+
+    # max_retries
+
+    logging.info("Reading max_retries")
+    try:
+        query_collection_data_object.max_retries = query_collection_module.max_retries
+        logging.info("max_retries: " + str(query_collection_data_object._max_retries))
+    except AttributeError:
+        logging.info("Did not find max_retries in query collection file; using 3 instead.")
+        query_collection_data_object.max_retries = 3
+
+
+    # retry_backoff
+
+    logging.info("Reading retry_backoff")
+    try:
+        query_collection_data_object.retry_backoff = query_collection_module.retry_backoff
+        logging.info("retry_backoff: " + str(query_collection_data_object._retry_backoff))
+    except AttributeError:
+        logging.info("Did not find retry_backoff in query collection file; using 1 instead.")
+        query_collection_data_object.retry_backoff = 1
+
+
+    # retry_max_backoff
+
+    logging.info("Reading retry_max_backoff")
+    try:
+        query_collection_data_object.retry_max_backoff = query_collection_module.retry_max_backoff
+        logging.info("retry_max_backoff: " + str(query_collection_data_object._retry_max_backoff))
+    except AttributeError:
+        logging.info("Did not find retry_max_backoff in query collection file; using 60 instead.")
+        query_collection_data_object.retry_max_backoff = 60
+
+
+    # max_parallel_variants
+
+    logging.info("Reading max_parallel_variants")
+    try:
+        query_collection_data_object.max_parallel_variants = query_collection_module.max_parallel_variants
+        logging.info("max_parallel_variants: " + str(query_collection_data_object._max_parallel_variants))
+    except AttributeError:
+        logging.info("Did not find max_parallel_variants in query collection file; using 1 instead.")
+        query_collection_data_object.max_parallel_variants = 1
+
+
+    # output_compression
+
+    logging.info("Reading output_compression")
+    try:
+        query_collection_data_object.output_compression = query_collection_module.output_compression
+        logging.info("output_compression: " + str(query_collection_data_object._output_compression))
+    except AttributeError:
+        logging.info("Did not find output_compression in query collection file; using None instead.")
+        query_collection_data_object.output_compression = None
+
+
+    # output_compression_level
+
+    logging.info("Reading output_compression_level")
+    try:
+        query_collection_data_object.output_compression_level = query_collection_module.output_compression_level
+        logging.info("output_compression_level: " + str(query_collection_data_object._output_compression_level))
+    except AttributeError:
+        logging.info("Did not find output_compression_level in query collection file; using None instead.")
+        query_collection_data_object.output_compression_level = None
+
+
+    # output_compression_threads
+
+    logging.info("Reading output_compression_threads")
+    try:
+        query_collection_data_object.output_compression_threads = query_collection_module.output_compression_threads
+        logging.info("output_compression_threads: " + str(query_collection_data_object._output_compression_threads))
+    except AttributeError:
+        logging.info("Did not find output_compression_threads in query collection file; using 1 instead.")
+        query_collection_data_object.output_compression_threads = 1
+
+
     # endpoint
 
     logging.info("Reading endpoints")
@@ -312,6 +878,28 @@ def read_query_data_input(query_conf_module, query_collection_data_object):
         sys.exit(message)
 
 
+    # page_size
+
+    logging.info("Reading page_size of query")
+    try:
+        query_data_object.page_size = query_conf_module['page_size']
+        logging.info("page_size: " + str(query_data_object._page_size))
+    except KeyError:
+        logging.info("No page_size for query found; ignoring.")
+        query_data_object.page_size = None
+
+
+    # indexes
+
+    logging.info("Reading indexes of query")
+    try:
+        query_data_object.indexes = query_conf_module['indexes']
+        logging.info("indexes: " + str(query_data_object._indexes))
+    except KeyError:
+        logging.info("No indexes for query found; ignoring.")
+        query_data_object.indexes = None
+
+
     # custom_data_container
 
     logging.info("Reading custom_data_container of query")
@@ -361,11 +949,33 @@ def execute_queries(query_collection_data_object):
             logging.info(message)
             print(message)
 
-            results, execution_duration = execute_query(
-                "SELECT COUNT(*) WHERE {[][][]}", query_collection_data_object.endpoint, JSON)
+            # the count of all triples might have been fetched already by another variant, along with the counts
+            # of its batch
+            shared_fetch = (query_collection_data_object.endpoint, None)
+            shared_result = query_collection_data_object.shared_results.get(shared_fetch)
+
+            # if batched, the results of all queries are counted with the same query as all triples
+            count_triples_in_endpoint = None
+            if shared_result is not None:
+                count_triples_in_endpoint = shared_result['count_triples_in_endpoint']
+                results_lines_counts_batched.update(shared_result['results_lines_counts_batched'])
+            elif query_collection_data_object.count_the_results == "batched":
+                count_triples_in_endpoint = execute_batched_count()
+
+            if count_triples_in_endpoint is None:
+                results, execution_duration, timestamp_cached = execute_query(
+                    "SELECT (COUNT(*) AS ?count) WHERE {[][][]}", JSON)
+                results = json.loads(results.decode("utf-8"))
+                count_triples_in_endpoint = results["results"]["bindings"][0]["count"]["value"], timestamp_cached
+
+            if shared_result is None and shared_fetch in query_collection_data_object.shared_results_formats:
+                query_collection_data_object.shared_results[shared_fetch] = {
+                    'count_triples_in_endpoint': count_triples_in_endpoint,
+                    'results_lines_counts_batched': dict(results_lines_counts_batched)
+                }
 
-            query_collection_data_object.count_triples_in_endpoint = \
-                results["results"]["bindings"][0]["callret-0"]["value"]
+            query_collection_data_object.count_triples_in_endpoint, \
+                query_collection_data_object.count_triples_in_endpoint_timestamp_cached = count_triples_in_endpoint
 
             message = "count_triples_in_endpoint: " + query_collection_data_object.count_triples_in_endpoint
             logging.info(message)
@@ -389,6 +999,7 @@ def execute_queries(query_collection_data_object):
 
         query_id = 0
         query_collection_data_object.queries = []
+        max_parallel_queries = query_collection_data_object.max_parallel_queries
 
 
         # Iterate over queries list in the originating python module (not over any list from a parsed data object!)
@@ -397,1559 +1008,5905 @@ def execute_queries(query_collection_data_object):
         # , i.e. the "query collection file" written by end-users, SparqLaborer must iterate over the list object
         # within the according python module, contrary to reading this list into a data object and handling it all
         # in SparqLaborer (where meta_functions could not write to). Hence this iteration goes over the original list object.
+        #
+        # Queries are dispatched to a pool of worker threads, at most 'max_parallel_queries' of them being executed
+        # at the same time. Their results are however always written in the original order of the queries list,
+        # so that summaries look the same regardless of how many queries are executed in parallel. The list is
+        # indexed anew on every refill of the pool, so that queries appended by meta_functions are picked up too.
+        # Since a meta_function may change the entries after its query, these are only read once it was executed,
+        # i.e. the pool is not refilled while a query with a meta_function is pending.
 
-        for query_conf_module in query_collection_data_object.query_collection_module.queries:
+        queries_list = query_collection_data_object.query_collection_module.queries
+        queries_list_index = 0
+        queries_pending = collections.deque()
 
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_parallel_queries) as executor:
 
-            # read in current query, constuct data object from it.
-            query_data_object = read_query_data_input(query_conf_module, query_collection_data_object)
-            query_collection_data_object.queries.append(query_data_object)
+            while queries_list_index < len(queries_list) or len(queries_pending) > 0:
 
 
-            # read information from data object used for logging and printout
+                # refill the pool of executing queries
 
-            query_id += 1
-            query_data_object.id = query_id
+                while len(queries_pending) < max_parallel_queries and queries_list_index < len(queries_list) and \
+                        not any(query_pending.custom_meta_function is not None for query_pending, _ in queries_pending):
 
-            message = \
-                "\n\n################################\nExecute\n" + \
-                "\nid: " + str(query_id) + \
-                "\nTitle: " + query_data_object.title + \
-                "\nDescription: " + query_data_object.description + \
-                "\nQuery:\n" + query_data_object.query
-            logging.info(message)
-            print(message)
+                    query_conf_module = queries_list[queries_list_index]
+                    queries_list_index += 1
 
 
-            # execute query and query for counting the results
+                    # read in current query, constuct data object from it
+                    query_data_object = read_query_data_input(query_conf_module, query_collection_data_object)
 
-            startTime = time.time()
+                    query_id += 1
+                    query_data_object.id = query_id
 
-            try:
 
-                # execute query
+                    # skip queries written completely already, if an interrupted run is resumed
 
-                if query_collection_data_object.output_format == "XLSX":
-                    output_format = CSV
-                else:
-                    output_format = query_collection_data_object.output_format
+                    if query_collection_data_object.output_writer.is_query_written(query_data_object):
+                        message = "\nSkipping query with id " + str(query_id) + ", written already by the interrupted run"
+                        logging.info(message)
+                        print(message)
+                        continue
 
-                results, execution_duration = execute_query(
-                    query_data_object.query, query_collection_data_object.endpoint, output_format )
-                query_data_object.results_raw = results
-                query_data_object.results_execution_duration = execution_duration
 
+                    # add it to the collection_data_object, and read information from it used for logging and printout
 
-                # execute query for counting results (if needs to be done)
+                    query_collection_data_object.queries.append(query_data_object)
 
-                query_data_object.query_for_count = None
-                query_data_object.results_lines_count = None
+                    message = \
+                        "\n\n################################\nExecute\n" + \
+                        "\nid: " + str(query_id) + \
+                        "\nTitle: " + query_data_object.title + \
+                        "\nDescription: " + query_data_object.description + \
+                        "\nQuery:\n" + query_data_object.query
+                    logging.info(message)
+                    print(message)
 
-                if query_collection_data_object.count_the_results:
+                    queries_pending.append(
+                        (query_data_object, executor.submit(execute_query_data_object, query_data_object)) )
 
-                    # For this, search for the first select statement, and replace it with
-                    # select count(*) where ... and add a '}' to the end, to make the original select
-                    # a sub-query
-                    #
-                    # This requires a non-standard regex module to use variable length negative look behind
-                    # which are needed to detect only 'select' statements, where there are no '#'
-                    # before, which would make it a comment and thus not necesseray to replace
 
-                    logging.info("Creating query for counting results.")
+                # wait for the next query in order (if any, the remaining ones might all have been skipped)
 
-                    pattern = regex.compile(r"(?<!#.*)select", regex.IGNORECASE | regex.MULTILINE)
-                    query_for_count = pattern.sub(
-                        "SELECT COUNT(*) WHERE { \nSELECT",
-                        query_data_object.query,
-                        1)
-                    query_for_count += "\n}"
+                if len(queries_pending) == 0:
+                    continue
 
-                    query_data_object.query_for_count = query_for_count
+                query_data_object, future = queries_pending.popleft()
+                future.result()
 
-                    results_lines_count, execution_duration = execute_query(
-                        query_for_count, query_collection_data_object.endpoint, JSON )
+                message = "\nEXECUTION FINISHED\nid: " + str(query_data_object.id) + \
+                          "\nElapsed time: " + str(query_data_object.results_execution_duration)
+                logging.info(message)
+                print(message)
 
-                    results_lines_count = results_lines_count["results"]["bindings"][0]["callret-0"]["value"]
-                    query_data_object.results_lines_count = results_lines_count
-                    logging.info("results_lines_count: " + query_data_object.results_lines_count + "\n")
 
+                # write results
 
-            except SPARQLExceptions.SPARQLWrapperException as ex:
-                message = "EXCEPTION OCCURED WHEN EXECUTING QUERY: " + str(ex) + "\n Continue with execution of next query."
-                print(message)
-                logging.error(message)
-                query_data_object.error_message = str(ex)
-                query_data_object.results_execution_duration = time.time() - startTime
-                query_data_object.results_raw = None
+                # (the results first, so that the summary can tell the size of their file)
 
+                query_collection_data_object.output_writer.write_query_result(query_data_object)
 
-            message = "\nEXECUTION FINISHED\nElapsed time: " + str(query_data_object.results_execution_duration)
-            logging.info(message)
-            print(message)
+                # In the smart mode, streamed results are counted by the rows the writers read. Writers copying the
+                # raw results don't read them, in which case the rows are read for counting only.
+                if query_collection_data_object.count_the_results == "smart" and \
+                        query_data_object.results_streamed and query_data_object.results_lines_count is None:
+                    if query_data_object.results_rows_read is None:
+                        query_data_object.results_raw.seek(0)
+                        query_data_object.results_rows_read = sum(1 for row in iterate_harmonized_rows(
+                            query_data_object.results_raw, query_data_object.results_format)) - 1
+                    count_results_smartly(query_data_object, query_data_object.results_rows_read)
 
+                query_collection_data_object.output_writer.write_query_summary(query_data_object)
 
-            # harmonize results for other uses later
 
-            logging.info("harmonizing results")
+                # run custom meta function (if present)
 
-            if query_data_object.results_raw is None:
-                query_data_object.results_matrix = [[query_data_object.error_message]]
+                query_data_object.call_custom_meta_function()
 
-            else:
-                query_data_object.results_matrix = get_harmonized_result(
-                    query_data_object.results_raw, query_collection_data_object.output_format)
 
-            logging.info("Done with harmonizing results")
+                # record the query as written in the journal of the run, so that it's skipped if the run is resumed
 
+                query_collection_data_object.output_writer.write_journal(query_data_object)
 
-            # write results
 
-            query_collection_data_object.output_writer.write_query_summary(query_data_object)
-            query_collection_data_object.output_writer.write_query_result(query_data_object)
+                # streamed results are only available until they are written, release their temporary file
 
+                if query_data_object.results_streamed:
+                    query_data_object.results_raw.close()
 
-            # run custom meta function (if present)
 
-            query_data_object.call_custom_meta_function()
+                # cooldown between query-runs to prevent google api exhaustion
 
+                cooldown = query_collection_data_object.cooldown_between_queries
+                number_queries =  len(queries_list)
+                if cooldown > 0 and query_data_object.id < number_queries:
 
-            # cooldown between query-runs to prevent google api exhaustion
+                    print("\nSleep for " + str(query_collection_data_object.cooldown_between_queries) + " seconds.")
+                    time.sleep(query_collection_data_object.cooldown_between_queries)
 
-            cooldown = query_collection_data_object.cooldown_between_queries
-            number_queries =  len(query_collection_data_object.query_collection_module.queries)
-            if cooldown > 0 and query_id < number_queries:
 
-                print("\nSleep for " + str(query_collection_data_object.cooldown_between_queries) + " seconds.")
-                time.sleep(query_collection_data_object.cooldown_between_queries)
 
+    def execute_query_data_object(query_data_object):
+        """Executes the query of a query data object (and its query for counting the results, if needed) and
+        harmonizes its results. Is run within the worker threads, thus must not write to any output destination."""
 
-            # done with executing query; add its data_object to the collection_data_object
+        # execute query and query for counting the results
 
-            query_collection_data_object.queries.append(query_data_object)
+        startTime = time.time()
+        count_future = None
 
+        try:
 
+            # execute query
 
-    def execute_query( query_string, endpoint, results_format ):
-        """executes a query provided as string and returns the results in the asked-for format.
-        Also returns duration of execution"""
+            if query_collection_data_object.output_format in harmonized_output_formats:
+                output_format = CSV
+            else:
+                output_format = query_collection_data_object.output_format
+
+            # Results of select queries fetched in pages are always streamed, since they are merged into a temporary
+            # file anyway, which is spooled to disk for large results (see execute_query_in_pages).
+            query_data_object.results_format = output_format
+            query_data_object.results_streamed = output_format in streamable_formats and (
+                query_collection_data_object.stream_results or
+                (query_data_object.page_size is not None and
+                 get_query_for_page(query_data_object.query, [], 0, 0) is not None))
+
+            query_data_object.results_pages_durations = None
+            query_data_object.results_pages_lines_count = None
+            query_data_object.query_for_count = None
+            query_data_object.results_lines_count = None
+            query_data_object.results_retries = []
+
+            # Results shared between variants might have been fetched already by another variant. Otherwise they are
+            # fetched in the format planned for sharing them, kept as binary file, and converted for this variant.
+            shared_fetch = (query_collection_data_object.endpoint, query_data_object.query)
+            shared_format = query_collection_data_object.shared_results_formats.get(shared_fetch)
+            shared_result = query_collection_data_object.shared_results.get(shared_fetch)
+            shared_results_raw = None
+
+            if shared_format is not None and shared_result is not None:
+                use_shared_result(query_data_object, shared_result)
+
+            # The query for counting the results (if needs to be done) is executed at the same time as the query,
+            # unless the results were counted already within the batch of all queries. In the smart mode it's only
+            # executed once the fetched results turn out to be possibly incomplete (see count_results_smartly).
+            if query_data_object.results_lines_count is not None:
+                pass
+            elif query_collection_data_object.count_the_results == "batched" and \
+                    query_data_object.query in results_lines_counts_batched:
+                query_data_object.query_for_count, query_data_object.results_lines_count = \
+                    results_lines_counts_batched[query_data_object.query]
+            elif query_collection_data_object.count_the_results in (True, "batched") and \
+                    not (shared_result is not None and shared_result['results_raw'] is None):
+                count_future = count_executor.submit(
+                    execute_query_for_count, query_data_object.query, query_data_object.results_retries)
+
+            if shared_format is None or shared_result is None:
+
+                if shared_format is None:
+                    fetch_format = output_format
+                    fetch_streamed = query_data_object.results_streamed
+                else:
+                    fetch_format = shared_format
+                    fetch_streamed = True
 
-        logging.info("Executing query: " + query_string)
+                if query_data_object.page_size is None:
+                    results, execution_duration, timestamp_cached = execute_query(
+                        query_data_object.query, fetch_format, fetch_streamed,
+                        retries=query_data_object.results_retries)
+                else:
+                    results, execution_duration, timestamp_cached = execute_query_in_pages(
+                        query_data_object, fetch_format, fetch_streamed)
 
-        # Currently onyl accepts formats: CSV, TSV, XML, JSON
-        # Other formats such as rdf-xml, turtle, and n-triples could be possible with a bit of tweaking.
-        # Problems encountered so far are summarized here:
-        # https://github.com/RDFLib/sparqlwrapper/issues/107
-        sparql_wrapper = SPARQLWrapper(endpoint)
-        sparql_wrapper.setQuery( query_string )
-        sparql_wrapper.setReturnFormat( results_format )
+                if shared_format is not None:
+                    shared_results_raw = results
+                    results = convert_shared_results(
+                        shared_results_raw, shared_format, output_format, query_data_object.results_streamed,
+                        query_collection_data_object.stream_buffer_size * 1024)
 
-        startTime = time.time()
-        results = sparql_wrapper.query().convert()
-        execution_duration = time.time() - startTime
+                query_data_object.results_raw = results
+                query_data_object.results_execution_duration = execution_duration
+                query_data_object.results_timestamp_cached = timestamp_cached
 
-        return results, execution_duration
 
+        except SPARQLExceptions.SPARQLWrapperException as ex:
+            message = "EXCEPTION OCCURED WHEN EXECUTING QUERY: " + str(ex) + "\n Continue with execution of next query."
+            print(message)
+            logging.error(message)
+            query_data_object.error_message = str(ex)
+            query_data_object.results_execution_duration = time.time() - startTime
+            query_data_object.results_timestamp_cached = None
+            query_data_object.results_streamed = False
+            query_data_object.results_raw = None
 
-    def get_harmonized_result(result, format):
-        """Transforms the result data from its varying data formats into a two-dimensional list, used for writing summaries or into xlsx / google sheets files"""
 
-        def get_harmonized_rows_from_keyed_rows(result_sample_keyed):
-            """Some output formats require an intermediate step where the individual result rows are initially indexed by keys and their layout might change from row to row. Thus this methods iterate over each key-value row and transforms it into a regular two-dimensional list, where every column is identifiable by the same column-key"""
+        # wait for the query for counting results, whose failure leaves the fetched results as they are. Should the
+        # query itself have failed, its results are not counted.
 
-            # transform the result_sample_keyed into a regular two-dimensional list used for later inserting into xlsx or google sheets
-            harmonized_rows = []
-            harmonized_rows.append(result_sample_keyed[0])
+        if count_future is not None and query_data_object.results_raw is None:
+            count_future.cancel()
 
-            for y in range(1, len(result_sample_keyed)):
+        elif count_future is not None:
 
-                sample_row = []
-                for x in range(0, len(harmonized_rows[0])):
-                    key = harmonized_rows[0][x]
-                    sample_row.append(result_sample_keyed[y][key])
+            try:
+                query_data_object.query_for_count, query_data_object.results_lines_count = count_future.result()
 
-                harmonized_rows.append(sample_row)
+            except SPARQLExceptions.SPARQLWrapperException as ex:
+                message = "EXCEPTION OCCURED WHEN COUNTING RESULTS OF QUERY: " + str(ex)
+                print(message)
+                logging.error(message)
 
-            return harmonized_rows
 
+        # harmonize results for other uses later
 
-        harmonized_result = []
+        logging.info("harmonizing results")
 
-        if result is None:
-            return None
-        else:
+        if query_data_object.results_raw is None:
+            query_data_object.results_matrix = Results_matrix([[query_data_object.error_message]])
 
+        elif query_data_object.results_streamed:
 
-            # CSV, TSV, XLSX (since XLSX means CSV is internally used for querying the endpoint)
+            # Streamed results are not harmonized as a whole, but read row by row by the writers later on.
+            # Only the header and the sample rows for the summary and for inferring the column types are kept
+            # in the results_matrix.
+            sample_size = max(
+                query_collection_data_object.summary_sample_limit,
+                Results_matrix.type_inference_sample_size) + 1
+            query_data_object.results_raw.seek(0)
+            rows = iterate_harmonized_rows(query_data_object.results_raw, query_data_object.results_format)
+            query_data_object.results_matrix = get_typed_results_matrix(itertools.islice(rows, sample_size))
+            rows.close()
 
-            if format == CSV or format == TSV or format == "XLSX":
+        else:
+            query_data_object.results_matrix = get_harmonized_result(
+                query_data_object.results_raw, query_data_object.results_format)
 
-                result = result.decode('utf-8').splitlines()
-                harmonized_result = []
-                valid_row_length = float("inf")
+        query_data_object.results_column_types = query_data_object.results_matrix.column_types
 
-                if format == TSV:
-                    reader = csv.reader(result, delimiter="\t")
-                else:
-                    reader = csv.reader(result)
+        logging.info("Done with harmonizing results")
 
-                for row in reader:
 
-                    row_harmonized = []
+        # In the smart mode, results fetched in pages are counted by their pages, all others by their lines fetched
+        # (see count_results_smartly). Streamed results are only counted while they are written, thus later on.
 
-                    for column in row:
+        if query_collection_data_object.count_the_results == "smart" and query_data_object.results_raw is not None and \
+                query_data_object.results_lines_count is None:
 
-                        # check if value could be integer, if so change type
-                        try:
-                            column = int(column)
-                        except ValueError:
-                            pass
+            if query_data_object.results_pages_lines_count is not None:
+                query_data_object.results_lines_count = str(query_data_object.results_pages_lines_count)
+                logging.info("results_lines_count (as fetched in pages): " + query_data_object.results_lines_count + "\n")
 
-                        row_harmonized.append(column)
+            elif not query_data_object.results_streamed:
+                count_results_smartly(query_data_object, len(query_data_object.results_matrix) - 1)
 
-                    harmonized_result.append(row_harmonized)
 
-                    # check validity of results
-                    current_row_length = len(row)
-                    if valid_row_length != float("inf") and valid_row_length != current_row_length:
-                        message = "\nERROR: INVALID ROW LENGTH! " + str(row) + " has length " + str(current_row_length) + ", while valid length is " + str(valid_row_length)
-                        logging.error(message)
-                        sys.exit(message)
-                    valid_row_length = current_row_length
+        # keep the results for the other variants sharing them (unless a query with the same text kept them already)
 
+        if shared_format is not None and shared_result is None:
 
-            # JSON
+            shared_result = {
+                'results_raw': shared_results_raw,
+                'results_format': shared_format,
+                'error_message': query_data_object.error_message if query_data_object.results_raw is None else None,
+                'results_execution_duration': query_data_object.results_execution_duration,
+                'results_timestamp_cached': query_data_object.results_timestamp_cached,
+                'results_pages_durations': query_data_object.results_pages_durations,
+                'results_pages_lines_count': query_data_object.results_pages_lines_count,
+                'query_for_count': query_data_object.query_for_count,
+                'results_lines_count': query_data_object.results_lines_count,
+            }
 
-            elif format == JSON:
+            with query_collection_data_object.shared_results_lock:
+                if shared_fetch not in query_collection_data_object.shared_results:
+                    query_collection_data_object.shared_results[shared_fetch] = shared_result
+                elif shared_results_raw is not None:
+                    shared_results_raw.close()
 
-                # construct list of dictionaries (to preserve the key-value pairing of individual row-results)
 
-                result_keyed = []
+    def use_shared_result(query_data_object, shared_result):
+        """Takes over the results fetched by another variant sharing them, converted into the format of this variant"""
 
-                # get keys and save in first row of result_keyed
-                keys = []
-                for key in result.results_raw['bindings'][0]:
-                    keys.append(key)
-                result_keyed.append(keys)
+        logging.info("Using results shared with another variant")
 
-                # go through the json - rows and extract key-value pairs from each, insert them into result_keyed
-                valid_row_length = len(keys)
-                for y in range(0, len(result.results_raw['bindings'])):
-                    dict_tmp = {}
+        query_data_object.results_execution_duration = shared_result['results_execution_duration']
+        query_data_object.results_timestamp_cached = shared_result['results_timestamp_cached']
 
-                    row = result.results_raw['bindings'][y]
+        if shared_result['results_raw'] is None:
+            message = "EXCEPTION OCCURED WHEN EXECUTING QUERY (for another variant): " + shared_result['error_message']
+            print(message)
+            logging.error(message)
+            query_data_object.error_message = shared_result['error_message']
+            query_data_object.results_streamed = False
+            query_data_object.results_raw = None
+            return
 
-                    for key in row:
-                        column = row[key]['value']
+        # the binary file is read by one thread at a time, should a query with the same text be executed in parallel
+        with query_collection_data_object.shared_results_lock:
+            query_data_object.results_raw = convert_shared_results(
+                shared_result['results_raw'], shared_result['results_format'], query_data_object.results_format,
+                query_data_object.results_streamed, query_collection_data_object.stream_buffer_size * 1024)
 
-                        # check if value could be integer, if so change type
-                        try:
-                            column = int(column)
-                        except ValueError:
-                            pass
+        query_data_object.results_pages_durations = shared_result['results_pages_durations']
+        query_data_object.results_pages_lines_count = shared_result['results_pages_lines_count']
+        query_data_object.query_for_count = shared_result['query_for_count']
+        query_data_object.results_lines_count = shared_result['results_lines_count']
 
-                        dict_tmp[key] = column
 
-                    # check validity of results
-                    if len(row) != valid_row_length:
-                        message = "\nERROR: INVALID ROW LENGTH! " + str(row) + " has length " + str(len(row)) + ", while valid length is " + str(valid_row_length)
-                        logging.error(message)
-                        sys.exit(message)
+    def count_results_smartly(query_data_object, results_lines_fetched_count):
+        """Counts the results in the smart mode: by the number of lines fetched, unless the endpoint might have cut them
+        off, i.e. if they have as many lines as endpoint_max_rows (or more). Only then the results are counted by the
+        endpoint. Without endpoint_max_rows, the fetched results are always regarded as complete."""
 
-                    result_keyed.append(dict_tmp)
+        endpoint_max_rows = query_collection_data_object.endpoint_max_rows
 
-                harmonized_result = get_harmonized_rows_from_keyed_rows(result_keyed)
+        if endpoint_max_rows is None or results_lines_fetched_count < endpoint_max_rows:
+            query_data_object.results_lines_count = str(results_lines_fetched_count)
+            logging.info("results_lines_count (as fetched): " + query_data_object.results_lines_count + "\n")
+            return
 
+        message = "Fetched " + str(results_lines_fetched_count) + " lines, which the endpoint might have cut off; " + \
+            "counting them by the endpoint."
+        logging.info(message)
+        print(message)
 
-            # XML
+        try:
+            query_data_object.query_for_count, query_data_object.results_lines_count = \
+                execute_query_for_count(query_data_object.query, query_data_object.results_retries)
 
-            elif format == XML:
+        except SPARQLExceptions.SPARQLWrapperException as ex:
+            message = "EXCEPTION OCCURED WHEN COUNTING RESULTS OF QUERY: " + str(ex)
+            print(message)
+            logging.error(message)
 
-                # construct list of dictionaries (to preserve the key-value pairing of individual row-results)
 
-                result_keyed = []
+    def execute_batched_count():
+        """Counts the results of all queries of the collection and all triples in the endpoint with a single query.
+        The counts of the queries are kept in results_lines_counts_batched by their query text, along with the query
+        for counting. Returns the count of all triples and the time it was cached at, or None if counting failed
+        (in which case all queries are counted one by one)."""
 
-                # get keys and save in first row of result_keyed
-                vars = result.getElementsByTagName("head")[0].getElementsByTagName("variable")
-                keys = []
-                for var in vars:
-                    keys.append(var.getAttribute('name'))
-                result_keyed.append(keys)
+        queries = []
+        for query_conf_module in query_collection_data_object.query_collection_module.queries:
 
-                # get results rows
-                results = result.getElementsByTagName("result")
+            # queries are read the same way as when executing them, to get the same query text
+            query_data_object = Query_data_object(query_collection_data_object)
+            try:
+                query_data_object.query = query_conf_module['query']
+                queries.append(query_data_object.query)
+            except (KeyError, ValueError):
+                pass
 
-                # go through the xml results and extract key-value pairs from each, insert them into result_keyed
-                valid_row_length = len(keys)
-                for y in range(0, len(results)):
+        query_for_count, count_variables, count_triples_variable = get_query_for_batched_count(queries)
 
-                    result = results[y]
+        message = "Counting results of " + str(len(queries) - count_variables.count(None)) + \
+            " queries together with all triples"
+        logging.info(message)
+        print(message)
 
-                    dict_tmp = {}
-                    for binding in result.getElementsByTagName("binding"):
-                        # column = binding.childNodes[0].childNodes[0].nodeValue
+        try:
+            results, execution_duration, timestamp_cached = execute_query(query_for_count, JSON)
+            results = json.loads(results.decode("utf-8"))["results"]["bindings"][0]
 
-                        child_node = binding.childNodes[0]
+        except SPARQLExceptions.SPARQLWrapperException as ex:
+            message = "EXCEPTION OCCURED WHEN COUNTING RESULTS OF ALL QUERIES: " + str(ex) + \
+                "\n Counting them one by one instead."
+            print(message)
+            logging.error(message)
+            return None
 
-                        if child_node.localName == "literal" and child_node.childNodes == [] :
-                            column = ""
-                        else:
-                            column = child_node.childNodes[0].nodeValue
+        for query, count_variable in zip(queries, count_variables):
+            if count_variable is not None:
+                results_lines_counts_batched[query] = query_for_count, results[count_variable]["value"]
 
-                        # TODO: Check if this is best practice?
-                        # check if value could be turned into an integer. If so change type, if not nothing happens
-                        try:
-                            column = int(column)
-                        except ValueError:
-                            pass
+        return results[count_triples_variable]["value"], timestamp_cached
 
-                        dict_tmp[binding.getAttribute('name')] = column
 
-                    # check validity of results
-                    if len(dict_tmp) != valid_row_length:
-                        message = "\nERROR: INVALID ROW LENGTH! " + str(dict_tmp) + " has length " + str(len(dict_tmp)) + ", while valid length is " + str(valid_row_length)
-                        logging.error(message)
-                        sys.exit(message)
+    def execute_query_for_count(query, retries=None):
+        """Creates the query for counting the results of a query, executes it and returns both the query for counting
+        and the count of results (both None, if the query is not a select query and thus can't be counted).
+        Is run within the worker threads or the threads for counting."""
 
-                    result_keyed.append(dict_tmp)
+        logging.info("Creating query for counting results.")
 
-                harmonized_result = get_harmonized_rows_from_keyed_rows(result_keyed)
+        query_for_count = get_query_for_count(query)
 
-            return harmonized_result
+        if query_for_count is None:
+            logging.info("Query is not a select query, thus its results are not counted.")
+            return None, None
 
-    return main(query_collection_data_object)
+        query_for_count, count_variable = query_for_count
 
+        results_lines_count, execution_duration, timestamp_cached = execute_query(query_for_count, JSON, retries=retries)
+        results_lines_count = json.loads(results_lines_count.decode("utf-8"))
 
-def create_template():
-    """Creates a template for the query collection file in the relative folder, where the script is executed"""
+        results_lines_count = results_lines_count["results"]["bindings"][0][count_variable]["value"]
+        logging.info("results_lines_count: " + results_lines_count + "\n")
 
-    template = """
+        return query_for_count, results_lines_count
 
 
-# -------------------- OPTIONAL SETTINGS -------------------- 
+    def execute_query( query_string, results_format, stream=False, max_retries=None, retries=None ):
+        """executes a query provided as string and returns the raw results (as bytes) in the asked-for format.
+        Also returns duration of execution, and the time the results were cached at if they were read from the cache.
+        If stream is set, the raw results are not converted but returned as binary file, which was filled
+        incrementally from the response of the endpoint, keeping at most stream_buffer_size bytes in memory.
+        Should the query fail due to a transient error, it is retried up to max_retries times (by default the ones of
+        the retry policy), with a message for each retry appended to retries, if given."""
 
-# title
-# defines the title of the whole set of queries
-# OPTIONAL, if not set, timestamp will be used
-title = \"TEST QUERIES\"
+        # return the cached result if there is a valid one
 
+        result_cache = query_collection_data_object.result_cache
 
-# description
-# defines the textual and human-intended description of the purpose of these queries
-# OPTIONAL, if not set, nothing will be used or displayed
-description = \"This set of queries is used as a template for showcasing a valid query collection file.\"
+        if result_cache is not None:
 
+            cached_result = result_cache.get(
+                query_collection_data_object.endpoint, query_string, results_format, as_file=stream)
 
-# output_destination
-# defines where to save the results, input can be: 
-# * a local path to a folder 
-# * a URL for a google sheets document  
-# * a URL for a google folder
-# NOTE: On windows, folders in a path use backslashes, in such a case it is mandatory to attach a 'r' in front of the quotes, e.g. r\"C:\\Users\\sresch\\..\"
-# In the other cases the 'r' is simply ignored; thus best would be to always leave it there.
-# OPTIONAL, if not set, folder of executed script will be used
-output_destination = r\".\"
+            if cached_result is not None:
 
+                results, execution_duration, timestamp_cached = cached_result
+                logging.info("Using cached results for query: " + query_string)
 
-# output_format
-# defines the format in which the result data shall be saved (currently available: csv, tsv, xml, json, xlsx)
-# OPTIONAL, if not set, csv will be used
-output_format = \"csv\"
+                return results, execution_duration, timestamp_cached
 
+        logging.info("Executing query: " + query_string)
 
-# summary_sample_limit
-# defines how many rows shall be displayed in the summary
-# OPTIONAL, if not set, 5 will be used
-summary_sample_limit = 3
+        # Currently onyl accepts formats: CSV, TSV, XML, JSON
+        # Other formats such as rdf-xml, turtle, and n-triples could be possible with a bit of tweaking.
+        # Problems encountered so far are summarized here:
+        # https://github.com/RDFLib/sparqlwrapper/issues/107
+        #
+        # The query is sent using the endpoint client of this run, which reuses its pooled connections
+        # to the endpoint instead of opening a new one for every query.
+        def execute_attempt():
+
+            if stream:
+
+                # Since results are written in the order of the queries, a streamed response might need to wait for
+                # the writers. Thus it is spooled into a temporary file, which keeps only the buffer in memory.
+                buffer_size = query_collection_data_object.stream_buffer_size * 1024
+                results = tempfile.SpooledTemporaryFile(max_size=buffer_size)
+                try:
+                    query_collection_data_object.endpoint_client.execute(query_string, results_format, results, buffer_size)
+                except BaseException:
+                    results.close()
+                    raise
+                results.seek(0)
 
+            else:
+                results = query_collection_data_object.endpoint_client.execute(query_string, results_format)
 
-# cooldown_between_queries
-# defines how many seconds should be waited between execution of individual queries in order to prevent exhaustion of Google API due to too many writes per time-interval
-# OPTIONAL, if not set, 0 will be used
-cooldown_between_queries = 0
+            return results
 
+        startTime = time.time()
 
-# write_empty_results
-# Should tabs be created in a summary file for queries which did not return results? Possible values are python boolean values: True, False
-# OPTIONAL, if not set, False will be used
-write_empty_results = False
+        try:
+            results = query_collection_data_object.retry_policy.call(
+                execute_attempt, "Executing query", max_retries, retries)
 
+        # errors of the connection are passed on like any other error of the endpoint
+        except (OSError, http.client.HTTPException) as ex:
+            raise SPARQLExceptions.SPARQLWrapperException(str(ex))
 
-# -------------------- MANDATORY SETTINGS -------------------- 
+        execution_duration = time.time() - startTime
 
-# endpoint
-# defines the SPARQL endpoint against which all the queries are run
-# MANDATORY
-endpoint = \"http://dbpedia.org/sparql\"
+        if result_cache is not None:
+            result_cache.put(
+                query_collection_data_object.endpoint, query_string, results_format, results, execution_duration)
 
-# queries
-# defines the set of queries to be run. 
-# MANDATAORY
-queries = [
-    {
-        # title
-        # OPTIONAL, if not set, timestamp will be used
-        \"title\" : \"Optional title of first query\" ,
+        return results, execution_duration, None
 
-        # description
-        # OPTIONAL, if not set, nothing will be used or displayed
-        \"description\" : \"Optional description of first query, used to describe the purpose of the query.\" ,
 
-        # query
-        # the sparql query itself
-        # NOTE: best practise is to attach a 'r' before the string so that python would not interpret some characters as metacharacters, e.g. \"\\n\"
-        # MANDATORY
-        \"query\" : r\"\"\"
-            SELECT * WHERE {
-                ?s ?p ?o
-            }
-            LIMIT 50
-        \"\"\"
-    },   
-    {    
-        \"title\" : \"Second query\" , 
-        \"description\" : \"This query returns all triples which have a label associated\" , 
-        \"query\" : r\"\"\"
-            SELECT * WHERE {
-                ?s <http://www.w3.org/2000/01/rdf-schema#label> ?o
-            }
-            LIMIT 50
-        \"\"\"
-    },
-    {    
-        \"query\" : r\"\"\"
-            SELECT * WHERE {
-                ?s ?p ?o . 
-                FILTER ( ?p = <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> )
-            }
-            LIMIT 50
-        \"\"\"
-    },
-]
+    def execute_query_in_pages(query_data_object, results_format, stream=False):
+        """executes the query of a query data object in pages of page_size lines, by wrapping it into an ordered
+        sub-query fetched with LIMIT and OFFSET, until a page comes back short. Up to max_parallel_pages pages are
+        fetched at the same time. The pages are merged in their order into one result of the asked-for format, which
+        is returned the same way as by execute_query, though always as binary file: the pages are written into a
+        temporary file, which is spooled to disk once it outgrows stream_buffer_size, so that the whole result is never
+        held in memory. Queries which can't be paged are executed as a whole, returned as binary file only if stream."""
 
-# Each query is itself encoded as a python dictionary, and together these dictionaries are collected in a python list. 
-# Beginner's note on such syntax as follows:
-# * the set of queries is enclosed by '[' and ']'
-# * individual queries are enclosed by '{' and '},'
-# * All elements of a query (title, description, query) need to be defined using quotes as well as their contents, and both need to be separated by ':'
-# * All elements of a query (title, description, query) need to be separated from each other using quotes ','
-# * The content of a query needs to be defined using triple quotes, e.g. \"\"\" SELECT * WHERE .... \"\"\"
-# * Any indentation (tabs or spaces) do not influence the queries-syntax, they are merely syntactic sugar.
+        startTime = time.time()
 
+        query = query_data_object.query
 
+        # A page cut off by the endpoint would come back short, which would end the paging as if the results were
+        # complete. Thus pages must not be larger than the number of rows the endpoint returns at most.
+        endpoint_max_rows = query_collection_data_object.endpoint_max_rows
+        if endpoint_max_rows is not None and query_data_object.page_size > endpoint_max_rows:
+            message = "page_size " + str(query_data_object.page_size) + " exceeds endpoint_max_rows, thus fetching " + \
+                "pages of " + str(endpoint_max_rows) + " lines instead."
+            logging.warning(message)
+            print(message)
+            query_data_object.page_size = endpoint_max_rows
 
-# --------------- CUSTOM POST-PROCESSING METHOD --------------- 
-'''
-The method 'custom_post_processing(results)' is a stump for custom post processing which is always called if present and to which
-result data from the query execution is passed. This way you can implement your own post-processing steps there.
+        page_size = query_data_object.page_size
 
-The incoming 'results' argument is a list, where each list-element is a dictionary represting all data of a query.
+        # the variables of the results are needed for ordering the pages, thus fetch them first
+        query_for_variables = get_query_for_page(query, [], 0, 0)
 
-This dictionary has the following keys and respective values:
+        if query_for_variables is None:
+            message = "Query is not a select query, thus fetching its results without pages."
+            logging.warning(message)
+            print(message)
+            return execute_query(query, results_format, stream, retries=query_data_object.results_retries)
 
-* most likely to be needed are these two keys and values:
-'query_title' - title of an individual query, as defined above.
-'results_matrix' - the result data organized as a two dimensional list, where the first row contains the headers. 
-This value is what you would most likely need to post process the result data.  
+        results_variables, execution_duration_total, timestamp_cached = execute_query(
+            query_for_variables, JSON, retries=query_data_object.results_retries)
+        results_variables = json.loads(results_variables.decode("utf-8"))["head"].get("vars", [])
 
-* other than these two, each query dictionary also contains data from and for SparqLaborer, which might be of use:
-'query_description' - description of an individual query, as defined above.
-'query_text' - the sparql query itself.
-'results_execution_duration' - the duration it took to run the sparql query.
-'results_lines_count' - the number of lines the sparql query produced at the triplestore.
-'results_raw' - the result data in the specified format, encapsulated by its respective python class (e.g. a python json object).
-'query_for_count' - an infered query from the original query, is used to get number of result lines at the triplestore.
+        timestamps_cached = [ timestamp_cached ]
+        query_data_object.results_pages_durations = []
 
-As an example to print the raw data from the second query defined above, write:
-print(results[1].results_matrix)
-'''
+        results = tempfile.SpooledTemporaryFile(max_size=query_collection_data_object.stream_buffer_size * 1024)
 
-# UNCOMMENT THE FOLLOWING LINES FOR A QUICKSTART:
-'''    
-def custom_post_processing(results):
+        def fetch_page(page_number):
+            """fetches a single page and splits it for merging, retrying it up to page_retries times should it fail.
+            Is run within the threads fetching the pages."""
 
-    print(\"\\n\\Samples from the raw data:\\n\")
+            query_for_page = get_query_for_page(query, results_variables, page_size, page_number * page_size)
 
-    for result in results:
+            page, execution_duration, timestamp_cached = execute_query(
+                query_for_page, results_format,
+                max_retries=query_collection_data_object.page_retries, retries=query_data_object.results_retries)
 
-        print(\"some results of query: \" + result.title)
+            page_prefix, page_content, page_suffix, page_lines_count = split_result_page(page, results_format)
 
-        limit = 5 if len(result.results_matrix) > 5 else len(result.results_matrix)
-        for i in range(0, limit):
-            print(result.results_matrix[i])
+            logging.info("Fetched page " + str(page_number + 1) + " with " + str(page_lines_count) + " lines")
 
-        print()
-'''
-"""
+            return page_prefix, page_content, page_suffix, page_lines_count, execution_duration, timestamp_cached
 
-    with open('template.py', 'w') as f:
-        f.write(template)
 
+        suffix = b""
+        page_number = 0
+        has_lines = False
+        results_lines_count = 0
 
-class Output_writer:
-    """the Output_writer Class encapsulates all technical details which vary due to the specified output destinations"""
+        # Up to max_parallel_pages pages are fetched at the same time, while they are merged in their order. Once a
+        # page came back short, all pages after it are empty, thus the ones still pending are cancelled.
+        max_parallel_pages = query_collection_data_object.max_parallel_pages
+        pages_pending = collections.deque()
 
-    # general variables
-    output_destination_type = None
-    summary_sample_limit = None
-    line_number = None
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_parallel_pages) as executor:
 
-    # local folder and xlsx variables
-    folder = None
-    file_xlsx = None
-    xlsx_workbook = None
-    xlsx_worksheet_summary = None
-    output_format = None
-    bold_format = None
-    title_2_format = None
-    query_text_format = None
+            try:
 
-    # google folder and sheets variables
-    google_service_sheets = None
-    google_service_drive = None
-    google_sheets_id = None
-    google_sheets_summary_sheet_id = None
+                while True:
 
-    def __init__(self, query_collection_data_object):
+                    while len(pages_pending) < max_parallel_pages:
+                        pages_pending.append(executor.submit(fetch_page, page_number + len(pages_pending)))
 
-        def main():
+                    page_prefix, page_content, page_suffix, page_lines_count, execution_duration, timestamp_cached = \
+                        pages_pending.popleft().result()
 
-            message = "\n\n################################\n" + \
-            "Setting up output destination: " + query_collection_data_object.output_destination + "\n"
-            logging.info(message)
-            print(message)
+                    execution_duration_total += execution_duration
+                    timestamps_cached.append(timestamp_cached)
+                    query_data_object.results_pages_durations.append(execution_duration)
 
-            self.summary_sample_limit = query_collection_data_object.summary_sample_limit
-            self.write_empty_results = query_collection_data_object.write_empty_results
+                    if page_number == 0:
+                        results.write(page_prefix)
+                        suffix = page_suffix
+                    elif results_format == JSON and page_content != b"" and has_lines:
+                        results.write(b",\n")
 
+                    results.write(page_content)
 
-            # output_destination_type, interpret from string
+                    results_lines_count += page_lines_count
+                    has_lines = has_lines or page_content != b""
+                    page_number += 1
 
-            if "google.com/drive/folders" in query_collection_data_object.output_destination:
-                self.output_destination_type = "google_folder"
-                logging.info("deduced output_destination_type: " + self.output_destination_type)
-                init_google_folder()
+                    if page_lines_count < page_size:
+                        break
 
-            elif "google.com/spreadsheets" in query_collection_data_object.output_destination:
-                self.output_destination_type = "google_sheets"
-                logging.info("deduced output_destination_type: " + self.output_destination_type)
-                init_google_sheets()
+            finally:
+                for page_pending in pages_pending:
+                    page_pending.cancel()
 
-            elif query_collection_data_object.output_format == "XLSX" :
-                self.output_destination_type = "local_xlsx"
-                logging.info("deduced output_destination_type: " + self.output_destination_type)
-                init_local_xlsx()
+        results.write(suffix)
 
-            else:
-                self.output_destination_type = "local_folder"
-                logging.info("deduced output_destination_type: " + self.output_destination_type)
-                init_local_folder()
+        query_data_object.results_pages_lines_count = results_lines_count
 
+        message = "Fetched results in " + str(page_number) + " pages of up to " + str(page_size) + " lines"
+        logging.info(message)
+        print(message)
 
-        def init_local_xlsx():
-            """Creates a xlsx file in the respective folder"""
+        results.seek(0)
 
-            # if locally saved, then "/" needs to be replaced with "-", since otherwise "/" would be interpreted as subfolder
-            file_name = query_collection_data_object.title.replace("/", "-")
+        # The results count as cached only if all of their pages were taken from the cache, in which case the durations
+        # of their original executions are summed up. Otherwise the time it took to fetch all pages is returned.
+        if None in timestamps_cached:
+            timestamp_cached = None
+            execution_duration_total = time.time() - startTime
+        else:
+            timestamp_cached = min(timestamps_cached)
 
-            # get or create folder for xlsx file
-            self.folder = Path(str(query_collection_data_object.output_destination))
-            self.folder.mkdir(parents=True, exist_ok=True)
+        return results, execution_duration_total, timestamp_cached
 
-            # create xlsx file
-            self.file_xlsx = Path(
-                self.folder / str(query_collection_data_object.timestamp_start + " - " + file_name + ".xlsx") )
-            self.xlsx_workbook = xlsxwriter.Workbook(self.file_xlsx.open('wb'))
-            self.xlsx_worksheet_summary = self.xlsx_workbook.add_worksheet("0. Summary")
 
-            message = "Created local file: " + str(self.file_xlsx)
-            logging.info(message)
-            print(message)
+    def split_result_page(page, results_format):
+        """Splits the raw bytes of a page of results into the part before its result lines, the result lines
+        themselves and the part after them, so that the result lines of several pages can be joined into one result.
+        The result lines are counted while splitting, without harmonizing them, and their number is returned as well."""
 
+        if results_format == CSV or results_format == TSV:
 
-        def init_local_folder():
-            """Creates a folder (for the raw ouput) and a xlsx file (for the summary) in the respective folder"""
+            # the header of csv and tsv results is always the first line
+            end_of_header = page.find(b"\n") + 1
+            if end_of_header == 0:
+                return page, b"", b"", 0
 
-            # if locally saved, then "/" needs to be replaced with "-", since otherwise "/" would be interpreted as subfolder
-            folder_name = query_collection_data_object.title.replace("/", "-")
+            page_content = page[end_of_header:]
+            if page_content != b"" and not page_content.endswith(b"\n"):
+                page_content += b"\r\n"
 
+            # Line breaks within values are escaped in tsv, thus every line break ends a result line. In csv they
+            # can only occur within quoted values, so only these need to be read as csv for counting.
+            if results_format == TSV or b"\"" not in page_content:
+                page_lines_count = page_content.count(b"\n")
+            else:
+                page_lines_count = sum(1 for row in csv.reader(
+                    io.TextIOWrapper(io.BytesIO(page_content), encoding="utf-8", newline="")))
 
-            # create folder for queries and summary
+            return page[:end_of_header], page_content, b"", page_lines_count
 
-            self.folder = Path(str(
-                query_collection_data_object.output_destination + "/" +
-                query_collection_data_object.timestamp_start + " - " +
-                folder_name))
+        elif results_format == XML:
 
-            self.folder.mkdir(parents=True, exist_ok=False)
+            match = re.search(rb"<results(\s[^>]*)?(/?)>", page)
+            if match is not None:
 
-            self.output_format = query_collection_data_object.output_format
+                if match.group(2) == b"/":
+                    return page[:match.start()] + b"<results>", b"", b"</results>" + page[match.end():], 0
 
+                end_of_results = page.rfind(b"</results>")
+                if end_of_results != -1:
 
-            # Create xlsx file for summary
+                    # markup within values is escaped, thus every result element starts with this tag
+                    page_content = page[match.end():end_of_results]
+                    page_lines_count = len(re.findall(rb"<result[\s/>]", page_content))
 
-            self.file_xlsx = Path(self.folder / "0. Summary.xlsx")
-            self.xlsx_workbook = xlsxwriter.Workbook(self.file_xlsx.open('wb'))
-            self.xlsx_worksheet_summary = self.xlsx_workbook.add_worksheet("0. Summary")
+                    return page[:match.end()], page_content, page[end_of_results:], page_lines_count
 
-            message = "Created local folder: " + str(self.folder)
-            logging.info(message)
-            print(message)
+        elif results_format == JSON:
 
+            match = re.search(rb"\"bindings\"\s*:\s*\[", page)
+            if match is not None:
 
-        def init_google_services():
-            """Instantiates all necessary services for writing results to a specified google folder / sheets-file"""
+                end_of_bindings = page.rfind(b"]")
+                page_content = page[match.end():end_of_bindings].strip()
+                page_lines_count = len(json.loads(b"[" + page_content + b"]"))
 
-            SCOPES = "https://www.googleapis.com/auth/drive"
+                return page[:match.end()], page_content, page[end_of_bindings:], page_lines_count
 
-            # Hardwired credentials
-            #
-            # !!! CAUTION !!!
-            #
-            # POSSIBILITY OF GRANTING FULL ACCESS TO YOUR PRIVATE GOOGLE DRIVE
-            #
-            # For ease of usage on your local machine, you can hardwire your credentials here
-            # BUT ONLY DO THIS IF YOU NEVER SHARE THIS MODIFIED SCRIPT
-            #
-            # NEVER INSERT YOUR CREDENTIALS IF YOU WILL SHARE THIS SCRIPT!!
+        raise SPARQLExceptions.SPARQLWrapperException("Could not read the results of a page: " + page[:100].decode("utf-8", "replace"))
 
 
-            # UNCOMMENT THE FOLLOWING LINES AND INSERT CONTENT OF CREDENTIALS.JSON FILE THERE
-            # creds_hardcoded = json.loads("""
-            #
-            # """)
+    def get_harmonized_result(result, format):
+        """Transforms the result data from its varying data formats into a two-dimensional list, used for writing summaries or into xlsx / google sheets files"""
 
-            # COMMENT OR DELETE THIS LINE
-            creds_hardcoded = None
+        if result is None:
+            return None
+        else:
+            return get_typed_results_matrix(iterate_harmonized_rows(io.BytesIO(result), format))
 
 
-            # use credentials file if available
+    def get_typed_results_matrix(rows):
+        """Collects harmonized rows into a Results_matrix, whose columns are then converted to their inferred types"""
 
-            if query_collection_data_object.credentials_path:
-                creds = client.GoogleCredentials.from_json(open(query_collection_data_object.credentials_path).read())
+        results_matrix = Results_matrix(rows)
 
-            # if no credentials file is available, then create one using client_secret
-            elif query_collection_data_object.client_secret_path:
-                store = file.Storage('credentials.json')
-                flow = client.flow_from_clientsecrets(query_collection_data_object.client_secret_path, SCOPES)
+        if results_matrix.header is not None:
+            results_matrix.apply_column_types(results_matrix.infer_column_types())
 
-                # note: adding 'tools.argparser.parse_args(args=[])' here is important, otherwise
-                # oauth2client.tools would parse the main command line arguments
-                creds = tools.run_flow(flow, store, tools.argparser.parse_args(args=[]))
+        return results_matrix
 
-            elif creds_hardcoded:
 
-                creds = GoogleCredentials(
-                    creds_hardcoded['access_token'],
-                    creds_hardcoded['client_id'],
-                    creds_hardcoded['client_secret'],
-                    creds_hardcoded['refresh_token'],
-                    creds_hardcoded['token_expiry'],
-                    creds_hardcoded['token_uri'],
-                    creds_hardcoded['user_agent'],
-                    creds_hardcoded['revoke_uri']
-                )
+    # formats whose results can be read incrementally by iterate_harmonized_rows, if stream_results is set
 
-            # if neither is available, abort
-            else:
-                message = "\nERROR: No client_secret.json or credentials.json provided nor found in local folder!."
-                logging.error(message)
-                sys.exit(message)
+    streamable_formats = [CSV, TSV, XML, JSON]
 
-            # create services to be used by write functions
-            if not creds.invalid:
-                self.google_service_drive = discovery.build('drive', 'v3', http=creds.authorize(Http()))
-                self.google_service_sheets = discovery.build('sheets', 'v4', http=creds.authorize(Http()))
-            else:
-                message = "\nERROR: Invalid credentials!"
-                logging.error(message)
-                sys.exit(message)
 
+    # one endpoint client per run, shared by all queries, their queries for counting, and the count of all triples
 
-        def init_google_sheets():
-            """Formats the give google sheets file, deletes old content and creates a summary-sheet"""
+    endpoint_pool_size = query_collection_data_object.endpoint_pool_size
+    if endpoint_pool_size is None:
+        endpoint_pool_size = \
+            query_collection_data_object.max_parallel_queries * query_collection_data_object.max_parallel_pages
+        if query_collection_data_object.count_the_results in (True, "batched"):
+            endpoint_pool_size += query_collection_data_object.max_parallel_queries
 
-            init_google_services()
+    query_collection_data_object.endpoint_client = Endpoint_client(
+        query_collection_data_object.endpoint,
+        endpoint_pool_size,
+        query_collection_data_object.endpoint_idle_timeout,
+        query_collection_data_object.endpoint_timeout,
+        Rate_limiter("Endpoint", query_collection_data_object.endpoint_rate_limit))
 
+    query_collection_data_object.retry_policy = Retry_policy(
+        query_collection_data_object.max_retries,
+        query_collection_data_object.retry_backoff,
+        query_collection_data_object.retry_max_backoff)
 
-            # get id of google sheets file by extracting it from the url
+    # result cache, only used if a time to live is given and it was not disabled by command line
 
-            self.google_sheets_id = query_collection_data_object.output_destination\
-                .split("docs.google.com/spreadsheets/d/",1)[1]\
-                .split("/",1)[0]
-            logging.info("ID of google sheets : " + str(self.google_sheets_id))
+    if query_collection_data_object.cache_ttl > 0 and not query_collection_data_object.cache_disabled:
 
-            # get list of existing sheets in sheets file
-            google_sheets_metadata = self.google_service_sheets.spreadsheets().get(
-                spreadsheetId=self.google_sheets_id).execute()
-            all_sheet = google_sheets_metadata['sheets']
+        query_collection_data_object.result_cache = Result_cache(
+            query_collection_data_object.cache_folder,
+            query_collection_data_object.cache_ttl,
+            query_collection_data_object.cache_max_size * 1024 * 1024,
+            query_collection_data_object.cache_refresh,
+            query_collection_data_object.stream_buffer_size * 1024)
 
+    else:
+        query_collection_data_object.result_cache = None
 
-            # create new sheet reserved for summary
+    # threads for executing the queries for counting results at the same time as their queries
 
-            body_create_summary_page = {
-                "requests": [
-                    {
-                        "addSheet": {
-                            "properties": {
-                                "gridProperties": {
-                                    "columnCount": 26
-                                }
-                            }
-                        }
-                    }
-                ]
-            }
+    count_executor = concurrent.futures.ThreadPoolExecutor(max_workers=query_collection_data_object.max_parallel_queries)
 
-            result = self.google_service_sheets.spreadsheets().batchUpdate(
-                spreadsheetId=self.google_sheets_id, body=body_create_summary_page).execute()
-            self.google_sheets_summary_sheet_id = result['replies'][0]['addSheet']['properties']['sheetId']
+    # counts of results and their query for counting by query text, if counted in a batch
 
+    results_lines_counts_batched = {}
 
-            # delete all sheets except summary
+    try:
+        return main(query_collection_data_object)
+    finally:
+        count_executor.shutdown()
+        query_collection_data_object.endpoint_client.close()
 
-            body_sheet_to_delete = { 'requests' : [] }
-            for sheet in all_sheet:
-                tmp = {
-                    "deleteSheet": {
-                        "sheetId": sheet['properties']['sheetId']
-                    }
-                }
-                body_sheet_to_delete['requests'].append(tmp)
 
-            self.google_service_sheets.spreadsheets().batchUpdate(
-                spreadsheetId=self.google_sheets_id, body=body_sheet_to_delete).execute()
+def iterate_harmonized_rows(result_file, format):
+    """Reads the raw results from a binary file incrementally and yields them row by row as harmonized lists
+    (first row: variables, all others: their values), so that results never need to be held in memory as a whole.
+    Typed literals of xml and json results are converted by the converter of their datatype, all other values are
+    yielded as strings, whose types are inferred per column later on (see Results_matrix)."""
 
+    # converters of the datatypes encountered so far, so that the registry is consulted only once per datatype
+    converters_of_datatypes = {}
 
-            # rename summary sheet to '0. Summary'
+    def convert_typed_literal(value, datatype):
 
-            body_to_rename = {
-                "requests" : [
-                    {
-                        "updateSheetProperties": {
-                            "properties": {
-                                "sheetId": self.google_sheets_summary_sheet_id,
-                                "title": "0. Summary",
-                            },
-                            "fields": "title",
-                        }
-                    },
-                    {
-                        "updateDimensionProperties": {
-                            "range": {
-                                "sheetId": self.google_sheets_summary_sheet_id,
-                                "dimension": "COLUMNS",
-                                "startIndex": 0,
-                                "endIndex":26
-                            },
-                            "properties": {
-                                "pixelSize": 350
-                            },
-                            "fields": "pixelSize"
-                        }
-                    }
-                ]
-            }
-            self.google_service_sheets.spreadsheets().batchUpdate(
-                spreadsheetId=self.google_sheets_id, body=body_to_rename).execute()
+        try:
+            converter = converters_of_datatypes[datatype]
+        except KeyError:
+            converter = Results_matrix.xsd_datatype_converters.get(datatype)
+            converters_of_datatypes[datatype] = converter
 
+        if converter is None:
+            return value
 
-        # google folder
-        def init_google_folder():
-            """Creates a new google sheets file inside the specified google folder"""
+        # literals which are not valid for their datatype are kept as they are
+        try:
+            return converter(value)
+        except (ValueError, TypeError, ArithmeticError, LookupError):
+            return value
 
-            init_google_services()
+    if format == CSV or format == TSV or format == "XLSX":
 
-            # get id of google folder by extracting it from the url
-            self.google_folder_id = query_collection_data_object.output_destination\
-                .split("drive.google.com/drive/folders/",1)[1]\
-                .split("?",1)[0]
-            logging.info("ID of google folder : " + str(self.google_folder_id))
+        # the text wrapper is detached in the end, since it would otherwise close the underlying result_file
+        result_text = io.TextIOWrapper(result_file, encoding="utf-8", newline="")
 
-            # Create google sheets file in folder
-            body_spreadsheet = {
-                'name': query_collection_data_object.timestamp_start + " - " + query_collection_data_object.title,
-                'mimeType': 'application/vnd.google-apps.spreadsheet',
-                'parents': [self.google_folder_id]
-            }
-            sheets =  self.google_service_drive.files().create(body=body_spreadsheet).execute()
-            self.google_sheets_id = sheets['id']
-            self.google_sheets_summary_sheet_id = 0
+        try:
 
-            # Sets name of first sheet to summary, sets up column width
-            body_to_rename = {
-                "requests": [
-                    {
-                        "updateSheetProperties": {
-                            "properties": {
-                                "sheetId": self.google_sheets_summary_sheet_id,
-                                "title": "0. Summary",
-                            },
-                            "fields": "title",
-                        }
-                    },
-                    {
-                        "updateDimensionProperties": {
-                            "range": {
-                                "sheetId": self.google_sheets_summary_sheet_id,
-                                "dimension": "COLUMNS",
-                                "startIndex": 0,
-                                "endIndex":26
-                            },
-                            "properties": {
-                                "pixelSize": 300
-                            },
-                            "fields": "pixelSize"
-                        }
-                    }
-                ]
-            }
-            self.google_service_sheets.spreadsheets().batchUpdate(
-                spreadsheetId=self.google_sheets_id, body=body_to_rename).execute()
+            if format == TSV:
+                reader = csv.reader(result_text, delimiter="\t")
+            else:
+                reader = csv.reader(result_text)
 
-            message = "Created google sheets at: " + "docs.google.com/spreadsheets/d/" + self.google_sheets_id
-            logging.info(message)
-            print(message)
+            valid_row_length = float("inf")
 
-        main()
+            for row in reader:
 
+                # check validity of results
+                current_row_length = len(row)
+                if valid_row_length != float("inf") and valid_row_length != current_row_length:
+                    message = "\nERROR: INVALID ROW LENGTH! " + str(row) + " has length " + str(current_row_length) + ", while valid length is " + str(valid_row_length)
+                    logging.error(message)
+                    sys.exit(message)
+                valid_row_length = current_row_length
 
-    def write_header_summary(self, query_collection_data_object):
-        """Writes the initial header to the summary sheet"""
+                yield row
 
-        def main(query_collection_data_object):
+        finally:
+            result_text.detach()
 
-            if self.output_destination_type == 'local_folder' or self.output_destination_type == 'local_xlsx':
-                write_header_summary_xlsx_file(query_collection_data_object)
 
-            elif self.output_destination_type == 'google_folder' or self.output_destination_type == 'google_sheets':
-                write_header_summary_google_sheet(query_collection_data_object)
+    elif format == XML:
 
+        # The xml document is parsed event-driven, without ever building a complete dom tree of it. Every result
+        # element is turned into a row as soon as it is read completely, after which it is removed from the tree again.
 
-        def write_header_summary_xlsx_file(query_collection_data_object):
-            """Writes header to xlsx file"""
+        keys = []
+        valid_keys = None
+        results_element = None
 
-            message = "Writing header to summary in local xslx"
-            logging.info(message)
-            print(message)
+        for event, element in xml.etree.ElementTree.iterparse(result_file, events=("start", "end")):
 
-            # setup and formats
-            self.xlsx_worksheet_summary.set_column('A:Z', 70)
-            self.title_format = self.xlsx_workbook.add_format({'bold': True})
-            self.title_format.set_font_size(16)
-            self.title_2_format = self.xlsx_workbook.add_format({'bold': True})
-            self.title_2_format.set_font_size(12)
-            self.query_text_format = self.xlsx_workbook.add_format({'text_wrap': True})
-            self.bold_format = self.xlsx_workbook.add_format({'bold': True})
+            tag = element.tag.rsplit("}", 1)[-1]
 
-            # Write header to xlsx
-            self.xlsx_worksheet_summary.set_row(0, 20)
-            self.line_number = 0
-            self.xlsx_worksheet_summary.write(self.line_number, 0, query_collection_data_object.title, self.title_format)
-            if query_collection_data_object.description is not None:
-                self.xlsx_worksheet_summary.write(self.line_number + 1, 0, query_collection_data_object.description)
-                self.line_number += 1
-            self.line_number += 2
-            self.xlsx_worksheet_summary.write(self.line_number, 0, "Execution timestamp of script: " + query_collection_data_object.timestamp_start)
-            self.line_number += 1
-            if query_collection_data_object.header_error_message is None:
-                self.xlsx_worksheet_summary.write(self.line_number, 0, "Endpoint: " + query_collection_data_object.endpoint)
-                self.line_number += 1
-                self.xlsx_worksheet_summary.write(self.line_number, 0, "Total count of triples in endpoint: " + query_collection_data_object.count_triples_in_endpoint)
-            else:
-                self.xlsx_worksheet_summary.write(self.line_number, 0, query_collection_data_object.header_error_message)
-            self.line_number += 4
+            if event == "start":
 
+                if tag == "results":
+                    results_element = element
 
-        def write_header_summary_google_sheet(query_collection_data_object):
-            """Writes header to google sheets file"""
+                continue
 
-            message = "Writing header to summary in google sheets"
-            logging.info(message)
-            print(message)
+            # get keys and yield them as first row
+            if tag == "variable":
+                keys.append(element.get('name'))
 
-            # create header info
-            self.line_number = 0
-            header = []
-            header.append([query_collection_data_object.title])
-            if query_collection_data_object.description is not None:
-                header.append([query_collection_data_object.description])
-            header.append([])
-            header.append(
-                ["Execution timestamp of script: " +
-                 query_collection_data_object.timestamp_start])
-            if query_collection_data_object.header_error_message is None:
-                header.append(["endpoint: " + query_collection_data_object.endpoint])
-                header.append(
-                    ["Total count of triples in endpoint: " +
-                     query_collection_data_object.count_triples_in_endpoint])
-            else:
-                header.append([query_collection_data_object.header_error_message])
+            elif tag == "head":
+                valid_keys = set(keys)
+                yield keys
 
+            # extract key-value pairs from each result and yield them in the order of the keys
+            elif tag == "result":
 
-            # get range for header
-            range = self.get_range_from_matrix(self.line_number, 0, header)
-            range = "0. Summary!" + range
-            self.line_number += len(header) + 3
+                dict_tmp = {}
+                for binding in element:
 
-            # write header to sheet
-            self.google_service_sheets.spreadsheets().values().update(
-                    spreadsheetId=self.google_sheets_id, range=range,
-                    valueInputOption="RAW", body= { 'values': header } ).execute()
+                    child_node = binding[0]
 
-        main(query_collection_data_object)
+                    if child_node.text is None:
+                        dict_tmp[binding.get('name')] = ""
+                    elif child_node.get('datatype') is None:
+                        dict_tmp[binding.get('name')] = child_node.text
+                    else:
+                        dict_tmp[binding.get('name')] = convert_typed_literal(child_node.text, child_node.get('datatype'))
 
+                # check validity of results (unbound variables, e.g. of an OPTIONAL, are left out and yielded empty)
+                if not valid_keys.issuperset(dict_tmp):
+                    message = "\nERROR: INVALID ROW! " + str(dict_tmp) + " binds variables not in " + str(keys)
+                    logging.error(message)
+                    sys.exit(message)
 
-    def write_query_result(self, query_data_object):
-        """Writes results of query to the respective output destination"""
+                yield [ dict_tmp.get(key, "") for key in keys ]
 
-        def main(query_data_object):
+                results_element.clear()
 
-            if len(query_data_object.results_matrix) > 1 or self.write_empty_results:
-                message = "Writing results to output_destination"
-                logging.info(message)
-                print(message)
 
-                if self.output_destination_type == 'local_xlsx':
-                    write_query_result_to_xlsx_file(query_data_object)
+    elif format == JSON:
 
-                elif self.output_destination_type == 'local_folder':
-                    write_query_result_to_local_folder(query_data_object)
+        # The json document is decoded incrementally. All its members are decoded as a whole, except for the
+        # bindings array, whose elements are decoded and yielded one by one.
 
-                elif self.output_destination_type == 'google_sheets' or self.output_destination_type == 'google_folder':
-                    write_query_result_to_google_sheets(query_data_object)
+        json_stream = Json_stream(result_file)
+        keys = None
+        valid_keys = None
 
+        for key_document in json_stream.iterate_object_keys():
 
-        def write_query_result_to_xlsx_file(query_data_object):
-            """Writes results as harmonized two-dimensional list into a separate sheet in the xlsl file"""
+            # get keys and yield them as first row
+            if key_document == "head":
 
-            # create new worksheet and write into it
-            sanitized_query_title = query_data_object.title\
-                .replace("["," ") \
-                .replace("]"," ") \
-                .replace(":"," ") \
-                .replace("*"," ") \
-                .replace("?"," ") \
-                .replace("/"," ") \
-                .replace("\\"," ")
+                head = json_stream.decode_value()
+
+                if keys is None:
+                    keys = head.get('vars', [])
+                    valid_keys = set(keys)
+                    yield keys
+
+            elif key_document == "results":
+
+                for key_results in json_stream.iterate_object_keys():
+
+                    if key_results != "bindings":
+                        json_stream.decode_value()
+                        continue
+
+                    # go through the json - rows and extract key-value pairs from each, yield them in the order of the keys
+                    for row in json_stream.iterate_array():
+
+                        # should the head not come first, use the keys of the first row instead
+                        if keys is None:
+                            keys = list(row.keys())
+                            valid_keys = set(keys)
+                            yield keys
+
+                        dict_tmp = {}
+                        for key in row:
+                            if 'datatype' in row[key]:
+                                dict_tmp[key] = convert_typed_literal(row[key]['value'], row[key]['datatype'])
+                            else:
+                                dict_tmp[key] = row[key]['value']
+
+                        # check validity of results (unbound variables, e.g. of an OPTIONAL, are left out and yielded empty)
+                        if not valid_keys.issuperset(row):
+                            message = "\nERROR: INVALID ROW! " + str(row) + " binds variables not in " + str(keys)
+                            logging.error(message)
+                            sys.exit(message)
+
+                        yield [ dict_tmp.get(key, "") for key in keys ]
+
+            else:
+                json_stream.decode_value()
+
+
+def convert_shared_results(shared_results_raw, shared_format, results_format, stream, buffer_size):
+    """Returns a copy of results shared between variants (kept as binary file) in the format of a variant, as binary
+    file if the results are streamed, as bytes otherwise. Json results are converted, if another format is asked for."""
+
+    shared_results_raw.seek(0)
+
+    if stream:
+        results = tempfile.SpooledTemporaryFile(max_size=buffer_size)
+    else:
+        results = io.BytesIO()
+
+    if shared_format == results_format:
+        shutil.copyfileobj(shared_results_raw, results, buffer_size)
+    else:
+        convert_json_results(shared_results_raw, results_format, results)
+
+    if stream:
+        results.seek(0)
+        return results
+    else:
+        return results.getvalue()
+
+
+def convert_json_results(json_file, format, result_file):
+    """Converts raw json results of a select query, read incrementally from a binary file, into the given format
+    (csv, tsv or xml) and writes them incrementally into result_file. Used for results which are fetched only once
+    for several formats (see plan_shared_results)."""
+
+    # the text wrapper is detached in the end, since it would otherwise close the underlying result_file
+    result_text = io.TextIOWrapper(result_file, encoding="utf-8", newline="")
+
+    # literals of these datatypes are written without quotes and datatype into tsv results, if they are valid
+    tsv_abbreviated_datatypes = {
+        "http://www.w3.org/2001/XMLSchema#integer": re.compile(r"[+-]?[0-9]+"),
+        "http://www.w3.org/2001/XMLSchema#decimal": re.compile(r"[+-]?[0-9]*\.[0-9]+"),
+        "http://www.w3.org/2001/XMLSchema#double": re.compile(r"[+-]?([0-9]+(\.[0-9]*)?|\.[0-9]+)[eE][+-]?[0-9]+"),
+        "http://www.w3.org/2001/XMLSchema#boolean": re.compile(r"true|false"),
+    }
+
+    def get_tsv_term(term):
+
+        if term is None:
+            return ""
+        elif term['type'] == "uri":
+            return "<" + term['value'] + ">"
+        elif term['type'] == "bnode":
+            return "_:" + term['value']
+        elif term.get('datatype') in tsv_abbreviated_datatypes and \
+                tsv_abbreviated_datatypes[term['datatype']].fullmatch(term['value']):
+            return term['value']
+
+        literal = '"' + term['value'].replace("\\", "\\\\").replace('"', '\\"')\
+            .replace("\n", "\\n").replace("\r", "\\r").replace("\t", "\\t") + '"'
+        if 'xml:lang' in term:
+            literal += "@" + term['xml:lang']
+        elif 'datatype' in term:
+            literal += "^^<" + term['datatype'] + ">"
+
+        return literal
+
+    def get_xml_binding(key, term):
+
+        if term is None:
+            return ""
+        elif term['type'] == "uri":
+            value = "<uri>" + xml.sax.saxutils.escape(term['value']) + "</uri>"
+        elif term['type'] == "bnode":
+            value = "<bnode>" + xml.sax.saxutils.escape(term['value']) + "</bnode>"
+        elif 'xml:lang' in term:
+            value = "<literal xml:lang=" + xml.sax.saxutils.quoteattr(term['xml:lang']) + ">" + \
+                xml.sax.saxutils.escape(term['value']) + "</literal>"
+        elif 'datatype' in term:
+            value = "<literal datatype=" + xml.sax.saxutils.quoteattr(term['datatype']) + ">" + \
+                xml.sax.saxutils.escape(term['value']) + "</literal>"
+        else:
+            value = "<literal>" + xml.sax.saxutils.escape(term['value']) + "</literal>"
+
+        return "<binding name=" + xml.sax.saxutils.quoteattr(key) + ">" + value + "</binding>"
+
+    csv_writer = csv.writer(result_text, lineterminator="\r\n")
+
+    def write_header(keys):
+
+        if format == CSV:
+            csv_writer.writerow(keys)
+        elif format == TSV:
+            result_text.write("\t".join([ "?" + key for key in keys ]) + "\n")
+        else:
+            result_text.write(
+                '<?xml version="1.0"?>\n<sparql xmlns="http://www.w3.org/2005/sparql-results#">\n <head>\n' +
+                "".join([ "  <variable name=" + xml.sax.saxutils.quoteattr(key) + "/>\n" for key in keys ]) +
+                " </head>\n <results>\n")
+
+    def write_row(keys, row):
+
+        if format == CSV:
+            csv_writer.writerow([
+                "" if row.get(key) is None else
+                ("_:" if row[key]['type'] == "bnode" else "") + row[key]['value']
+                for key in keys ])
+        elif format == TSV:
+            result_text.write("\t".join([ get_tsv_term(row.get(key)) for key in keys ]) + "\n")
+        else:
+            result_text.write(
+                "  <result>" + "".join([ get_xml_binding(key, row.get(key)) for key in keys ]) + "</result>\n")
+
+    try:
+
+        json_stream = Json_stream(json_file)
+        keys = None
+
+        for key_document in json_stream.iterate_object_keys():
+
+            if key_document == "head":
+
+                head = json_stream.decode_value()
+
+                if keys is None:
+                    keys = head.get('vars', [])
+                    write_header(keys)
+
+            elif key_document == "results":
+
+                for key_results in json_stream.iterate_object_keys():
+
+                    if key_results != "bindings":
+                        json_stream.decode_value()
+                        continue
+
+                    for row in json_stream.iterate_array():
+
+                        # should the head not come first, use the keys of the first row instead
+                        if keys is None:
+                            keys = list(row.keys())
+                            write_header(keys)
+
+                        write_row(keys, row)
+
+            else:
+                json_stream.decode_value()
+
+        if keys is None:
+            write_header([])
+
+        if format == XML:
+            result_text.write(" </results>\n</sparql>\n")
+
+    finally:
+        result_text.flush()
+        result_text.detach()
+
+
+def iterate_typed_rows(rows, column_types, batch_size=1000):
+    """Converts harmonized rows (as yielded by iterate_harmonized_rows) to the given column types, without holding more
+    than batch_size rows in memory. The rows of each batch are converted column by column, so that every column is
+    handled by one converter in bulk. Since earlier batches may have been written already, a value not fitting the
+    type of its column is kept as it is."""
+
+    rows = iter(rows)
+
+    header = next(rows, None)
+    if header is None:
+        return
+
+    yield header
+
+    if column_types is None or len(header) == 0:
+        yield from rows
+        return
+
+    while True:
+
+        batch = list(itertools.islice(rows, batch_size))
+        if len(batch) == 0:
+            return
+
+        columns = []
+        for x, column in enumerate(zip(*batch)):
+            if column_types[x] == "string":
+                columns.append(column)
+            else:
+                columns.append(Results_matrix.convert_column(column, column_types[x], lenient=True))
+
+        for row in zip(*columns):
+            yield list(row)
+
+
+def convert_to_boolean(value):
+    """Converts a boolean literal (true, false, 1 or 0) to a python bool, leaving bools as they are"""
+
+    if type(value) is bool:
+        return value
+
+    return { "true": True, "false": False, "1": True, "0": False }[value]
+
+
+def convert_to_date(value):
+    """Converts a date literal (e.g. 2020-01-31) to a python date, leaving dates as they are"""
+
+    if type(value) is datetime.date:
+        return value
+
+    return datetime.date.fromisoformat(value)
+
+
+def convert_to_datetime(value):
+    """Converts a datetime literal (e.g. 2020-01-31T12:00:00Z) to a python datetime, leaving datetimes as they are"""
+
+    if type(value) is datetime.datetime:
+        return value
+
+    return datetime.datetime.fromisoformat(value)
+
+
+# tokens of sparql queries, as needed for splitting and rewriting them
+sparql_token_pattern = re.compile(r"""
+    (?P<whitespace>\s+)
+    | (?P<comment>\#[^\n]*)
+    | (?P<string>'\'\'(?:[^'\\]|\\.|'(?!''))*'\'\'|\"\"\"(?:[^"\\]|\\.|"(?!""))*\"\"\"|'(?:[^'\\\n]|\\.)*'|"(?:[^"\\\n]|\\.)*")
+    | (?P<iri><[^<>"{}|^`\\\s]*>)
+    | (?P<variable>[?$]\w+)
+    | (?P<name>[\w:.\-]+)
+    | (?P<symbol>.)
+    """, re.VERBOSE | re.DOTALL)
+
+
+def tokenize_sparql_query(query):
+    """Splits a sparql query into its tokens, yielding each as tuple of its kind, its text and its position in the
+    query. Comments, string literals and IRIs are single tokens, so that keywords within them are never mistaken
+    as such. Whitespace is skipped."""
+
+    for match in sparql_token_pattern.finditer(query):
+        if match.lastgroup != "whitespace":
+            yield match.lastgroup, match.group(), match.start()
+
+
+@functools.lru_cache(maxsize=1024)
+def split_sparql_query(query):
+    """Splits a sparql query into its prologue (base and prefix declarations) and the rest of it, starting with its
+    query form (select, construct, ask or describe). Returns None if no query form was found. Since queries are
+    usually split several times (for counting, for pages), the splits are cached per query text."""
+
+    variables = set()
+    query_form_position = None
+    query_form = None
+
+    for kind, text, position in tokenize_sparql_query(query):
+
+        if kind == "variable":
+            variables.add(text[1:])
+
+        elif kind == "name" and query_form is None and text.upper() in ("SELECT", "CONSTRUCT", "ASK", "DESCRIBE"):
+            query_form_position = position
+            query_form = text.upper()
+
+    if query_form is None:
+        return None
+
+    return query[:query_form_position], query_form, query[query_form_position:], frozenset(variables)
+
+
+@functools.lru_cache(maxsize=1024)
+def get_query_for_count(query):
+    """Creates the query for counting the results of a select query, by wrapping it as sub-query into a
+    'SELECT (COUNT(*) AS ?count)', its prologue kept in front. The variable of the count is chosen so that it doesn't
+    clash with any variable of the query. Returns the query for counting and the name of its variable, or None if
+    the query is not a select query. The queries for counting are cached per query text."""
+
+    query_split = split_sparql_query(query)
+
+    if query_split is None or query_split[1] != "SELECT":
+        return None
+
+    prologue, query_form, query_body, variables = query_split
+
+    count_variable = "count"
+    while count_variable in variables:
+        count_variable = "_" + count_variable
+
+    query_for_count = \
+        prologue + \
+        "SELECT (COUNT(*) AS ?" + count_variable + ") WHERE { \n" + \
+        query_body + \
+        "\n}"
+
+    return query_for_count, count_variable
+
+
+def get_query_for_page(query, variables, limit, offset):
+    """Wraps a query into a sub-query, of which one page is selected with LIMIT and OFFSET, ordered by the
+    given variables so that the pages don't overlap. Its prologue (prefix and base declarations) is kept in front.
+    Returns None if the query is not a select query.
+
+    >>> get_query_for_page("SELECT ?s ?o WHERE { ?s ?p ?o }", ["s"], 3, 0).splitlines()[-3:]
+    ['ORDER BY ?s', 'LIMIT 3', 'OFFSET 0']
+    """
+
+    query_split = split_sparql_query(query)
+
+    if query_split is None or query_split[1] != "SELECT":
+        return None
+
+    # the variables of the query itself are not used, since the pages are ordered by the given variables only
+    prologue, query_form, query_body, _ = query_split
+
+    query_for_page = \
+        prologue + \
+        "SELECT * WHERE { \n" + \
+        query_body + \
+        "\n}\n"
+
+    if len(variables) > 0:
+        query_for_page += "ORDER BY " + " ".join([ "?" + variable for variable in variables ]) + "\n"
+
+    query_for_page += "LIMIT " + str(limit) + "\nOFFSET " + str(offset)
+
+    return query_for_page
+
+
+def get_query_for_batched_count(queries):
+    """Creates a single query counting the results of many select queries and all triples of the endpoint at once.
+    Each query is wrapped into a sub-select 'SELECT (COUNT(*) AS ?count_<n>)', these sub-selects being joined as
+    siblings, each resulting in exactly one row. The prologues of the queries are merged in front of it, thus queries
+    whose prologue contradicts those of the others or declares a base (or which are no select queries) are left out.
+    Returns the query for counting, a list of the count variables for each query (None for those left out) and the
+    count variable of all triples."""
+
+    declarations = collections.OrderedDict()
+    queries_split = []
+    variables = set()
+
+    for query in queries:
+
+        query_split = split_sparql_query(query)
+
+        if query_split is None or query_split[1] != "SELECT":
+            queries_split.append(None)
+            continue
+
+        # the prologue consists of 'BASE <iri>' and 'PREFIX name: <iri>' declarations
+        query_declarations = []
+        key = None
+        for kind, text, position in tokenize_sparql_query(query_split[0]):
+            if kind == "comment":
+                continue
+            elif kind == "name" and text.upper() == "BASE":
+                key = "BASE"
+            elif kind == "name" and text.upper() == "PREFIX":
+                key = "PREFIX"
+            elif kind == "name" and key == "PREFIX":
+                key = "PREFIX " + text
+            elif kind == "iri" and key is not None:
+                query_declarations.append((key, text))
+                key = None
+
+        # a base declaration would change the meaning of relative IRIs in the other queries
+        if any(key == "BASE" or (key in declarations and declarations[key] != iri) for key, iri in query_declarations):
+            queries_split.append(None)
+            continue
+
+        declarations.update(query_declarations)
+        queries_split.append(query_split)
+        variables.update(query_split[3])
+
+    # choose count variables not clashing with any variable of the queries
+    count_variable_prefix = "count_"
+    while any(variable.startswith(count_variable_prefix) for variable in variables):
+        count_variable_prefix = "_" + count_variable_prefix
+
+    query_for_count = ""
+    for key, iri in declarations.items():
+        query_for_count += key + " " + iri + "\n"
+
+    count_triples_variable = count_variable_prefix + "0"
+    query_for_count += \
+        "SELECT * WHERE {\n" + \
+        "{ SELECT (COUNT(*) AS ?" + count_triples_variable + ") WHERE {[][][]} }\n"
+
+    count_variables = []
+    for query_split in queries_split:
+
+        if query_split is None:
+            count_variables.append(None)
+            continue
+
+        count_variable = count_variable_prefix + str(len(count_variables) + 1)
+        count_variables.append(count_variable)
+
+        query_for_count += \
+            "{ SELECT (COUNT(*) AS ?" + count_variable + ") WHERE { \n" + \
+            query_split[2] + \
+            "\n} }\n"
+
+    query_for_count += "}"
+
+    return query_for_count, count_variables, count_triples_variable
+
+
+def create_template():
+    """Creates a template for the query collection file in the relative folder, where the script is executed"""
+
+    template = """
+
+
+# -------------------- OPTIONAL SETTINGS -------------------- 
+
+# title
+# defines the title of the whole set of queries
+# OPTIONAL, if not set, timestamp will be used
+title = \"TEST QUERIES\"
+
+
+# description
+# defines the textual and human-intended description of the purpose of these queries
+# OPTIONAL, if not set, nothing will be used or displayed
+description = \"This set of queries is used as a template for showcasing a valid query collection file.\"
+
+
+# output_destination
+# defines where to save the results, input can be: 
+# * a local path to a folder 
+# * a URL for a google sheets document  
+# * a URL for a google folder
+# * a sqlite database, as url like sqlite:///relative/path/results.db or sqlite:////absolute/path/results.db (each query
+#   gets a table of its own, the summary is written into the tables sparqlaborer_runs and sparqlaborer_queries)
+# NOTE: On windows, folders in a path use backslashes, in such a case it is mandatory to attach a 'r' in front of the quotes, e.g. r\"C:\\Users\\sresch\\..\"
+# In the other cases the 'r' is simply ignored; thus best would be to always leave it there.
+# OPTIONAL, if not set, folder of executed script will be used
+output_destination = r\".\"
+
+
+# output_format
+# defines the format in which the result data shall be saved (currently available: csv, tsv, xml, json, xlsx, parquet, arrow)
+# OPTIONAL, if not set, csv will be used
+output_format = \"csv\"
+
+
+# summary_sample_limit
+# defines how many rows shall be displayed in the summary
+# OPTIONAL, if not set, 5 will be used
+summary_sample_limit = 3
+
+
+# cooldown_between_queries
+# defines how many seconds should be waited between execution of individual queries in order to prevent exhaustion of Google API due to too many writes per time-interval. DEPRECATED: The rate of requests is limited adaptively now (see endpoint_rate_limit and google_sheets_rate_limit), which makes such pauses unnecessary
+# OPTIONAL, if not set, 0 will be used
+cooldown_between_queries = 0
+
+
+# write_empty_results
+# Should tabs be created in a summary file for queries which did not return results? Possible values are python boolean values: True, False
+# OPTIONAL, if not set, False will be used
+write_empty_results = False
+
+
+# count_the_results
+# defines if the results of each query should be counted by the endpoint, by executing an additional query for counting
+# at the same time as the query itself. If set to 'smart', the results are only counted by the endpoint if it's not clear
+# they were fetched completely, i.e. if they have as many lines as endpoint_max_rows (and were not fetched in pages, see
+# page_size below). Otherwise the number of fetched lines is used as their count, also if endpoint_max_rows is not set.
+# If set to 'batched', the results of all queries are counted with a single query (together with all triples in the
+# endpoint) before executing them, instead of one query for counting per query.
+# Possible values: True, False, \"smart\", \"batched\"
+# OPTIONAL, if not set, True will be used
+count_the_results = True
+
+
+# max_parallel_queries
+# defines how many queries should be executed at the same time against the endpoint. The results are nevertheless written in the order of the queries below.
+# Queries after one with a custom_meta_function are only started once it was executed, since it may change them.
+# Can be overridden with the command line argument '-p'
+# OPTIONAL, if not set, 1 will be used (i.e. the queries are executed one after another)
+max_parallel_queries = 1
+
+
+# endpoint_pool_size
+# defines how many persistent connections to the endpoint are kept open and shared by all queries during a run
+# OPTIONAL, if not set, the value of max_parallel_queries multiplied by max_parallel_pages will be used
+# (plus max_parallel_queries, if count_the_results is True or 'batched')
+# endpoint_pool_size = 4
+
+
+# endpoint_idle_timeout
+# defines after how many seconds an unused connection to the endpoint is discarded and replaced by a new one
+# OPTIONAL, if not set, 30 will be used
+endpoint_idle_timeout = 30
+
+
+# endpoint_timeout
+# defines after how many seconds of waiting for the endpoint (for connecting, or for the next part of its response) a
+# request fails. Failed requests are retried as defined by max_retries.
+# OPTIONAL, if not set, None will be used (i.e. there is no timeout)
+endpoint_timeout = None
+
+
+# cache_ttl
+# defines for how many seconds the results of queries are cached on disk. As long as a cached result is younger than this, 
+# re-running this file uses the cached result instead of executing the same query again against the same endpoint. 
+# Cached results are marked as such in the summary. Use the command line argument '--refresh' to replace cached results
+# with fresh ones, or '--no-cache' to not use the cache at all.
+# OPTIONAL, if not set, 0 will be used (i.e. no results are cached)
+cache_ttl = 0
+
+
+# cache_folder
+# defines the folder in which cached results are stored
+# OPTIONAL, if not set, 'SparqLaborer_cache' will be used
+cache_folder = r\"SparqLaborer_cache\"
+
+
+# cache_max_size
+# defines how many megabytes the cached results may take up at most. If exceeded, the least recently used results are deleted.
+# OPTIONAL, if not set, 1024 will be used
+cache_max_size = 1024
+
+
+# stream_results
+# Should results be read and written incrementally, instead of being loaded into memory as a whole? This keeps the memory 
+# usage bounded by the stream_buffer_size regardless of the size of the results, which is useful for very big results.
+# Note that with streaming only the header and the sample rows are kept in the 'results_matrix' of a query.
+# Currently available for the formats: csv, tsv, xml, json, xlsx, parquet, arrow
+# Possible values are python boolean values: True, False
+# OPTIONAL, if not set, False will be used
+stream_results = False
+
+
+# stream_buffer_size
+# defines how many kilobytes of a streamed result are kept in memory at most, the rest is buffered in a temporary file
+# OPTIONAL, if not set, 1024 will be used
+stream_buffer_size = 1024
+
+
+# max_parallel_pages
+# defines how many pages of a query with a page_size (see below) are fetched at the same time against the endpoint.
+# The pages are nevertheless merged in their order.
+# OPTIONAL, if not set, 1 will be used (i.e. the pages are fetched one after another)
+max_parallel_pages = 1
+
+
+# page_retries
+# defines how often fetching a page of a query with a page_size is retried, should it fail (e.g. due to a timeout),
+# before the whole query is given up
+# OPTIONAL, if not set, 2 will be used
+page_retries = 2
+
+
+# endpoint_max_rows
+# defines the maximum number of rows the endpoint returns for a query (e.g. 'ResultSetMaxRows' of Virtuoso), beyond which
+# results are cut off silently. Used if count_the_results is 'smart', and for reducing the page_size of queries to it.
+# OPTIONAL, if not set, results are regarded as complete
+# endpoint_max_rows = 10000
+
+
+# google_flush_requests
+# defines after how many requests to a google sheets file (creating sheets, formatting them or writing values into them)
+# these are sent together. Requests are queued and sent in as few calls as possible, at the latest at the end of the run,
+# which keeps the google api from being exhausted by too many calls.
+# OPTIONAL, if not set, 100 will be used
+google_flush_requests = 100
+
+
+# google_flush_cells
+# defines after how many cells of values queued for a google sheets file the queued requests are sent, which keeps the
+# size of the calls within the limits of the google api
+# OPTIONAL, if not set, 50000 will be used
+google_flush_cells = 50000
+
+
+# max_parallel_uploads
+# defines how many chunks of values are written into a google sheets file at the same time. Values of big results are
+# split into chunks of rows of up to google_flush_cells cells, each written with its own call.
+# OPTIONAL, if not set, 4 will be used
+max_parallel_uploads = 4
+
+
+# upload_retries
+# defines how often writing a chunk of values into a google sheets file is retried, should it fail (e.g. due to a timeout
+# or exceeded quota), before the whole run is given up
+# OPTIONAL, if not set, 2 will be used
+upload_retries = 2
+
+
+# endpoint_rate_limit
+# defines how many requests per second are sent to the endpoint at most. Should the endpoint signal it's overloaded
+# (with http status 429 or 503), requests are paused for as long as it asks for (with a 'Retry-After' header, otherwise
+# for a second) and their rate is halved, to be increased again step by step with every successful request.
+# OPTIONAL, if not set, the rate is not limited (though requests are still paused if the endpoint is overloaded)
+# endpoint_rate_limit = 10
+
+
+# google_sheets_rate_limit
+# defines how many requests per second are sent to the google sheets api at most, adapting to it like endpoint_rate_limit
+# OPTIONAL, if not set, 1 will be used (the default quota of the google sheets api being 60 requests per minute and user)
+google_sheets_rate_limit = 1
+
+
+# google_drive_rate_limit
+# defines how many requests per second are sent to the google drive api at most, adapting to it like endpoint_rate_limit
+# OPTIONAL, if not set, 10 will be used
+google_drive_rate_limit = 10
+
+
+# max_retries
+# defines how often requests to the endpoint or to google apis are retried, should they fail due to a transient error
+# (e.g. a timeout, an internal error of the service, or exceeded quota). Errors caused by the request itself (e.g. a badly
+# formed query) are not retried. The retries of each query are listed in the summary.
+# Pages of queries and chunks of values for google sheets are retried as often as page_retries and upload_retries define.
+# OPTIONAL, if not set, 3 will be used
+max_retries = 3
+
+
+# retry_backoff
+# defines how many seconds are waited at most before the first retry of a request, doubled with every further retry.
+# The actual wait is chosen randomly up to that, so that requests failed at the same time are not retried all at once.
+# OPTIONAL, if not set, 1 will be used
+retry_backoff = 1
+
+
+# retry_max_backoff
+# defines how many seconds are waited at most before any retry of a request
+# OPTIONAL, if not set, 60 will be used
+retry_max_backoff = 60
+
+
+# max_parallel_variants
+# defines how many variants are run at the same time, if multiple values are given for settings (e.g. a list of endpoints
+# or output_destinations). Each variant is run in its own process, independent of the others, writing its own log file
+# 'SparqLaborer (variant n).log'. Note that google authentication with a client_secret is only supported with variants
+# run one after another (unless the resulting credentials.json already exists).
+# OPTIONAL, if not set, 1 will be used (i.e. the variants are run one after another)
+max_parallel_variants = 1
+
+
+# output_compression
+# defines how the csv, tsv, xml and json result files written into a local folder are compressed while they are written
+# (currently available: gzip, zstd, xz), which saves a lot of disk space and I/O for big results. The extension of the
+# compression is appended to the file names (.gz, .zst or .xz). Parquet, arrow and xlsx files are not affected, as they
+# are compressed already. Note that zstd requires the package zstandard (pip install zstandard).
+# OPTIONAL, if not set, None will be used (i.e. result files are not compressed)
+output_compression = None
+
+
+# output_compression_level
+# defines the level of the output_compression, higher levels compressing better but slower (gzip and xz: 0 to 9, zstd: 1 to 22)
+# OPTIONAL, if not set, None will be used (i.e. the default level of the compression: 6 for gzip and xz, 3 for zstd)
+output_compression_level = None
+
+
+# output_compression_threads
+# defines how many threads compress a result file at the same time. Only used by zstd, gzip and xz always use one thread.
+# OPTIONAL, if not set, 1 will be used
+output_compression_threads = 1
+
+
+# -------------------- MANDATORY SETTINGS -------------------- 
+
+# endpoint
+# defines the SPARQL endpoint against which all the queries are run
+# MANDATORY
+endpoint = \"http://dbpedia.org/sparql\"
+
+# queries
+# defines the set of queries to be run. 
+# MANDATAORY
+queries = [
+    {
+        # title
+        # OPTIONAL, if not set, timestamp will be used
+        \"title\" : \"Optional title of first query\" ,
+
+        # description
+        # OPTIONAL, if not set, nothing will be used or displayed
+        \"description\" : \"Optional description of first query, used to describe the purpose of the query.\" ,
+
+        # page_size
+        # fetches the results in pages of this many lines, each page being requested by an ordered LIMIT and OFFSET,
+        # until a page returns fewer lines. Useful for endpoints which cut off or time out on large results.
+        # The results of select queries fetched in pages are always streamed (see stream_results).
+        # OPTIONAL, if not set, all results are fetched with a single request
+        # \"page_size\" : 10000 ,
+
+        # indexes
+        # the columns to be indexed, if the results are written into a sqlite database (see output_destination). Given as
+        # tuple of names of columns, each indexed on its own, or of tuples of names, each indexed together.
+        # OPTIONAL, if not set, no indexes are created
+        # \"indexes\" : (\"s\", (\"s\", \"o\")) ,
+
+        # query
+        # the sparql query itself
+        # NOTE: best practise is to attach a 'r' before the string so that python would not interpret some characters as metacharacters, e.g. \"\\n\"
+        # MANDATORY
+        \"query\" : r\"\"\"
+            SELECT * WHERE {
+                ?s ?p ?o
+            }
+            LIMIT 50
+        \"\"\"
+    },   
+    {    
+        \"title\" : \"Second query\" , 
+        \"description\" : \"This query returns all triples which have a label associated\" , 
+        \"query\" : r\"\"\"
+            SELECT * WHERE {
+                ?s <http://www.w3.org/2000/01/rdf-schema#label> ?o
+            }
+            LIMIT 50
+        \"\"\"
+    },
+    {    
+        \"query\" : r\"\"\"
+            SELECT * WHERE {
+                ?s ?p ?o . 
+                FILTER ( ?p = <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> )
+            }
+            LIMIT 50
+        \"\"\"
+    },
+]
+
+# Each query is itself encoded as a python dictionary, and together these dictionaries are collected in a python list. 
+# Beginner's note on such syntax as follows:
+# * the set of queries is enclosed by '[' and ']'
+# * individual queries are enclosed by '{' and '},'
+# * All elements of a query (title, description, query) need to be defined using quotes as well as their contents, and both need to be separated by ':'
+# * All elements of a query (title, description, query) need to be separated from each other using quotes ','
+# * The content of a query needs to be defined using triple quotes, e.g. \"\"\" SELECT * WHERE .... \"\"\"
+# * Any indentation (tabs or spaces) do not influence the queries-syntax, they are merely syntactic sugar.
+
+
+
+# --------------- CUSTOM POST-PROCESSING METHOD --------------- 
+'''
+The method 'custom_post_processing(results)' is a stump for custom post processing which is always called if present and to which
+result data from the query execution is passed. This way you can implement your own post-processing steps there.
+
+The incoming 'results' argument is a list, where each list-element is a dictionary represting all data of a query.
+
+This dictionary has the following keys and respective values:
+
+* most likely to be needed are these two keys and values:
+'query_title' - title of an individual query, as defined above.
+'results_matrix' - the result data organized like a two dimensional list, where the first row contains the headers. (Internally the data is stored column by column for compactness, where its rows are provided as read-only views behaving like lists.) 
+This value is what you would most likely need to post process the result data.  
+
+* other than these two, each query dictionary also contains data from and for SparqLaborer, which might be of use:
+'query_description' - description of an individual query, as defined above.
+'query_text' - the sparql query itself.
+'results_execution_duration' - the duration it took to run the sparql query.
+'results_lines_count' - the number of lines the sparql query produced at the triplestore.
+'results_raw' - the result data in the specified format, as the raw bytes returned by the endpoint (or as a binary file, if stream_results is set or the query is fetched in pages).
+'query_for_count' - an infered query from the original query, is used to get number of result lines at the triplestore.
+
+As an example to print the raw data from the second query defined above, write:
+print(results[1].results_matrix)
+'''
+
+# UNCOMMENT THE FOLLOWING LINES FOR A QUICKSTART:
+'''    
+def custom_post_processing(results):
+
+    print(\"\\n\\Samples from the raw data:\\n\")
+
+    for result in results:
+
+        print(\"some results of query: \" + result.title)
+
+        limit = 5 if len(result.results_matrix) > 5 else len(result.results_matrix)
+        for i in range(0, limit):
+            print(result.results_matrix[i])
+
+        print()
+'''
+"""
+
+    with open('template.py', 'w') as f:
+        f.write(template)
+
+
+class Output_writer:
+    """the Output_writer Class encapsulates all technical details which vary due to the specified output destinations"""
+
+    # general variables
+    output_destination_type = None
+    summary_sample_limit = None
+    stream_buffer_size = None
+    line_number = None
+
+    # local folder and xlsx variables
+    folder = None
+    file_xlsx = None
+    xlsx_workbook = None
+    xlsx_worksheet_summary = None
+    output_format = None
+    bold_format = None
+    title_2_format = None
+    query_text_format = None
+    date_format = None
+
+    # Datetimes are written as such into xlsx files, which don't support timezones (nor infinite floats).
+    # Since all sheets are written row by row, the rows are flushed to disk as soon as they are written,
+    # instead of holding all of them in memory until the workbook is closed.
+    xlsx_workbook_options = {
+        'default_date_format': 'yyyy-mm-dd hh:mm:ss',
+        'remove_timezone': True,
+        'nan_inf_to_errors': True,
+        'constant_memory': True
+    }
+
+    # maximum number of rows of a sheet in a xlsx file
+    xlsx_max_rows = 1048576
+
+    # number of rows written at once into parquet and arrow files, i.e. the rows of a row group of a parquet file
+    arrow_batch_size = 65536
+
+    # journal of a run writing into a local folder, by which it can be resumed
+    run_journal = None
+
+    # compression of the result files written into a local folder, by the extensions and default levels of the compressions
+    output_compression = None
+    output_compression_level = None
+    output_compression_threads = None
+    output_compression_extensions = { "gzip": ".gz", "zstd": ".zst", "xz": ".xz" }
+    output_compression_levels = { "gzip": (6, 9), "zstd": (3, 22), "xz": (6, 9) }
+
+    # sqlite variables
+    file_sqlite = None
+    sqlite_connection = None
+    sqlite_timestamp_start = None
+    sqlite_collection_title = None
+
+    # number of rows inserted into a table of a sqlite database at once, all rows of a query being inserted in one transaction
+    sqlite_batch_size = 10000
+
+    # types of the columns of the tables in a sqlite database, by the inferred types of the columns of the results
+    sqlite_column_types = {
+        "int": "INTEGER",
+        "decimal": "REAL",
+        "float": "REAL",
+        "boolean": "INTEGER",
+        "date": "TEXT",
+        "datetime": "TEXT",
+        "string": "TEXT",
+    }
+
+    # google folder and sheets variables
+    google_service_sheets = None
+    google_service_drive = None
+    google_sheets_id = None
+    google_sheets_summary_sheet_id = None
+    google_sheets_next_sheet_id = None
+    google_sheets_summary_column_count = None
+
+    # requests to google sheets are queued and sent together, once the thresholds are exceeded or at the end of the run
+    google_flush_requests = None
+    google_flush_cells = None
+    google_requests_pending = None
+    google_values_pending = None
+    google_cells_pending = None
+
+    # chunks of values are written by a pool of threads, each of which uses its own service, as these are not thread-safe
+    google_credentials = None
+    google_thread_local = None
+    google_upload_executor = None
+    upload_retries = None
+
+    # limit the rates of requests to the google apis, and retry them after transient errors
+    google_sheets_rate_limiter = None
+    google_drive_rate_limiter = None
+    google_retry_policy = None
+    google_retries = None
+
+    def __init__(self, query_collection_data_object):
+
+        def main():
+
+            message = "\n\n################################\n" + \
+            "Setting up output destination: " + query_collection_data_object.output_destination + "\n"
+            logging.info(message)
+            print(message)
+
+            self.summary_sample_limit = query_collection_data_object.summary_sample_limit
+            self.write_empty_results = query_collection_data_object.write_empty_results
+            self.stream_buffer_size = query_collection_data_object.stream_buffer_size * 1024
+            self.google_flush_requests = query_collection_data_object.google_flush_requests
+            self.google_flush_cells = query_collection_data_object.google_flush_cells
+            self.google_requests_pending = []
+            self.google_values_pending = []
+            self.google_cells_pending = 0
+            self.upload_retries = query_collection_data_object.upload_retries
+
+
+            # output_destination_type, interpret from string (unless an interrupted run is resumed, which can only
+            # have written into a local folder, since only such runs have a journal)
+
+            if query_collection_data_object.resume_folder is not None:
+                self.output_destination_type = "local_folder"
+                logging.info("output_destination_type of resumed run: " + self.output_destination_type)
+                init_local_folder()
+
+            elif query_collection_data_object.output_destination.startswith("sqlite:///"):
+                self.output_destination_type = "sqlite"
+                logging.info("deduced output_destination_type: " + self.output_destination_type)
+                init_sqlite()
+
+            elif "google.com/drive/folders" in query_collection_data_object.output_destination:
+                self.output_destination_type = "google_folder"
+                logging.info("deduced output_destination_type: " + self.output_destination_type)
+                init_google_folder()
+
+            elif "google.com/spreadsheets" in query_collection_data_object.output_destination:
+                self.output_destination_type = "google_sheets"
+                logging.info("deduced output_destination_type: " + self.output_destination_type)
+                init_google_sheets()
+
+            elif query_collection_data_object.output_format == "XLSX" :
+                self.output_destination_type = "local_xlsx"
+                logging.info("deduced output_destination_type: " + self.output_destination_type)
+                init_local_xlsx()
+
+            else:
+                self.output_destination_type = "local_folder"
+                logging.info("deduced output_destination_type: " + self.output_destination_type)
+                init_local_folder()
+
+
+        def init_local_xlsx():
+            """Creates a xlsx file in the respective folder"""
+
+            # if locally saved, then "/" needs to be replaced with "-", since otherwise "/" would be interpreted as subfolder
+            file_name = query_collection_data_object.title.replace("/", "-")
+
+            # get or create folder for xlsx file
+            self.folder = Path(str(query_collection_data_object.output_destination))
+            self.folder.mkdir(parents=True, exist_ok=True)
+
+            # create xlsx file
+            self.file_xlsx = Path(
+                self.folder / str(query_collection_data_object.timestamp_start + " - " + file_name + ".xlsx") )
+            self.xlsx_workbook = xlsxwriter.Workbook(self.file_xlsx.open('wb'), self.xlsx_workbook_options)
+            self.xlsx_worksheet_summary = self.xlsx_workbook.add_worksheet("0. Summary")
+
+            message = "Created local file: " + str(self.file_xlsx)
+            logging.info(message)
+            print(message)
+
+
+        def init_local_folder():
+            """Creates a folder (for the raw ouput) and a xlsx file (for the summary) in the respective folder"""
+
+            # if locally saved, then "/" needs to be replaced with "-", since otherwise "/" would be interpreted as subfolder
+            folder_name = query_collection_data_object.title.replace("/", "-")
+
+
+            # compression of the result files, its level defaulting to the usual one of the compression
+
+            self.output_compression = query_collection_data_object.output_compression
+            self.output_compression_threads = query_collection_data_object.output_compression_threads
+
+            if self.output_compression is not None:
+
+                default_level, max_level = self.output_compression_levels[self.output_compression]
+                self.output_compression_level = query_collection_data_object.output_compression_level
+
+                if self.output_compression_level is None:
+                    self.output_compression_level = default_level
+
+                elif self.output_compression_level > max_level:
+                    message = "\nERROR: Invalid output_compression_level " + str(self.output_compression_level) + \
+                              " for " + self.output_compression + ", which supports levels up to " + str(max_level)
+                    logging.error(message)
+                    sys.exit(message)
+
+
+            # create folder for queries and summary, along with the journal of the run,
+            # or continue the journal of an interrupted run in its folder
+
+            if query_collection_data_object.resume_folder is None:
+
+                self.folder = Path(str(
+                    query_collection_data_object.output_destination + "/" +
+                    query_collection_data_object.timestamp_start + " - " +
+                    folder_name))
+
+                self.folder.mkdir(parents=True, exist_ok=False)
+
+                self.run_journal = Run_journal(self.folder, {
+                    "query_collection_file": str(Path(query_collection_data_object.query_collection_filename).resolve()),
+                    "timestamp_start": query_collection_data_object.timestamp_start,
+                    "variant": query_collection_data_object._current_multi_value,
+                    "title": query_collection_data_object.title
+                })
+
+                message = "Created local folder: " + str(self.folder)
+
+            else:
+
+                self.folder = Path(query_collection_data_object.resume_folder)
+                self.run_journal = Run_journal(self.folder)
+
+                message = "Resuming run in local folder: " + str(self.folder) + ", " + \
+                          str(len(self.run_journal.queries)) + " queries were written already"
+
+            self.output_format = query_collection_data_object.output_format
+
+
+            # Create xlsx file for summary (anew, if resumed), its calls being recorded for the journal
+
+            self.file_xlsx = Path(self.folder / "0. Summary.xlsx")
+            self.xlsx_workbook = xlsxwriter.Workbook(self.file_xlsx.open('wb'), self.xlsx_workbook_options)
+            self.xlsx_worksheet_summary = Summary_recorder(self.xlsx_workbook.add_worksheet("0. Summary"))
+
+            logging.info(message)
+            print(message)
+
+
+        def init_sqlite():
+            """Opens (or creates) the sqlite database, and creates its tables for the summary if these don't exist yet"""
+
+            # as in the urls of sqlalchemy, sqlite:///file.db is a relative path and sqlite:////folder/file.db an absolute one
+            self.file_sqlite = Path(query_collection_data_object.output_destination[len("sqlite:///"):])
+            self.file_sqlite.parent.mkdir(parents=True, exist_ok=True)
+
+            # transactions are begun and committed explicitly, parallel variants wait for each other's transactions
+            self.sqlite_connection = sqlite3.connect(str(self.file_sqlite), timeout=600, isolation_level=None)
+            self.sqlite_timestamp_start = query_collection_data_object.timestamp_start
+            self.sqlite_collection_title = query_collection_data_object.title
+
+            self.sqlite_connection.execute(
+                "CREATE TABLE IF NOT EXISTS sparqlaborer_runs ("
+                "timestamp_start TEXT, title TEXT, description TEXT, endpoint TEXT, "
+                "count_triples_in_endpoint TEXT, timestamp_cached TEXT, error_message TEXT)")
+            self.sqlite_connection.execute(
+                "CREATE TABLE IF NOT EXISTS sparqlaborer_queries ("
+                "timestamp_start TEXT, collection_title TEXT, id INTEGER, title TEXT, description TEXT, query TEXT, "
+                "table_name TEXT, execution_duration REAL, pages_durations TEXT, retries_count INTEGER, "
+                "timestamp_cached TEXT, column_types TEXT, lines_count INTEGER, rows_count INTEGER, error_message TEXT)")
+
+            message = "Opened sqlite database: " + str(self.file_sqlite)
+            logging.info(message)
+            print(message)
+
+
+        def init_google_services():
+            """Instantiates all necessary services for writing results to a specified google folder / sheets-file"""
+
+            SCOPES = "https://www.googleapis.com/auth/drive"
+
+            # Hardwired credentials
+            #
+            # !!! CAUTION !!!
+            #
+            # POSSIBILITY OF GRANTING FULL ACCESS TO YOUR PRIVATE GOOGLE DRIVE
+            #
+            # For ease of usage on your local machine, you can hardwire your credentials here
+            # BUT ONLY DO THIS IF YOU NEVER SHARE THIS MODIFIED SCRIPT
+            #
+            # NEVER INSERT YOUR CREDENTIALS IF YOU WILL SHARE THIS SCRIPT!!
+
+
+            # UNCOMMENT THE FOLLOWING LINES AND INSERT CONTENT OF CREDENTIALS.JSON FILE THERE
+            # creds_hardcoded = json.loads("""
+            #
+            # """)
+
+            # COMMENT OR DELETE THIS LINE
+            creds_hardcoded = None
+
+
+            # use credentials file if available
+
+            if query_collection_data_object.credentials_path:
+                creds = client.GoogleCredentials.from_json(open(query_collection_data_object.credentials_path).read())
+
+            # if no credentials file is available, then create one using client_secret
+            elif query_collection_data_object.client_secret_path:
+                store = file.Storage('credentials.json')
+                flow = client.flow_from_clientsecrets(query_collection_data_object.client_secret_path, SCOPES)
+
+                # note: adding 'tools.argparser.parse_args(args=[])' here is important, otherwise
+                # oauth2client.tools would parse the main command line arguments
+                creds = tools.run_flow(flow, store, tools.argparser.parse_args(args=[]))
+
+            elif creds_hardcoded:
+
+                creds = GoogleCredentials(
+                    creds_hardcoded['access_token'],
+                    creds_hardcoded['client_id'],
+                    creds_hardcoded['client_secret'],
+                    creds_hardcoded['refresh_token'],
+                    creds_hardcoded['token_expiry'],
+                    creds_hardcoded['token_uri'],
+                    creds_hardcoded['user_agent'],
+                    creds_hardcoded['revoke_uri']
+                )
+
+            # if neither is available, abort
+            else:
+                message = "\nERROR: No client_secret.json or credentials.json provided nor found in local folder!."
+                logging.error(message)
+                sys.exit(message)
+
+            # create services to be used by write functions
+            if not creds.invalid:
+                self.google_service_drive = discovery.build('drive', 'v3', http=creds.authorize(Http()))
+                self.google_service_sheets = discovery.build('sheets', 'v4', http=creds.authorize(Http()))
+                self.google_credentials = creds
+                self.google_thread_local = threading.local()
+                self.google_upload_executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=query_collection_data_object.max_parallel_uploads)
+                self.google_sheets_rate_limiter = Rate_limiter(
+                    "Google sheets api", query_collection_data_object.google_sheets_rate_limit)
+                self.google_drive_rate_limiter = Rate_limiter(
+                    "Google drive api", query_collection_data_object.google_drive_rate_limit)
+                self.google_retry_policy = Retry_policy(
+                    query_collection_data_object.max_retries,
+                    query_collection_data_object.retry_backoff,
+                    query_collection_data_object.retry_max_backoff)
+                self.google_retries = []
+            else:
+                message = "\nERROR: Invalid credentials!"
+                logging.error(message)
+                sys.exit(message)
+
+
+        def init_google_sheets():
+            """Formats the give google sheets file, deletes old content and creates a summary-sheet"""
+
+            init_google_services()
+
+
+            # get id of google sheets file by extracting it from the url
+
+            self.google_sheets_id = query_collection_data_object.output_destination\
+                .split("docs.google.com/spreadsheets/d/",1)[1]\
+                .split("/",1)[0]
+            logging.info("ID of google sheets : " + str(self.google_sheets_id))
+
+            # get list of existing sheets in sheets file
+            google_sheets_metadata = self.execute_google_request(
+                self.google_service_sheets.spreadsheets().get(spreadsheetId=self.google_sheets_id),
+                self.google_sheets_rate_limiter, "Reading google sheets")
+            all_sheet = google_sheets_metadata['sheets']
+
+            # the ids of new sheets are chosen here, so that requests referring to them can be queued before they exist
+            self.google_sheets_summary_sheet_id = max([ sheet['properties']['sheetId'] for sheet in all_sheet ]) + 1
+            self.google_sheets_next_sheet_id = self.google_sheets_summary_sheet_id + 1
+            self.google_sheets_summary_column_count = 26
+
+
+            # create new sheet reserved for summary
+
+            body_create_summary_page = {
+                "requests": [
+                    {
+                        "addSheet": {
+                            "properties": {
+                                "sheetId": self.google_sheets_summary_sheet_id,
+                                "gridProperties": {
+                                    "columnCount": 26
+                                }
+                            }
+                        }
+                    }
+                ]
+            }
+
+            self.queue_google_sheets_requests(body_create_summary_page['requests'])
+
+
+            # delete all sheets except summary
+
+            body_sheet_to_delete = { 'requests' : [] }
+            for sheet in all_sheet:
+                tmp = {
+                    "deleteSheet": {
+                        "sheetId": sheet['properties']['sheetId']
+                    }
+                }
+                body_sheet_to_delete['requests'].append(tmp)
+
+            self.queue_google_sheets_requests(body_sheet_to_delete['requests'])
+
+
+            # rename summary sheet to '0. Summary'
+
+            body_to_rename = {
+                "requests" : [
+                    {
+                        "updateSheetProperties": {
+                            "properties": {
+                                "sheetId": self.google_sheets_summary_sheet_id,
+                                "title": "0. Summary",
+                            },
+                            "fields": "title",
+                        }
+                    },
+                    {
+                        "updateDimensionProperties": {
+                            "range": {
+                                "sheetId": self.google_sheets_summary_sheet_id,
+                                "dimension": "COLUMNS",
+                                "startIndex": 0,
+                                "endIndex":26
+                            },
+                            "properties": {
+                                "pixelSize": 350
+                            },
+                            "fields": "pixelSize"
+                        }
+                    }
+                ]
+            }
+            self.queue_google_sheets_requests(body_to_rename['requests'])
+
+
+        # google folder
+        def init_google_folder():
+            """Creates a new google sheets file inside the specified google folder"""
+
+            init_google_services()
+
+            # get id of google folder by extracting it from the url
+            self.google_folder_id = query_collection_data_object.output_destination\
+                .split("drive.google.com/drive/folders/",1)[1]\
+                .split("?",1)[0]
+            logging.info("ID of google folder : " + str(self.google_folder_id))
+
+            # Create google sheets file in folder
+            body_spreadsheet = {
+                'name': query_collection_data_object.timestamp_start + " - " + query_collection_data_object.title,
+                'mimeType': 'application/vnd.google-apps.spreadsheet',
+                'parents': [self.google_folder_id]
+            }
+            sheets = self.execute_google_request(
+                self.google_service_drive.files().create(body=body_spreadsheet),
+                self.google_drive_rate_limiter, "Creating google sheets")
+            self.google_sheets_id = sheets['id']
+            self.google_sheets_summary_sheet_id = 0
+            self.google_sheets_next_sheet_id = 1
+            self.google_sheets_summary_column_count = 26
+
+            # Sets name of first sheet to summary, sets up column width
+            body_to_rename = {
+                "requests": [
+                    {
+                        "updateSheetProperties": {
+                            "properties": {
+                                "sheetId": self.google_sheets_summary_sheet_id,
+                                "title": "0. Summary",
+                            },
+                            "fields": "title",
+                        }
+                    },
+                    {
+                        "updateDimensionProperties": {
+                            "range": {
+                                "sheetId": self.google_sheets_summary_sheet_id,
+                                "dimension": "COLUMNS",
+                                "startIndex": 0,
+                                "endIndex":26
+                            },
+                            "properties": {
+                                "pixelSize": 300
+                            },
+                            "fields": "pixelSize"
+                        }
+                    }
+                ]
+            }
+            self.queue_google_sheets_requests(body_to_rename['requests'])
+
+            message = "Created google sheets at: " + "docs.google.com/spreadsheets/d/" + self.google_sheets_id
+            logging.info(message)
+            print(message)
+
+        main()
+
+
+    def write_header_summary(self, query_collection_data_object):
+        """Writes the initial header to the summary sheet"""
+
+        def main(query_collection_data_object):
+
+            if self.output_destination_type == 'local_folder' and self.run_journal.header is not None:
+                write_summary_of_journal_xlsx_file()
+
+            elif self.output_destination_type == 'local_folder' or self.output_destination_type == 'local_xlsx':
+                write_header_summary_xlsx_file(query_collection_data_object)
+
+                if self.output_destination_type == 'local_folder':
+                    self.run_journal.header = {
+                        "summary": self.xlsx_worksheet_summary.take_calls(),
+                        "line_number": self.line_number
+                    }
+                    self.run_journal.record({ "header": self.run_journal.header })
+
+            elif self.output_destination_type == 'sqlite':
+                write_header_summary_sqlite(query_collection_data_object)
+
+            elif self.output_destination_type == 'google_folder' or self.output_destination_type == 'google_sheets':
+                write_header_summary_google_sheet(query_collection_data_object)
+
+
+        def write_header_summary_xlsx_file(query_collection_data_object):
+            """Writes header to xlsx file"""
+
+            message = "Writing header to summary in local xslx"
+            logging.info(message)
+            print(message)
+
+            # setup and formats
+            self.xlsx_worksheet_summary.set_column('A:Z', 70)
+            create_formats_xlsx_file()
+
+            # Write header to xlsx
+            self.xlsx_worksheet_summary.set_row(0, 20)
+            self.line_number = 0
+            self.xlsx_worksheet_summary.write(self.line_number, 0, query_collection_data_object.title, self.title_format)
+            if query_collection_data_object.description is not None:
+                self.xlsx_worksheet_summary.write(self.line_number + 1, 0, query_collection_data_object.description)
+                self.line_number += 1
+            self.line_number += 2
+            self.xlsx_worksheet_summary.write(self.line_number, 0, "Execution timestamp of script: " + query_collection_data_object.timestamp_start)
+            self.line_number += 1
+            if query_collection_data_object.header_error_message is None:
+                self.xlsx_worksheet_summary.write(self.line_number, 0, "Endpoint: " + query_collection_data_object.endpoint)
+                self.line_number += 1
+                self.xlsx_worksheet_summary.write(self.line_number, 0, "Total count of triples in endpoint: " + query_collection_data_object.count_triples_in_endpoint)
+                if query_collection_data_object.count_triples_in_endpoint_timestamp_cached is not None:
+                    self.line_number += 1
+                    self.xlsx_worksheet_summary.write(self.line_number, 0, self.get_cached_message(query_collection_data_object.count_triples_in_endpoint_timestamp_cached))
+            else:
+                self.xlsx_worksheet_summary.write(self.line_number, 0, query_collection_data_object.header_error_message)
+            self.line_number += 4
+
+
+        def write_header_summary_sqlite(query_collection_data_object):
+            """Writes header as row of the table sparqlaborer_runs into the sqlite database"""
+
+            message = "Writing header to summary in sqlite database"
+            logging.info(message)
+            print(message)
+
+            if query_collection_data_object.header_error_message is None:
+                endpoint = query_collection_data_object.endpoint
+                count_triples_in_endpoint = query_collection_data_object.count_triples_in_endpoint
+                timestamp_cached = query_collection_data_object.count_triples_in_endpoint_timestamp_cached
+            else:
+                endpoint = None
+                count_triples_in_endpoint = None
+                timestamp_cached = None
+
+            self.sqlite_connection.execute(
+                "INSERT INTO sparqlaborer_runs VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (query_collection_data_object.timestamp_start, query_collection_data_object.title,
+                 query_collection_data_object.description, endpoint, count_triples_in_endpoint,
+                 None if timestamp_cached is None else time.strftime('%y%m%d_%H%M%S', time.localtime(timestamp_cached)),
+                 query_collection_data_object.header_error_message))
+
+
+        def create_formats_xlsx_file():
+            """Creates the formats of the xlsx file, registering them with the recorder of the summary, if it has one"""
+
+            self.title_format = self.xlsx_workbook.add_format({'bold': True})
+            self.title_format.set_font_size(16)
+            self.title_2_format = self.xlsx_workbook.add_format({'bold': True})
+            self.title_2_format.set_font_size(12)
+            self.query_text_format = self.xlsx_workbook.add_format({'text_wrap': True})
+            self.bold_format = self.xlsx_workbook.add_format({'bold': True})
+            self.date_format = self.xlsx_workbook.add_format({'num_format': 'yyyy-mm-dd'})
+
+            if type(self.xlsx_worksheet_summary) is Summary_recorder:
+                self.xlsx_worksheet_summary.add_formats({
+                    "title": self.title_format,
+                    "title_2": self.title_2_format,
+                    "query_text": self.query_text_format,
+                    "bold": self.bold_format,
+                    "date": self.date_format
+                })
+
+
+        def write_summary_of_journal_xlsx_file():
+            """Writes the header and the summaries of the queries written by the interrupted run anew, as recorded in its
+            journal, instead of the header of the resumed run"""
+
+            message = "Writing summary of interrupted run to summary in local xslx"
+            logging.info(message)
+            print(message)
+
+            create_formats_xlsx_file()
+
+            self.xlsx_worksheet_summary.replay(self.run_journal.header["summary"])
+            self.line_number = self.run_journal.header["line_number"]
+
+            for query_id in sorted(self.run_journal.queries):
+                self.xlsx_worksheet_summary.replay(self.run_journal.queries[query_id]["summary"])
+                self.line_number = self.run_journal.queries[query_id]["line_number"]
+
+
+        def write_header_summary_google_sheet(query_collection_data_object):
+            """Writes header to google sheets file"""
+
+            message = "Writing header to summary in google sheets"
+            logging.info(message)
+            print(message)
+
+            # create header info
+            self.line_number = 0
+            header = []
+            header.append([query_collection_data_object.title])
+            if query_collection_data_object.description is not None:
+                header.append([query_collection_data_object.description])
+            header.append([])
+            header.append(
+                ["Execution timestamp of script: " +
+                 query_collection_data_object.timestamp_start])
+            if query_collection_data_object.header_error_message is None:
+                header.append(["endpoint: " + query_collection_data_object.endpoint])
+                header.append(
+                    ["Total count of triples in endpoint: " +
+                     query_collection_data_object.count_triples_in_endpoint])
+                if query_collection_data_object.count_triples_in_endpoint_timestamp_cached is not None:
+                    header.append([self.get_cached_message(query_collection_data_object.count_triples_in_endpoint_timestamp_cached)])
+            else:
+                header.append([query_collection_data_object.header_error_message])
+
+
+            # write header to sheet
+            self.queue_google_sheets_values("0. Summary", self.line_number, 0, header)
+            self.line_number += len(header) + 3
+
+        main(query_collection_data_object)
+
+
+    def write_query_result(self, query_data_object):
+        """Writes results of query to the respective output destination"""
+
+        def main(query_data_object):
+
+            if len(query_data_object.results_matrix) > 1 or self.write_empty_results:
+                message = "Writing results to output_destination"
+                logging.info(message)
+                print(message)
+
+                if self.output_destination_type == 'local_xlsx':
+                    write_query_result_to_xlsx_file(query_data_object)
+
+                elif self.output_destination_type == 'local_folder':
+                    write_query_result_to_local_folder(query_data_object)
+
+                elif self.output_destination_type == 'sqlite':
+                    write_query_result_to_sqlite(query_data_object)
+
+                elif self.output_destination_type == 'google_sheets' or self.output_destination_type == 'google_folder':
+                    write_query_result_to_google_sheets(query_data_object)
+
+
+        def write_query_result_to_xlsx_file(query_data_object):
+            """Writes results as harmonized two-dimensional list into a separate sheet in the xlsl file"""
+
+            # create new worksheet and write into it
+            sanitized_query_title = query_data_object.title\
+                .replace("["," ") \
+                .replace("]"," ") \
+                .replace(":"," ") \
+                .replace("*"," ") \
+                .replace("?"," ") \
+                .replace("/"," ") \
+                .replace("\\"," ")
+
+            sanitized_query_title = str(query_data_object.id) + sanitized_query_title
+
+            if len(sanitized_query_title) > 30:
+                sanitized_query_title = sanitized_query_title[:29]
+
+            worksheet = self.xlsx_workbook.add_worksheet( sanitized_query_title )
+
+            # Rows are written whole and in order, which lets the workbook flush them to disk right away. Results
+            # exceeding the rows of a sheet are continued in further sheets, each starting with the header again.
+            rows = query_data_object.iterate_results_matrix()
+            header = next(rows)
+            write_header = self.get_xlsx_row_writer(None)
+            write_row = self.get_xlsx_row_writer(query_data_object.results_column_types)
+
+            write_header(worksheet, 0, header)
+            y = 1
+            sheet_number = 1
+
+            for row in rows:
+
+                if y == self.xlsx_max_rows:
+                    sheet_number += 1
+                    worksheet = self.xlsx_workbook.add_worksheet(
+                        sanitized_query_title[:25] + " (" + str(sheet_number) + ")" )
+                    write_header(worksheet, 0, header)
+                    y = 1
+
+                write_row(worksheet, y, row)
+                y += 1
+
+            if sheet_number > 1:
+                message = "Results exceeded the rows of a sheet, continued them in " + str(sheet_number - 1) + " further sheets"
+                logging.info(message)
+                print(message)
+
+
+        def write_query_result_to_local_folder(query_data_object):
+            """Writes raw output using the respective data format into the specified local folder"""
+
+
+            # create file for query result
+            # (and replace "/" with "-" because the file-writer interprets "/" as subdirectory)
+
+            file_name = \
+                str(query_data_object.id) + ". " + \
+                query_data_object.title.replace("/", "-") + \
+                "." + self.output_format.lower()
+            local_file = Path(self.folder / file_name)
+            query_data_object.results_file = str(local_file)
+
+
+            # parquet and arrow files are written from the harmonized results, with typed columns
+            if self.output_format == "PARQUET" or self.output_format == "ARROW":
+                write_query_result_to_arrow_file(query_data_object, local_file)
+                return
+
+            if self.output_compression is not None:
+                local_file = local_file.with_name(
+                    local_file.name + self.output_compression_extensions[self.output_compression])
+                query_data_object.results_file = str(local_file)
+
+            # all other formats are written as the raw bytes returned by the endpoint (compressed while being written,
+            # if a compression is set), streamed results are copied chunk by chunk
+            with local_file.open('wb') as fw:
+                with self.open_compressed_file(fw) as fc:
+                    if query_data_object.results_streamed:
+                        query_data_object.results_raw.seek(0)
+                        shutil.copyfileobj(query_data_object.results_raw, fc, self.stream_buffer_size)
+                        query_data_object.results_size = query_data_object.results_raw.tell()
+                    else:
+                        fc.write(query_data_object.results_raw)
+                        query_data_object.results_size = len(query_data_object.results_raw)
+
+            if self.output_compression is not None:
+                query_data_object.results_size_compressed = local_file.stat().st_size
+
+
+        def write_query_result_to_arrow_file(query_data_object, local_file):
+            """Writes results as harmonized rows into a parquet or arrow (ipc) file, in batches of arrow_batch_size rows,
+            so that streamed results are never held in memory as a whole. Each batch becomes a row group of the parquet
+            file, or a record batch of the arrow file."""
+
+            rows = query_data_object.iterate_results_matrix()
+            header = next(rows)
+            schema = self.get_arrow_schema(header, query_data_object.results_column_types)
+            values_unfit = 0
+
+            if self.output_format == "PARQUET":
+                writer = pyarrow.parquet.ParquetWriter(str(local_file), schema)
+            else:
+                writer = pyarrow.ipc.new_file(str(local_file), schema)
+
+            try:
+                while True:
+
+                    batch = list(itertools.islice(rows, self.arrow_batch_size))
+                    if len(batch) == 0:
+                        break
+
+                    record_batch, batch_values_unfit = self.get_arrow_record_batch(schema, batch)
+                    writer.write_batch(record_batch)
+                    values_unfit += batch_values_unfit
+
+            finally:
+                writer.close()
+
+            if values_unfit > 0:
+                message = "WARNING: " + str(values_unfit) + " values did not fit the types of their columns " + \
+                          "and were written as empty values"
+                logging.warning(message)
+                print(message)
+
+
+        def write_query_result_to_sqlite(query_data_object):
+            """Writes results as harmonized rows into a table of their own in the sqlite database (replacing a table of the
+            same name from an earlier run), inserting them in batches within one transaction. The indexes of the query
+            are created after all rows are inserted, which is much faster than updating them with every row."""
+
+            # the table is named by id and title of the query, reduced to characters which don't need to be quoted
+            table_name = "q" + str(query_data_object.id) + "_" + re.sub(r"\W+", "_", query_data_object.title).strip("_")
+            table_name = table_name[:63].rstrip("_")
+
+            rows = query_data_object.iterate_results_matrix()
+            header = [ str(variable) for variable in next(rows) ]
+
+            if len(header) == 0:
+                return
+
+            if query_data_object.results_column_types is None:
+                column_types = [ "string" for variable in header ]
+            else:
+                column_types = query_data_object.results_column_types
+
+            columns = ", ".join([
+                self.quote_sqlite_identifier(header[x]) + " " + self.sqlite_column_types[column_types[x]]
+                for x in range(0, len(header)) ])
+            insert = "INSERT INTO " + self.quote_sqlite_identifier(table_name) + \
+                     " VALUES (" + ", ".join([ "?" for variable in header ]) + ")"
+            convert_row = self.get_sqlite_row_converter(column_types)
+            rows_written = 0
+
+            self.sqlite_connection.execute("BEGIN")
+            try:
+                self.sqlite_connection.execute("DROP TABLE IF EXISTS " + self.quote_sqlite_identifier(table_name))
+                self.sqlite_connection.execute("CREATE TABLE " + self.quote_sqlite_identifier(table_name) + " (" + columns + ")")
+
+                while True:
+
+                    batch = [ convert_row(row) for row in itertools.islice(rows, self.sqlite_batch_size) ]
+                    if len(batch) == 0:
+                        break
+
+                    self.sqlite_connection.executemany(insert, batch)
+                    rows_written += len(batch)
+
+                self.sqlite_connection.execute("COMMIT")
+
+            except BaseException:
+                self.sqlite_connection.execute("ROLLBACK")
+                raise
+
+            query_data_object.results_table = table_name
+            query_data_object.results_rows_written = rows_written
+
+            # indexes on columns not found in the results are skipped
+            if query_data_object.indexes is not None:
+                for index in query_data_object.indexes:
+
+                    if not all(column in header for column in index):
+                        message = "WARNING: Skipped index on " + ", ".join(index) + ", since the results don't have such columns"
+                        logging.warning(message)
+                        print(message)
+                        continue
+
+                    message = "Creating index on " + ", ".join(index)
+                    logging.info(message)
+                    print(message)
+
+                    index_name = table_name + "__" + "__".join(index)
+                    self.sqlite_connection.execute(
+                        "CREATE INDEX " + self.quote_sqlite_identifier(index_name) +
+                        " ON " + self.quote_sqlite_identifier(table_name) +
+                        " (" + ", ".join([ self.quote_sqlite_identifier(column) for column in index ]) + ")")
+
+
+        def write_query_result_to_google_sheets(query_data_object):
+            """Writes results as harmonized two-dimensional list into a separate sheet in the google sheets file"""
+
+            sanitized_query_title = query_data_object.title
+            if len(sanitized_query_title) > 100:
+                sanitized_query_title = sanitized_query_title[:99]
+
+            sanitized_query_title = str(query_data_object.id) + ". " + sanitized_query_title
+
+            # google sheets needs all the values at once, thus read them from streamed results as well
+            results_matrix = [ self.get_google_sheets_row(row) for row in query_data_object.iterate_results_matrix() ]
+
+            # create sheet
+            google_sheet_id = self.google_sheets_next_sheet_id
+            self.google_sheets_next_sheet_id += 1
+            body_new_sheet = {
+                'requests' : [
+                    {
+                        'addSheet': {
+                            'properties': {
+                                'sheetId': google_sheet_id,
+                                'title': sanitized_query_title,
+                                'gridProperties': {
+                                    'rowCount': len(results_matrix),
+                                    'columnCount': len(results_matrix[0])
+                                }
+                            }
+                        }
+                    }
+                ]
+            }
+            self.queue_google_sheets_requests(body_new_sheet['requests'])
+            body_change_columns = {
+                'requests': [
+                    {
+                        "updateDimensionProperties": {
+                            "range": {
+                                "sheetId": google_sheet_id,
+                                "dimension": "COLUMNS",
+                                "startIndex": 0,
+                                "endIndex": len(results_matrix[0])
+                            },
+                            "properties": {
+                                "pixelSize": 300
+                            },
+                            "fields": "pixelSize"
+                        }
+                    }
+                ]
+            }
+            self.queue_google_sheets_requests(body_change_columns['requests'])
+
+            # write into sheet
+            self.queue_google_sheets_values(sanitized_query_title, 0, 0, results_matrix)
+
+        main(query_data_object)
+
+
+    def write_query_summary(self, query_data_object):
+        """Writes the gist of the results of an executed query to a summary sheet"""
+
+        def main(query_data_object):
+
+            message = "Writing to summary"
+            logging.info(message)
+            print(message)
+
+            if self.output_destination_type == 'local_xlsx' or self.output_destination_type == 'local_folder' :
+                write_query_summary_xlsx_file(query_data_object)
+
+            elif self.output_destination_type == 'sqlite':
+                write_query_summary_sqlite(query_data_object)
+
+            elif self.output_destination_type == 'google_sheets' or self.output_destination_type == 'google_folder':
+                write_query_summary_google_sheets(query_data_object)
+
+
+        def write_query_summary_xlsx_file(query_data_object):
+            """Writes the gist of the results of an executed query to the summary sheet in the xlsx file"""
+
+            # query_title
+            self.xlsx_worksheet_summary.write(
+                self.line_number,
+                0,
+                str(query_data_object.id) + ". " + str(query_data_object.title),
+                self.title_2_format)
+            self.line_number += 1
+
+            # query description
+            if not (query_data_object.description is None or
+                    query_data_object.description.isspace() or
+                    query_data_object.description == "") :
+
+                self.xlsx_worksheet_summary.write(self.line_number, 0, query_data_object.description)
+                self.line_number += 1
+
+            # query_text
+            size_of_query_text_row = 15 * (query_data_object.query.count("\n") + 2)
+            self.xlsx_worksheet_summary.set_row(self.line_number, size_of_query_text_row)
+            self.xlsx_worksheet_summary.write(self.line_number, 0, query_data_object.query, self.query_text_format)
+            self.line_number += 1
+
+            # results_execution_duration
+            self.xlsx_worksheet_summary.write(self.line_number, 0, "Duration of execution in seconds: " + str(query_data_object.results_execution_duration))
+            self.line_number += 1
+
+            # results_pages_durations
+            if query_data_object.results_pages_durations is not None:
+                self.xlsx_worksheet_summary.write(self.line_number, 0, self.get_pages_message(query_data_object))
+                self.line_number += 1
+
+            # results_retries
+            if len(query_data_object.results_retries) > 0:
+                self.xlsx_worksheet_summary.write(self.line_number, 0, self.get_retries_message(query_data_object))
+                self.line_number += 1
+
+            # results_timestamp_cached
+            if query_data_object.results_timestamp_cached is not None:
+                self.xlsx_worksheet_summary.write(self.line_number, 0, self.get_cached_message(query_data_object.results_timestamp_cached), self.bold_format)
+                self.line_number += 1
+
+            if query_data_object.results_raw is None:
+                self.line_number += 1
+                self.xlsx_worksheet_summary.write(self.line_number, 0, "NO RESULTS DUE TO ERROR: " + query_data_object.error_message)
+                self.line_number += 1
+
+            else:
+                # results_column_types
+                if query_data_object.results_column_types is not None:
+                    self.xlsx_worksheet_summary.write(self.line_number, 0, self.get_column_types_message(query_data_object))
+                    self.line_number += 1
+
+                # results_size
+                if query_data_object.results_size is not None:
+                    self.xlsx_worksheet_summary.write(self.line_number, 0, self.get_size_message(query_data_object))
+                    self.line_number += 1
+
+                # results_lines_count
+                if query_data_object.results_lines_count is not None:
+                    self.xlsx_worksheet_summary.write(self.line_number, 0, "Total count of lines in results: " + str(query_data_object.results_lines_count))
+                    self.line_number += 2
+                else:
+                    self.line_number += 1
+
+                # results
+                limit = self.summary_sample_limit
+                if limit != 0:
+
+                    self.xlsx_worksheet_summary.write(self.line_number, 0, "Sample results: ", self.bold_format)
+                    self.line_number += 1
+                    harmonized_rows = query_data_object.results_matrix
+
+                    limit += 1
+                    if len(harmonized_rows) < limit:
+                        limit = len(harmonized_rows)
+
+                    write_header = self.get_xlsx_row_writer(None)
+                    write_row = self.get_xlsx_row_writer(query_data_object.results_column_types)
+
+                    y = 0
+                    for y in range(0, limit):
+                        if y == 0:
+                            write_header(self.xlsx_worksheet_summary, y + self.line_number, harmonized_rows[y])
+                        else:
+                            write_row(self.xlsx_worksheet_summary, y + self.line_number, harmonized_rows[y])
+
+                    self.line_number += 1
+
+                self.line_number += limit
+
+            self.line_number += 2
+
+
+        def write_query_summary_sqlite(query_data_object):
+            """Writes the gist of the results of an executed query as row of the table sparqlaborer_queries into the sqlite
+            database. The sample results are left out, since the results themselves are in the database."""
+
+            if query_data_object.results_pages_durations is None:
+                pages_durations = None
+            else:
+                pages_durations = ", ".join([ str(duration) for duration in query_data_object.results_pages_durations ])
+
+            if query_data_object.results_timestamp_cached is None:
+                timestamp_cached = None
+            else:
+                timestamp_cached = time.strftime('%y%m%d_%H%M%S', time.localtime(query_data_object.results_timestamp_cached))
+
+            if query_data_object.results_raw is None or query_data_object.results_column_types is None:
+                column_types = None
+            else:
+                column_types = self.get_column_types_message(query_data_object)
+
+            if query_data_object.results_raw is None:
+                error_message = query_data_object.error_message
+            else:
+                error_message = None
+
+            self.sqlite_connection.execute(
+                "INSERT INTO sparqlaborer_queries VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (self.sqlite_timestamp_start, self.sqlite_collection_title, query_data_object.id,
+                 query_data_object.title, query_data_object.description, query_data_object.query,
+                 query_data_object.results_table, query_data_object.results_execution_duration, pages_durations,
+                 len(query_data_object.results_retries), timestamp_cached, column_types,
+                 query_data_object.results_lines_count, query_data_object.results_rows_written, error_message))
+
+
+        def write_query_summary_google_sheets(query_data_object):
+            """Writes the gist of the results of an executed query to the summary sheet in the google sheets file"""
+
+            # creating header
+            query_stats = []
+            query_stats.append([str(query_data_object.id) + ". " + query_data_object.title])
+            if not (query_data_object.description.isspace() or query_data_object.description == "") :
+                query_stats.append([query_data_object.description])
+            query_stats.append([query_data_object.query])
+            query_stats.append(
+                ["Duration of execution in seconds: " +
+                 str(query_data_object.results_execution_duration)])
+            if query_data_object.results_pages_durations is not None:
+                query_stats.append([self.get_pages_message(query_data_object)])
+            if len(query_data_object.results_retries) > 0:
+                query_stats.append([self.get_retries_message(query_data_object)])
+            if query_data_object.results_timestamp_cached is not None:
+                query_stats.append([self.get_cached_message(query_data_object.results_timestamp_cached)])
+
+
+            if query_data_object.results_raw is None:
+                query_stats.append([])
+                query_stats.append(["NO RESULTS DUE TO ERROR: " + query_data_object.error_message])
+
+            else:
+
+                if query_data_object.results_column_types is not None:
+                    query_stats.append([self.get_column_types_message(query_data_object)])
+
+                if query_data_object.results_lines_count is not None:
+                    query_stats.append(
+                        ["Total count of lines in results: " +
+                         str(query_data_object.results_lines_count)])
+
+                # get sample results
+                limit = self.summary_sample_limit
+                if limit != 0:
+
+                    query_stats.append([])
+                    query_stats.append(["Sample results: "])
+                    harmonized_rows = query_data_object.results_matrix
+
+                    # set limit as defined, readjust if results should be less than it or if it exceeds gsheets-capacities
+                    limit += 1
+                    if len(harmonized_rows) < limit:
+                        limit = len(harmonized_rows)
+
+                    for y in range(0, limit):
+                        query_stats.append(self.get_google_sheets_row(harmonized_rows[y]))
+
+            # widen the summary sheet, should the sample results have more columns than it
+            columns_count = max([ len(row) for row in query_stats ])
+            if columns_count > self.google_sheets_summary_column_count:
+                self.queue_google_sheets_requests([
+                    {
+                        "appendDimension": {
+                            "sheetId": self.google_sheets_summary_sheet_id,
+                            "dimension": "COLUMNS",
+                            "length": columns_count - self.google_sheets_summary_column_count
+                        }
+                    }
+                ])
+                self.google_sheets_summary_column_count = columns_count
+
+            # write header and sample results to sheet
+            self.queue_google_sheets_values("0. Summary", self.line_number, 0, query_stats)
+            self.line_number += len(query_stats) + 3
+
+        main(query_data_object)
+
+
+    def is_query_written(self, query_data_object):
+        """Returns if the results and summary of a query were written completely by the interrupted run which is resumed,
+        according to its journal. Since such a query is skipped, its query text must not have changed since."""
+
+        if self.run_journal is None or query_data_object.id not in self.run_journal.queries:
+            return False
+
+        if self.run_journal.queries[query_data_object.id]["query"] != query_data_object.query:
+            message = "\nERROR: The query with id " + str(query_data_object.id) + " differs from the one " + \
+                      "of the interrupted run, which can thus not be resumed."
+            logging.error(message)
+            sys.exit(message)
+
+        return True
+
+
+    def write_journal(self, query_data_object):
+        """Records a query whose results and summary were written completely in the journal of the run, together with
+        the calls it made to the summary, if the run writes into a local folder"""
+
+        if self.run_journal is None:
+            return
+
+        entry = {
+            "id": query_data_object.id,
+            "title": query_data_object.title,
+            "query": query_data_object.query,
+            "results_file": query_data_object.results_file,
+            "summary": self.xlsx_worksheet_summary.take_calls(),
+            "line_number": self.line_number
+        }
+
+        self.run_journal.queries[query_data_object.id] = entry
+        self.run_journal.record({ "query": entry })
+
+
+    def get_column_types_message(self, query_data_object):
+        """Returns the line written into summaries to list the types inferred for the columns of the results"""
+
+        column_types = []
+        for x in range(0, len(query_data_object.results_column_types)):
+            column_types.append(
+                str(query_data_object.results_matrix.header[x]) + ": " + query_data_object.results_column_types[x])
+
+        return "Column types: " + ", ".join(column_types)
+
+
+    def get_xlsx_row_writer(self, column_types):
+        """Returns a function writing a whole row of results into a xlsx worksheet at once, truncating long strings and
+        formatting dates. Which columns need to be truncated or formatted is decided once from the types of the
+        columns (all columns are treated as strings if these are None), instead of checking every value."""
+
+        if column_types is None:
+            columns_truncated = None
+            columns_dates = []
+        else:
+            columns_truncated = [ x for x in range(0, len(column_types)) if column_types[x] == "string" ]
+            columns_dates = [ x for x in range(0, len(column_types)) if column_types[x] == "date" ]
+
+        def write_row(worksheet, y, row):
+
+            row = list(row)
+
+            for x in (range(0, len(row)) if columns_truncated is None else columns_truncated):
+                if type(row[x]) is str and len(row[x]) > 255:
+                    row[x] = row[x][:255]
+
+            worksheet.write_row(y, 0, row)
+
+            # dates are written with their own format, which can only be given per cell
+            for x in columns_dates:
+                if type(row[x]) is datetime.date:
+                    worksheet.write_datetime(y, x, row[x], self.date_format)
+
+        return write_row
+
+
+    def get_arrow_schema(self, header, column_types):
+        """Returns the arrow schema of results, the arrow type of each column being derived from its inferred type (all
+        columns are treated as strings if these are None). Decimals are stored as doubles, and datetimes as timestamps
+        in UTC, datetimes without a timezone being taken as such."""
+
+        arrow_types = {
+            "int": pyarrow.int64(),
+            "decimal": pyarrow.float64(),
+            "float": pyarrow.float64(),
+            "boolean": pyarrow.bool_(),
+            "date": pyarrow.date32(),
+            "datetime": pyarrow.timestamp("us", tz="UTC"),
+            "string": pyarrow.string(),
+        }
+
+        fields = []
+        for x in range(0, len(header)):
+            column_type = "string" if column_types is None else column_types[x]
+            fields.append(pyarrow.field(str(header[x]), arrow_types[column_type]))
+
+        return pyarrow.schema(fields)
+
+
+    def get_arrow_record_batch(self, schema, rows):
+        """Returns rows of results as arrow record batch of the given schema, converting them column by column. Since
+        the types of the columns were inferred from a sample, single values might not fit them: these are converted one
+        by one, strings being taken as text, and other values not fitting their column as empty values. Returns the
+        record batch together with the number of such empty values."""
+
+        arrays = []
+        values_unfit = 0
+
+        columns = zip(*rows) if len(schema) > 0 else []
+        for x, column in enumerate(columns):
+
+            arrow_type = schema.field(x).type
+
+            # decimals are not converted to doubles by arrow itself
+            if arrow_type == pyarrow.float64():
+                column = [ float(value) if type(value) is decimal.Decimal else value for value in column ]
+
+            try:
+                arrays.append(pyarrow.array(column, type=arrow_type))
+                continue
+            except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError, OverflowError):
+                pass
+
+            values = []
+            for value in column:
+
+                if value is None:
+                    values.append(None)
+
+                elif arrow_type == pyarrow.string():
+                    values.append(str(value))
+
+                else:
+                    try:
+                        values.append(pyarrow.scalar(value, type=arrow_type))
+                    except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError, OverflowError):
+                        values.append(None)
+                        values_unfit += 1
+
+            arrays.append(pyarrow.array(values, type=arrow_type))
+
+        return pyarrow.RecordBatch.from_arrays(arrays, schema=schema), values_unfit
+
+
+    def get_google_sheets_row(self, row):
+        """Returns a row of the results as list, its values converted to types accepted by the google sheets api"""
+
+        google_sheets_row = []
+        for value in row:
+            if type(value) is decimal.Decimal:
+                value = float(value)
+            elif type(value) is float and not math.isfinite(value):
+                value = str(value)
+            elif isinstance(value, datetime.date):
+                value = value.isoformat()
+            google_sheets_row.append(value)
+
+        return google_sheets_row
+
+
+    def get_pages_message(self, query_data_object):
+        """Returns the line written into summaries to list the durations of the pages the results were fetched in"""
+
+        return "Fetched in " + str(len(query_data_object.results_pages_durations)) + " pages of up to " + \
+            str(query_data_object.page_size) + " lines, durations in seconds: " + \
+            ", ".join([ str(duration) for duration in query_data_object.results_pages_durations ])
+
+
+    def get_retries_message(self, query_data_object):
+        """Returns the line written into summaries to count the retries of a query after transient errors"""
+
+        return "Retries after transient errors: " + str(len(query_data_object.results_retries))
+
+
+    def get_size_message(self, query_data_object):
+        """Returns the line written into summaries to tell the size of the file of the results"""
+
+        message = "Size of results in bytes: " + str(query_data_object.results_size)
+
+        if query_data_object.results_size_compressed is not None:
+            message += ", compressed with " + self.output_compression + ": " + \
+                       str(query_data_object.results_size_compressed)
+
+            if query_data_object.results_size > 0:
+                message += " (" + str(round(100 * query_data_object.results_size_compressed / query_data_object.results_size, 1)) + " %)"
+
+        return message
+
+
+    def open_compressed_file(self, file):
+        """Returns a binary file compressing everything written into it with the output_compression into the given file
+        (or a context manager returning the given file itself, if no compression is set). Closing the returned file
+        finishes the compression, but leaves the given file open."""
+
+        if self.output_compression == "gzip":
+            return gzip.GzipFile(fileobj=file, mode="wb", compresslevel=self.output_compression_level)
+
+        elif self.output_compression == "xz":
+            return lzma.LZMAFile(file, mode="wb", preset=self.output_compression_level)
+
+        elif self.output_compression == "zstd":
+            # zstandard compresses within the writing thread if no threads are given
+            threads = self.output_compression_threads if self.output_compression_threads > 1 else 0
+            compressor = zstandard.ZstdCompressor(level=self.output_compression_level, threads=threads)
+            return compressor.stream_writer(file, closefd=False)
+
+        else:
+            return contextlib.nullcontext(file)
+
+
+    def quote_sqlite_identifier(self, identifier):
+        """Returns the name of a table, column or index quoted for sqlite, so that it may contain any characters"""
+
+        return '"' + identifier.replace('"', '""') + '"'
+
+
+    def get_sqlite_row_converter(self, column_types):
+        """Returns a function converting a row of results to values supported by sqlite: decimals become floats, and dates
+        and datetimes iso strings. Which columns need to be converted is decided once from the types of the columns,
+        string columns being included since they might hold values of typed literals which didn't fit any type."""
+
+        columns_converted = [ x for x in range(0, len(column_types)) if column_types[x] not in ("int", "float", "boolean") ]
+
+        def convert_value(value):
+
+            if type(value) is decimal.Decimal:
+                return float(value)
+            elif type(value) is datetime.date or type(value) is datetime.datetime:
+                return value.isoformat()
+            else:
+                return value
+
+        def convert_row(row):
+
+            row = list(row)
+
+            for x in columns_converted:
+                row[x] = convert_value(row[x])
+
+            return row
+
+        return convert_row
+
+
+    def get_cached_message(self, timestamp_cached):
+        """Returns the line written into summaries to mark results which were read from the result cache"""
+
+        return "CACHED RESULTS, fetched from endpoint at: " + time.strftime('%y%m%d_%H%M%S', time.localtime(timestamp_cached))
+
+
+    def get_range_from_matrix(self, start_y, start_x, matrix):
+        """Input: starting y- and x-coordinates and a matrix.
+        Output: Coordinates of the matrix (left upper cell and lower right cell) in A1-notation for updating google sheets"""
+
+        max_len_x = 0
+        for row in matrix:
+            if len(row) > max_len_x:
+                max_len_x = len(row)
+
+        max_len_y = len(matrix)
+
+        range_start = self.get_column_letters(start_x) + str(start_y + 1)
+
+        range_end = self.get_column_letters(start_x + max(max_len_x, 1) - 1) + str(start_y + max_len_y)
+
+        return range_start + ":" + range_end
+
+
+    def get_column_letters(self, x):
+        """Returns the letters of a column in A1-notation (A to Z, then AA, AB, ...) for its index, starting at 0"""
+
+        letters = ""
+        x += 1
+        while x > 0:
+            x, remainder = divmod(x - 1, 26)
+            letters = chr(65 + remainder) + letters
+
+        return letters
+
+
+    def queue_google_sheets_requests(self, requests):
+        """Queues requests for a batchUpdate of the google sheets file, sending all queued requests if a threshold is exceeded"""
+
+        self.google_requests_pending.extend(requests)
+
+        if len(self.google_requests_pending) + len(self.google_values_pending) >= self.google_flush_requests:
+            self.flush_google_sheets()
+
+
+    def queue_google_sheets_values(self, sheet_title, start_y, start_x, values):
+        """Queues values to be written into a sheet of the google sheets file, starting at the given coordinates,
+        sending all queued requests if a threshold is exceeded"""
+
+        self.google_values_pending.append({ 'sheet_title': sheet_title, 'start_y': start_y, 'start_x': start_x, 'values': values })
+        self.google_cells_pending += sum([ len(row) for row in values ])
+
+        if len(self.google_requests_pending) + len(self.google_values_pending) >= self.google_flush_requests or \
+                self.google_cells_pending >= self.google_flush_cells:
+            self.flush_google_sheets()
+
+
+    def flush_google_sheets(self):
+        """Sends all queued requests to the google sheets file, with one call for changing its sheets, and calls for
+        writing values into them of up to google_flush_cells cells each, which are sent at the same time. Sheets are
+        changed first, since the values may be written into sheets created by the same flush."""
+
+        if len(self.google_requests_pending) == 0 and len(self.google_values_pending) == 0:
+            return
+
+        values_batches = self.get_google_sheets_values_batches()
+
+        message = "Sending " + str(len(self.google_requests_pending)) + " requests and " + \
+            str(len(self.google_values_pending)) + " ranges of values (" + str(self.google_cells_pending) + \
+            " cells, in " + str(len(values_batches)) + " calls) to google sheets"
+        logging.info(message)
+        print(message)
+
+        if len(self.google_requests_pending) > 0:
+            self.execute_google_request(
+                self.google_service_sheets.spreadsheets().batchUpdate(
+                    spreadsheetId=self.google_sheets_id,
+                    body={ 'requests': self.google_requests_pending }),
+                self.google_sheets_rate_limiter, "Changing sheets of google sheets")
+
+        futures = [ self.google_upload_executor.submit(self.upload_google_sheets_values, values_batch)
+                    for values_batch in values_batches ]
+        for future in futures:
+            future.result()
+
+        self.google_requests_pending = []
+        self.google_values_pending = []
+        self.google_cells_pending = 0
+
+
+    def get_google_sheets_values_batches(self):
+        """Returns the queued values as batches of ranges with up to google_flush_cells cells each, where the values of
+        big ranges are split into chunks of rows with ranges of their own"""
+
+        values_batches = []
+        values_batch = []
+        values_batch_cells = 0
+
+        for values_pending in self.google_values_pending:
+
+            values = values_pending['values']
+            chunk_rows = max(self.google_flush_cells // max([ len(row) for row in values ] + [1]), 1)
+
+            for y in range(0, len(values), chunk_rows):
+
+                chunk = values[y:y + chunk_rows]
+                chunk_cells = sum([ len(row) for row in chunk ])
+
+                if len(values_batch) > 0 and values_batch_cells + chunk_cells > self.google_flush_cells:
+                    values_batches.append(values_batch)
+                    values_batch = []
+                    values_batch_cells = 0
+
+                # sheet titles are quoted, since they may contain spaces or other special characters
+                google_sheet_range = \
+                    "'" + values_pending['sheet_title'].replace("'", "''") + "'!" + \
+                    self.get_range_from_matrix(values_pending['start_y'] + y, values_pending['start_x'], chunk)
+
+                values_batch.append({ 'range': google_sheet_range, 'values': chunk })
+                values_batch_cells += chunk_cells
+
+        if len(values_batch) > 0:
+            values_batches.append(values_batch)
+
+        return values_batches
+
+
+    def upload_google_sheets_values(self, values_batch):
+        """Writes a batch of values into the google sheets file, retrying it up to upload_retries times should it fail.
+        Is run within the threads uploading the batches."""
+
+        if not hasattr(self.google_thread_local, "service_sheets"):
+            self.google_thread_local.service_sheets = discovery.build(
+                'sheets', 'v4', http=self.google_credentials.authorize(Http()))
+
+        self.execute_google_request(
+            self.google_thread_local.service_sheets.spreadsheets().values().batchUpdate(
+                spreadsheetId=self.google_sheets_id,
+                body={ 'valueInputOption': "RAW", 'data': values_batch }),
+            self.google_sheets_rate_limiter, "Writing values into " + values_batch[0]['range'], self.upload_retries)
+
+
+    def execute_google_request(self, request, rate_limiter, description, max_retries=None):
+        """Executes a request to a google api within the limits of the rate limiter, which is adapted to its response.
+        Should the request fail due to a transient error, it is retried up to max_retries times (by default the ones of
+        the retry policy)."""
+
+        def execute_attempt():
+
+            rate_limiter.acquire()
+
+            try:
+                response = request.execute()
+
+            except HttpError as ex:
+                if ex.resp.status in Rate_limiter.throttling_statuses:
+                    rate_limiter.throttled(ex.resp.get("retry-after"))
+                raise
+
+            rate_limiter.succeeded()
+
+            return response
+
+        return self.google_retry_policy.call(execute_attempt, description, max_retries, self.google_retries)
+
+
+    def close(self):
+        """Closes the xlsx writer object or the sqlite database, or sends the requests still queued for google sheets"""
+
+        if self.output_destination_type == "local_xlsx" or self.output_destination_type == 'local_folder' :
+            logging.info("close writer")
+            self.xlsx_workbook.close()
+
+            if self.run_journal is not None:
+                self.run_journal.close()
+
+        elif self.output_destination_type == "sqlite":
+            logging.info("close writer")
+            self.sqlite_connection.close()
+
+        elif self.output_destination_type == "google_sheets" or self.output_destination_type == 'google_folder' :
+            logging.info("close writer")
+            self.flush_google_sheets()
+            self.google_upload_executor.shutdown()
+
+            if len(self.google_retries) > 0:
+                message = "Retried requests to google apis " + str(len(self.google_retries)) + " times after transient errors"
+                logging.info(message)
+                print(message)
+
+
+
+
+class Rate_limiter:
+    """the Rate_limiter Class limits the rate of requests sent to a remote service (the sparql endpoint, or a google api)
+    with a token bucket, shared by all threads sending requests to it. Should the service signal it's overloaded (with
+    http status 429 or 503), requests are paused for as long as it asks for, and their rate is halved, to be increased
+    again step by step with every successful request, up to the configured rate."""
+
+    # statuses with which services signal they are overloaded
+    throttling_statuses = (429, 503)
+
+    # seconds requests are paused for, if an overloaded service does not tell for how long
+    default_pause = 1
+
+    # requests per second below which the rate is not decreased any further
+    min_rate = 0.1
+
+    def __init__(self, name, rate):
+
+        self.name = name
+
+        # configured rate and current rate in requests per second, None meaning unlimited
+        self.max_rate = rate
+        self.rate = rate
+
+        self._tokens = 1.0
+        self._last_refill = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+
+    def acquire(self):
+        """Blocks until the next request may be sent"""
+
+        while True:
+
+            with self._lock:
+
+                now = time.monotonic()
+                wait = self._paused_until - now
+
+                if wait <= 0:
+
+                    if self.rate is None:
+                        return
+
+                    # tokens are refilled with the current rate, holding at most one second's worth of requests
+                    self._tokens = min(
+                        self._tokens + max(now - self._last_refill, 0) * self.rate, max(self.rate, 1.0))
+                    self._last_refill = now
+
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+
+                    wait = (1 - self._tokens) / self.rate
+
+            time.sleep(wait)
+
+
+    def succeeded(self):
+        """Increases the rate again after it was decreased, by a tenth of the configured rate per successful request"""
+
+        with self._lock:
+            if self.rate is not None and self.rate < self.max_rate:
+                self.rate = min(self.rate + self.max_rate / 10, self.max_rate)
+
+
+    def throttled(self, retry_after=None):
+        """Pauses all requests for the seconds (or until the http date) of a Retry-After header, and halves the rate"""
+
+        pause = self.default_pause
+
+        if retry_after is not None:
+            try:
+                pause = float(retry_after)
+            except ValueError:
+                try:
+                    pause = email.utils.parsedate_to_datetime(retry_after).timestamp() - time.time()
+                except (TypeError, ValueError):
+                    pass
+
+        if not math.isfinite(pause):
+            pause = self.default_pause
+        pause = max(round(pause, 3), 0)
+
+        # once the pause is over, a single request may be sent right away, and further ones with the decreased rate
+        with self._lock:
+
+            self._paused_until = max(self._paused_until, time.monotonic() + pause)
+            self._tokens = 1.0
+            self._last_refill = self._paused_until
+
+            if self.rate is not None:
+                self.rate = max(self.rate / 2, min(self.min_rate, self.max_rate))
+
+        message = self.name + " is overloaded; pausing requests for " + str(pause) + " seconds" + \
+            ("" if self.rate is None else ", reducing their rate to " + str(self.rate) + " per second")
+        logging.warning(message)
+        print(message)
+
+
+
+
+class Retry_policy:
+    """the Retry_policy Class retries requests to remote services (the sparql endpoint, or a google api) which failed due
+    to transient errors, e.g. timeouts, internal errors of the service or exceeded quotas. Between attempts it waits
+    exponentially longer, for a random part of that time (jitter), so that requests which failed at the same time are not
+    retried all at once. Errors caused by the request itself (e.g. a badly formed query) are passed on right away."""
+
+    # exceptions which may go away by retrying
+    transient_exceptions = (
+        SPARQLExceptions.SPARQLWrapperException, HttpError, HttpLib2Error, OSError, http.client.HTTPException)
+
+    # exceptions of the endpoint caused by the query itself
+    permanent_sparql_exceptions = (
+        SPARQLExceptions.QueryBadFormed, SPARQLExceptions.Unauthorized,
+        SPARQLExceptions.EndPointNotFound, SPARQLExceptions.URITooLong)
+
+    # client error statuses which may go away by retrying (any server error status may as well)
+    transient_statuses = (408, 429)
+
+    def __init__(self, max_retries, backoff, max_backoff):
+
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+
+
+    def is_transient(self, exception):
+        """Returns whether the error may go away by retrying the request"""
+
+        if isinstance(exception, self.permanent_sparql_exceptions):
+            return False
+
+        if isinstance(exception, HttpError):
+            status = exception.resp.status
+        else:
+            status = getattr(exception, "status", None)
+
+        if status is not None:
+            return status >= 500 or status in self.transient_statuses
+
+        return isinstance(exception, self.transient_exceptions)
+
+
+    def call(self, function, description, max_retries=None, retries=None):
+        """Calls the function and returns its result, retrying it up to max_retries times (by default the ones of the
+        policy) should it fail due to a transient error. For each retry a message is appended to retries, if given."""
+
+        if max_retries is None:
+            max_retries = self.max_retries
+
+        attempt = 0
+
+        while True:
+
+            try:
+                return function()
+
+            except self.transient_exceptions as ex:
+
+                if attempt >= max_retries or not self.is_transient(ex):
+                    raise
+
+                wait = random.uniform(0, min(self.backoff * 2 ** attempt, self.max_backoff))
+                attempt += 1
+
+                message = description + " failed: " + str(ex).strip().split("\n")[0] + \
+                    "\nRetrying in " + str(round(wait, 3)) + " seconds (" + str(attempt) + " of " + str(max_retries) + ")"
+                logging.warning(message)
+                print(message)
+
+                if retries is not None:
+                    retries.append(message)
+
+                time.sleep(wait)
+
+
+
+
+class Endpoint_client:
+    """the Endpoint_client Class keeps a pool of persistent (keep-alive) connections to a sparql endpoint, which is shared
+    by all queries of a run, so that not every query has to pay for its own tcp (and tls) handshake. Proxies are taken
+    from the environment (http_proxy, https_proxy and no_proxy), the same way as by urllib."""
+
+    # mime types requested from the endpoint for the respective results formats
+    accept_headers = {
+        CSV: "text/csv",
+        TSV: "text/tab-separated-values",
+        XML: "application/sparql-results+xml",
+        JSON: "application/sparql-results+json",
+    }
+
+    # exceptions raised for the respective http status codes (the same as SPARQLWrapper would raise)
+    status_exceptions = {
+        400: SPARQLExceptions.QueryBadFormed,
+        401: SPARQLExceptions.Unauthorized,
+        404: SPARQLExceptions.EndPointNotFound,
+        414: SPARQLExceptions.URITooLong,
+        500: SPARQLExceptions.EndPointInternalError,
+    }
+
+    max_redirects = 5
+
+    user_agent = "SparqLaborer"
+
+    def __init__(self, endpoint, pool_size, idle_timeout, timeout, rate_limiter):
+
+        self.pool_size = pool_size
+        self.idle_timeout = idle_timeout
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter
+
+        # proxies by scheme, as set in the environment
+        self._proxies = urllib.request.getproxies()
+
+        # connections not in use, together with the time they were last used, the most recently used at the right end
+        self._idle_connections = collections.deque()
+        self._idle_connections_lock = threading.Lock()
+
+        # incremented whenever the endpoint changes, so that connections to a previous endpoint are not pooled again
+        self._generation = 0
+
+        # limits the number of connections open at the same time to the size of the pool
+        self._pool_semaphore = threading.BoundedSemaphore(pool_size)
+
+        self.set_endpoint(endpoint)
+
+        logging.info(
+            "Created endpoint client for " + endpoint + " with pool size " + str(pool_size) +
+            ", idle timeout " + str(idle_timeout) + " and timeout " + str(timeout) +
+            ("" if self._proxy is None else " via proxy " + self._proxy.hostname))
+
+
+    def set_endpoint(self, endpoint):
+        """Sets the url to which all requests are sent, and discards connections to any previous url"""
+
+        url = urllib.parse.urlsplit(endpoint)
+
+        if url.scheme not in ("http", "https"):
+            message = "\nERROR: INVALID ENDPOINT! Only http and https endpoints are supported, found: " + endpoint
+            logging.error(message)
+            sys.exit(message)
+
+        with self._idle_connections_lock:
+            self.endpoint = endpoint
+            self._scheme = url.scheme
+            self._netloc = url.netloc
+            self._path = self._get_path(url)
+            self._proxy = self._get_proxy(url)
+            self._generation += 1
+
+        self.close()
+
+
+    def execute(self, query_string, results_format, result_file=None, buffer_size=None):
+        """Sends a query to the endpoint, using one of the pooled connections, and returns the raw body of the
+        response as bytes. If a result_file is given, the body is instead written into it incrementally, reading at
+        most buffer_size bytes at a time from the connection, and the result_file is returned.
+        Redirects are followed for this query only, a 303 (see other) by sending the query with GET."""
+
+        method = "POST"
+        location = None
+        body = urllib.parse.urlencode({ "query": query_string })
+        headers = {
+            "Accept": self.accept_headers[results_format],
+            "Content-Type": "application/x-www-form-urlencoded",
+            "User-Agent": self.user_agent,
+        }
+
+        for i in range(0, self.max_redirects + 1):
+
+            self.rate_limiter.acquire()
+
+            with self._pool_semaphore:
+
+                if method == "POST":
+                    response, response_body = self._send(
+                        method, location, body.encode("utf-8"), headers, result_file, buffer_size)
+                else:
+                    response, response_body = self._send(
+                        method, location + ("&" if "?" in location else "?") + body, None, headers,
+                        result_file, buffer_size)
+
+            if response.status in Rate_limiter.throttling_statuses:
+                self.rate_limiter.throttled(response.getheader("Retry-After"))
+            else:
+                self.rate_limiter.succeeded()
+
+            if response.status in (301, 302, 303, 307, 308) and response.getheader("Location") is not None:
+
+                location = urllib.parse.urljoin(
+                    self.endpoint if location is None else location, response.getheader("Location"))
+                logging.info("Endpoint redirected to " + location)
+
+                if urllib.parse.urlsplit(location).scheme not in ("http", "https"):
+                    raise SPARQLExceptions.SPARQLWrapperException(
+                        "Endpoint redirected to an url which is not http or https: " + location)
+
+                # the location of a 303 is to be requested with GET, other redirects repeat the request as it is
+                if response.status == 303:
+                    method = "GET"
+                    headers.pop("Content-Type", None)
+
+            else:
+                break
+
+        if response.status >= 400:
+
+            if response.status in self.status_exceptions:
+                exception = self.status_exceptions[response.status](response_body)
+            else:
+                exception = SPARQLExceptions.SPARQLWrapperException(
+                    ("HTTP status " + str(response.status) + " " + str(response.reason) + "\n").encode("utf-8") +
+                    response_body)
+
+            # the status is kept for deciding whether the request is worth retrying
+            exception.status = response.status
+            raise exception
+
+        if result_file is not None:
+            return result_file
+        else:
+            return response_body
+
+
+    def _send(self, method, location, body, headers, result_file, buffer_size):
+        """Sends a request over a pooled connection and reads its response completely, so that the connection
+        can be reused afterwards. Successful responses are written into the result_file, if one is given.
+        Requests to another location than the endpoint (i.e. redirected ones) are sent over a connection of their own."""
+
+        if location is None:
+            connection, is_reused, generation = self._acquire_connection()
+            scheme, netloc, path, proxy = self._scheme, self._netloc, self._path, self._proxy
+        else:
+            url = urllib.parse.urlsplit(location)
+            scheme, netloc, path, proxy = url.scheme, url.netloc, self._get_path(url), self._get_proxy(url)
+            connection, is_reused, generation = self._create_connection(scheme, netloc, proxy), False, None
+
+        # requests to http urls are sent to their proxy with the complete url (https ones are tunneled instead)
+        if proxy is not None and scheme == "http":
+            path = "http://" + netloc + path
+            headers = dict(headers, **self._get_proxy_headers(proxy))
+
+        try:
+            connection.request(method, path, body=body, headers=headers)
+            response = connection.getresponse()
+
+        except (http.client.HTTPException, ConnectionError):
+            connection.close()
+
+            # the endpoint might have closed a reused connection in the meantime, in which case the request
+            # is sent once again over a fresh connection. Any other failure is passed on.
+            if not is_reused:
+                raise
+
+            logging.info("Pooled connection was closed by the endpoint; reconnecting.")
+            connection = self._create_connection(scheme, netloc, proxy)
+            connection.request(method, path, body=body, headers=headers)
+            response = connection.getresponse()
+
+        try:
+            if result_file is not None and response.status < 300:
+
+                response_body = None
+                chunk = response.read(buffer_size)
+                while chunk:
+                    result_file.write(chunk)
+                    chunk = response.read(buffer_size)
+
+            else:
+                response_body = response.read()
+
+        except Exception:
+            connection.close()
+            raise
+
+        if response.will_close:
+            connection.close()
+        else:
+            self._release_connection(connection, generation)
+
+        return response, response_body
+
+
+    def _create_connection(self, scheme, netloc, proxy):
+        """Creates a connection to the netloc, or to its proxy if there is one, which tunnels https connections"""
+
+        if proxy is None:
+            if scheme == "https":
+                return http.client.HTTPSConnection(netloc, timeout=self.timeout)
+            else:
+                return http.client.HTTPConnection(netloc, timeout=self.timeout)
+
+        proxy_netloc = proxy.netloc.rpartition("@")[2]
+
+        if scheme == "https":
+            connection = http.client.HTTPSConnection(proxy_netloc, timeout=self.timeout)
+            connection.set_tunnel(netloc, headers=self._get_proxy_headers(proxy))
+            return connection
+        else:
+            return http.client.HTTPConnection(proxy_netloc, timeout=self.timeout)
+
+
+    def _get_path(self, url):
+
+        path = url.path if url.path != "" else "/"
+        if url.query != "":
+            path += "?" + url.query
+
+        return path
+
+
+    def _get_proxy(self, url):
+        """Returns the proxy to use for the url (split) as split url, or None if it is to be reached directly"""
+
+        proxy = self._proxies.get(url.scheme)
+
+        if proxy is None or urllib.request.proxy_bypass(url.hostname or ""):
+            return None
+
+        if "://" not in proxy:
+            proxy = "http://" + proxy
+
+        return urllib.parse.urlsplit(proxy)
+
+
+    def _get_proxy_headers(self, proxy):
+
+        if proxy.username is None:
+            return {}
+
+        credentials = urllib.parse.unquote(proxy.username) + ":" + urllib.parse.unquote(proxy.password or "")
+        return { "Proxy-Authorization": "Basic " + base64.b64encode(credentials.encode("utf-8")).decode("ascii") }
+
+
+    def _acquire_connection(self):
+        """Returns the most recently used idle connection, discarding the ones which were idle for too long,
+        or a new connection if there is none left"""
+
+        with self._idle_connections_lock:
+
+            while len(self._idle_connections) > 0:
+
+                connection, last_used = self._idle_connections.pop()
+
+                if time.time() - last_used < self.idle_timeout:
+                    return connection, True, self._generation
+                else:
+                    connection.close()
+
+            return self._create_connection(self._scheme, self._netloc, self._proxy), False, self._generation
+
+
+    def _release_connection(self, connection, generation):
+
+        with self._idle_connections_lock:
+            if generation == self._generation:
+                self._idle_connections.append( (connection, time.time()) )
+                return
+
+        connection.close()
+
+
+    def close(self):
+        """Closes all idle connections of the pool"""
+
+        with self._idle_connections_lock:
+
+            while len(self._idle_connections) > 0:
+                connection, last_used = self._idle_connections.pop()
+                connection.close()
+
+
+
+
+class Result_cache:
+    """the Result_cache Class stores the raw responses of the endpoint on disk, so that re-running a query collection
+    does not execute its queries again as long as their cached results are younger than the given time to live.
+    The cache is bounded in size, evicting the least recently used results first. Each result is kept in a single file,
+    starting with a line of json describing it, so that it's read and replaced as a whole also by variants running in
+    other processes at the same time."""
+
+    file_extension = ".cached"
+
+    def __init__(self, folder, ttl, max_size, refresh, buffer_size):
+
+        self.folder = Path(folder)
+        self.folder.mkdir(parents=True, exist_ok=True)
+
+        # time to live in seconds, maximum size in bytes
+        self.ttl = ttl
+        self.max_size = max_size
+
+        # if set, cached results are never read but still replaced with fresh ones
+        self.refresh = refresh
+
+        # how many bytes of a result read as file are kept in memory at most
+        self.buffer_size = buffer_size
+
+        # the size is only tracked within this process, and thus recomputed from disk before evicting
+        self._lock = threading.Lock()
+        self._size = sum(size for cached_file, size, last_used in self.list_cached_files())
+
+        logging.info(
+            "Using result cache in " + str(self.folder) + " with ttl " + str(ttl) +
+            " seconds and maximum size " + str(max_size) + " bytes")
+
+
+    def get_key(self, endpoint, query_string, results_format):
+        """Returns the key under which a result is cached, derived from the endpoint, the query text
+        (ignoring indentations and empty lines) and the results format"""
+
+        normalized_query = "\n".join(line.strip() for line in query_string.splitlines() if line.strip() != "")
+        key_source = json.dumps([endpoint, normalized_query, results_format])
+
+        return hashlib.sha256(key_source.encode("utf-8")).hexdigest()
+
+
+    def get(self, endpoint, query_string, results_format, as_file=False):
+        """Returns the cached raw result, its original execution duration and the time it was cached at,
+        or None if there is no valid cached result. If as_file is set, the raw result is returned as a binary file
+        (spooled to disk beyond buffer_size) instead of as bytes."""
+
+        if self.refresh:
+            return None
+
+        key = self.get_key(endpoint, query_string, results_format)
+        cached_file = self.folder / (key + self.file_extension)
+
+        try:
+            with cached_file.open('rb') as fr:
+
+                meta = json.loads(fr.readline().decode("utf-8"))
+
+                if time.time() - meta['timestamp_cached'] > self.ttl:
+                    logging.info("Cached result " + key + " expired.")
+                    return None
+
+                if as_file:
+                    result = tempfile.SpooledTemporaryFile(max_size=self.buffer_size)
+                    shutil.copyfileobj(fr, result, self.buffer_size)
+                    result.seek(0)
+                else:
+                    result = fr.read()
+
+        except (OSError, ValueError, KeyError):
+            return None
+
+        # mark as recently used for the eviction
+        try:
+            os.utime(cached_file)
+        except OSError:
+            pass
+
+        logging.info("Found cached result " + key)
+
+        return result, meta['execution_duration'], meta['timestamp_cached']
+
+
+    def put(self, endpoint, query_string, results_format, result, execution_duration):
+        """Stores a raw result (as bytes or as binary file) in the cache, and evicts the least recently used results
+        if the cache grew too big"""
+
+        key = self.get_key(endpoint, query_string, results_format)
+        cached_file = self.folder / (key + self.file_extension)
+
+        meta = {
+            'endpoint': endpoint,
+            'query': query_string,
+            'results_format': results_format,
+            'execution_duration': execution_duration,
+            'timestamp_cached': time.time(),
+        }
+
+        # Written into a temporary file of a unique name first, which then replaces the cached file at once, so that
+        # readers never see a partially written result, also if several processes write the same result.
+        file_descriptor, cached_file_tmp = tempfile.mkstemp(dir=self.folder, prefix=key, suffix=".tmp")
+
+        try:
+            with os.fdopen(file_descriptor, 'wb') as fw:
+                fw.write(json.dumps(meta).encode("utf-8") + b"\n")
+                if type(result) is bytes:
+                    fw.write(result)
+                else:
+                    result.seek(0)
+                    shutil.copyfileobj(result, fw)
+                    result.seek(0)
+            os.replace(cached_file_tmp, cached_file)
+
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(cached_file_tmp)
+            raise
+
+        with self._lock:
+
+            with contextlib.suppress(OSError):
+                self._size += cached_file.stat().st_size
+
+            if self._size > self.max_size:
+                self.evict()
+
+
+    def list_cached_files(self):
+        """Returns the cached files with their size and the time they were last used, skipping any removed meanwhile"""
+
+        cached_files = []
+
+        for cached_file in self.folder.glob("*" + self.file_extension):
+            try:
+                stat = cached_file.stat()
+            except FileNotFoundError:
+                continue
+            cached_files.append( (cached_file, stat.st_size, stat.st_mtime) )
+
+        return cached_files
+
+
+    def evict(self):
+        """Deletes the least recently used results until the cache is within its maximum size again. Since other
+        processes might use the same cache, its size is recomputed from disk, and results deleted meanwhile by other
+        processes are skipped."""
+
+        cached_files = sorted(self.list_cached_files(), key=lambda cached: cached[2])
+        self._size = sum(size for cached_file, size, last_used in cached_files)
+
+        for cached_file, size, last_used in cached_files:
+
+            if self._size <= self.max_size:
+                break
+
+            logging.info("Evicting cached result " + cached_file.stem)
+            cached_file.unlink(missing_ok=True)
+            self._size -= size
+
+
+
+
+class Run_journal:
+    """the Run_journal Class records the progress of a run writing into a local folder, in the file 'journal.jsonl' of
+    the folder, so that the run can be resumed from there should it be interrupted (see '--resume'). Its first entry
+    describes the run, each further entry a query whose results and summary were written completely: its id, its query
+    text, the file of its results, and the cells it wrote into the summary (see Summary_recorder). Entries are lines of
+    json, each flushed to disk right away, so that the journal is complete up to the last query written, however the
+    run ended."""
+
+    file_name = "journal.jsonl"
+
+    def __init__(self, folder, run=None):
+        """Starts the journal of a new run with the given entry describing it, or if None, reads the journal of an
+        interrupted run from the folder, to continue it"""
+
+        self.path = Path(folder) / self.file_name
+
+        if run is None:
+            self.run, self.header, self.queries = self.read(folder)
+        else:
+            self.run = run
+            self.header = None
+            self.queries = {}
+
+        self._file = self.path.open("a", encoding="utf-8")
+
+        if run is not None:
+            self.record({ "run": run })
+
+
+    @classmethod
+    def read(cls, folder):
+        """Reads the journal of a run from its folder. Returns the entry describing the run, the entry of the header of
+        the summary (None if not written yet), and the entries of the queries written completely, by their ids. An
+        entry cut off by the interruption of the run is ignored."""
+
+        path = Path(folder) / cls.file_name
+
+        if not path.is_file():
+            message = "\nERROR: No journal of a run found in: " + str(folder)
+            logging.error(message)
+            sys.exit(message)
+
+        run = None
+        header = None
+        queries = {}
+
+        with path.open("r", encoding="utf-8") as journal_file:
+            for line in journal_file:
+
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    logging.warning("Ignoring incomplete entry of journal: " + line)
+                    continue
+
+                if "run" in entry:
+                    run = entry["run"]
+                elif "header" in entry:
+                    header = entry["header"]
+                elif "query" in entry:
+                    queries[entry["query"]["id"]] = entry["query"]
+
+        if run is None:
+            message = "\nERROR: The journal " + str(path) + " does not describe a run."
+            logging.error(message)
+            sys.exit(message)
+
+        return run, header, queries
+
+
+    def record(self, entry):
+        """Appends an entry to the journal and flushes it to disk"""
+
+        self._file.write(json.dumps(entry) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+
+    def close(self):
+
+        self._file.close()
+
+
+
+
+class Summary_recorder:
+    """the Summary_recorder Class stands in for the summary worksheet of a xlsx file, passing all calls on to it while
+    recording them in a form which can be written into a journal (see Run_journal). Since xlsx files can't be appended to,
+    the summary of a resumed run is written anew, by replaying the recorded calls of the queries written before."""
+
+    def __init__(self, worksheet):
+
+        self.worksheet = worksheet
+        self.calls = []
+
+        # formats are recorded by their names
+        self.formats = {}
+        self.formats_names = {}
+
+
+    def add_formats(self, formats):
+        """Registers the formats of the workbook by their names, so that calls using them can be recorded and replayed"""
+
+        for name, cell_format in formats.items():
+            self.formats[name] = cell_format
+            self.formats_names[id(cell_format)] = name
+
+
+    def write(self, y, x, value, cell_format=None):
+        self.record("write", [ y, x, value, cell_format ])
+        self.worksheet.write(y, x, value, cell_format)
+
+
+    def write_row(self, y, x, values, cell_format=None):
+        self.record("write_row", [ y, x, list(values), cell_format ])
+        self.worksheet.write_row(y, x, values, cell_format)
+
+
+    def write_datetime(self, y, x, value, cell_format=None):
+        self.record("write_datetime", [ y, x, value, cell_format ])
+        self.worksheet.write_datetime(y, x, value, cell_format)
+
+
+    def set_row(self, y, height):
+        self.record("set_row", [ y, height ])
+        self.worksheet.set_row(y, height)
+
+
+    def set_column(self, columns, width):
+        self.record("set_column", [ columns, width ])
+        self.worksheet.set_column(columns, width)
+
+
+    def record(self, method, arguments):
+        self.calls.append([ method, [ self.encode_value(argument) for argument in arguments ] ])
+
+
+    def take_calls(self):
+        """Returns the calls recorded since the last time, and starts recording anew"""
+
+        calls = self.calls
+        self.calls = []
+        return calls
+
+
+    def replay(self, calls):
+        """Passes calls recorded before on to the worksheet, without recording them again"""
+
+        for method, arguments in calls:
+            getattr(self.worksheet, method)(*[ self.decode_value(argument) for argument in arguments ])
+
+
+    def encode_value(self, value):
+        """Returns a value as written into the summary in a form which can be written as json"""
+
+        if type(value) is list:
+            return [ self.encode_value(element) for element in value ]
+        elif isinstance(value, xlsxwriter.format.Format):
+            return { "format": self.formats_names[id(value)] }
+        elif type(value) is decimal.Decimal:
+            return float(value)
+        elif type(value) is datetime.datetime:
+            return { "datetime": value.isoformat() }
+        elif type(value) is datetime.date:
+            return { "date": value.isoformat() }
+        else:
+            return value
+
+
+    def decode_value(self, value):
+        """Returns a value encoded by encode_value as it was written into the summary"""
+
+        if type(value) is list:
+            return [ self.decode_value(element) for element in value ]
+        elif type(value) is dict and "format" in value:
+            return self.formats[value["format"]]
+        elif type(value) is dict and "datetime" in value:
+            return datetime.datetime.fromisoformat(value["datetime"])
+        elif type(value) is dict and "date" in value:
+            return datetime.date.fromisoformat(value["date"])
+        else:
+            return value
+
+
+
+
+class Results_matrix:
+    """the Results_matrix Class holds the harmonized results of a query in a compact, column-oriented way,
+    while behaving like the two-dimensional list it replaces (first row: variables, all others: their values).
+
+    Columns containing only integers or only floats are stored as typed arrays, all other columns as lists,
+    wherein repeated strings (e.g. IRIs) are stored only once. Rows are provided as lightweight views on the columns.
+
+    The type of each column is inferred once from a sample of its values, after which the whole column is converted
+    by a single converter, instead of trying to convert every value on its own. Values already converted while
+    parsing (typed literals of xml and json results) are taken into account by their python type.
+    """
+
+    __slots__ = ("header", "column_types", "_columns", "_strings", "_rows_count")
+
+    # number of rows sampled for inferring the types of the columns
+    type_inference_sample_size = 1000
+
+    # patterns a value must match to be of a type, in the order in which the types are preferred.
+    # Since every int is also a valid decimal, and every decimal a valid float, a column of mixed numbers
+    # is given the narrowest type fitting all its values. Numbers with leading zeros (e.g. postal codes) are
+    # kept as strings.
+    column_type_patterns = [
+        ("int", re.compile(r"[+-]?(0|[1-9][0-9]*)")),
+        ("decimal", re.compile(r"[+-]?((0|[1-9][0-9]*)(\.[0-9]*)?|\.[0-9]+)")),
+        ("float", re.compile(r"[+-]?((0|[1-9][0-9]*)(\.[0-9]*)?|\.[0-9]+)([eE][+-]?[0-9]+)?")),
+        ("boolean", re.compile(r"true|false")),
+        ("date", re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}")),
+        ("datetime", re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}T[0-9]{2}:[0-9]{2}:[0-9]{2}(\.[0-9]+)?(Z|[+-][0-9]{2}:[0-9]{2})?")),
+    ]
+
+    column_type_converters = {
+        "int": int,
+        "decimal": decimal.Decimal,
+        "float": float,
+        "boolean": convert_to_boolean,
+        "date": convert_to_date,
+        "datetime": convert_to_datetime,
+    }
+
+    # types of columns which can hold values already converted to a python type (e.g. from typed literals),
+    # again in the order in which they are preferred
+    column_types_of_values = {
+        int: ("int", "decimal", "float"),
+        decimal.Decimal: ("decimal", "float"),
+        float: ("float",),
+        bool: ("boolean",),
+        datetime.date: ("date",),
+        datetime.datetime: ("datetime",),
+    }
+
+    # converters for typed literals of sparql results, keyed by the IRI of their xsd datatype
+    xsd_datatype_converters = {
+        "http://www.w3.org/2001/XMLSchema#integer": int,
+        "http://www.w3.org/2001/XMLSchema#int": int,
+        "http://www.w3.org/2001/XMLSchema#long": int,
+        "http://www.w3.org/2001/XMLSchema#short": int,
+        "http://www.w3.org/2001/XMLSchema#byte": int,
+        "http://www.w3.org/2001/XMLSchema#nonNegativeInteger": int,
+        "http://www.w3.org/2001/XMLSchema#nonPositiveInteger": int,
+        "http://www.w3.org/2001/XMLSchema#positiveInteger": int,
+        "http://www.w3.org/2001/XMLSchema#negativeInteger": int,
+        "http://www.w3.org/2001/XMLSchema#unsignedLong": int,
+        "http://www.w3.org/2001/XMLSchema#unsignedInt": int,
+        "http://www.w3.org/2001/XMLSchema#unsignedShort": int,
+        "http://www.w3.org/2001/XMLSchema#unsignedByte": int,
+        "http://www.w3.org/2001/XMLSchema#decimal": decimal.Decimal,
+        "http://www.w3.org/2001/XMLSchema#double": float,
+        "http://www.w3.org/2001/XMLSchema#float": float,
+        "http://www.w3.org/2001/XMLSchema#boolean": convert_to_boolean,
+        "http://www.w3.org/2001/XMLSchema#date": convert_to_date,
+        "http://www.w3.org/2001/XMLSchema#dateTime": convert_to_datetime,
+    }
+
+    def __init__(self, rows=None):
+
+        self.header = None
+        self.column_types = None
+        self._columns = []
+        self._strings = {}
+        self._rows_count = 0
+
+        if rows is not None:
+            for row in rows:
+                self.append(row)
+
+
+    def append(self, row):
+        """Appends a row, the first row appended being the header"""
+
+        if self.header is None:
+            self.header = list(row)
+            self._columns = [ None for value in self.header ]
+            return
+
+        for x in range(0, len(self._columns)):
+
+            value = row[x]
+            column = self._columns[x]
+
+            if type(value) is str:
+                value = self._strings.setdefault(value, value)
+
+            # the type of a column is decided by its first value, and falls back to a list on any other value
+            if column is None:
+                if type(value) is int and -2**63 <= value < 2**63:
+                    column = array.array('q')
+                elif type(value) is float:
+                    column = array.array('d')
+                else:
+                    column = []
+                column.append(value)
+                self._columns[x] = column
+
+            elif type(column) is list:
+                column.append(value)
+
+            elif (column.typecode == 'q' and type(value) is int and -2**63 <= value < 2**63) or \
+                    (column.typecode == 'd' and type(value) is float):
+                column.append(value)
+
+            else:
+                column = list(column)
+                column.append(value)
+                self._columns[x] = column
+
+        self._rows_count += 1
+
+
+    def infer_column_types(self):
+        """Infers the type of every column from the first type_inference_sample_size rows, a type being chosen only if
+        all non-empty values of the sample match its pattern. Returns the list of types, one for each column."""
+
+        column_types = []
+
+        for column in self._columns:
+
+            candidates = [ column_type for column_type, pattern in self.column_type_patterns ]
+            is_empty = True
+
+            if column is not None:
+                for value in itertools.islice(column, self.type_inference_sample_size):
+
+                    if value == "" or value is None:
+                        continue
+
+                    is_empty = False
+
+                    if type(value) is str:
+                        candidates = [
+                            column_type for column_type, pattern in self.column_type_patterns
+                            if column_type in candidates and pattern.fullmatch(value)
+                        ]
+                    else:
+                        candidates = [
+                            column_type for column_type in candidates
+                            if column_type in self.column_types_of_values.get(type(value), ())
+                        ]
+
+                    if len(candidates) == 0:
+                        break
+
+            if is_empty or len(candidates) == 0:
+                column_types.append("string")
+            else:
+                column_types.append(candidates[0])
+
+        return column_types
+
+
+    def apply_column_types(self, column_types):
+        """Converts every column as a whole to its given type, empty values becoming None. Should any value of
+        a column not fit its type, the column is kept as it is and its type falls back to string."""
+
+        self.column_types = list(column_types)
+
+        for x in range(0, len(self._columns)):
+
+            column = self._columns[x]
+
+            if column is None or self.column_types[x] == "string":
+                continue
+
+            converted_column = self.convert_column(column, self.column_types[x])
+
+            if converted_column is None:
+                self.column_types[x] = "string"
+                continue
+
+            # the converted strings don't need to be kept anymore
+            for value in column:
+                self._strings.pop(value, None)
+
+            try:
+                if self.column_types[x] == "int":
+                    converted_column = array.array('q', converted_column)
+                elif self.column_types[x] == "float":
+                    converted_column = array.array('d', converted_column)
+            except (OverflowError, TypeError):
+                converted_column = list(converted_column)
+
+            self._columns[x] = converted_column
+
+
+    @classmethod
+    def convert_column(cls, values, column_type, lenient=False):
+        """Converts all values of a column to the given type in one go, empty values becoming None. Returns None if a
+        value doesn't fit the type, or if lenient is set, keeps such values as they are instead."""
+
+        converter = cls.column_type_converters[column_type]
+
+        try:
+            return [ None if value == "" or value is None else converter(value) for value in values ]
+
+        except (ValueError, TypeError, ArithmeticError, LookupError):
+
+            if not lenient:
+                return None
+
+            converted_values = []
+            for value in values:
+                try:
+                    converted_values.append(None if value == "" or value is None else converter(value))
+                except (ValueError, TypeError, ArithmeticError, LookupError):
+                    converted_values.append(value)
+
+            return converted_values
+
+
+    def get_value(self, y, x):
+        """Returns the value of the y-th result row (not counting the header) in the x-th column"""
+
+        return self._columns[x][y]
+
+
+    def __len__(self):
+
+        if self.header is None:
+            return 0
+        else:
+            return self._rows_count + 1
+
+
+    def __getitem__(self, y):
+
+        if type(y) is slice:
+            return [ self[i] for i in range(*y.indices(len(self))) ]
+
+        if y < 0:
+            y += len(self)
+
+        if y < 0 or y >= len(self):
+            raise IndexError("results_matrix index out of range")
+
+        if y == 0:
+            return self.header
+        else:
+            return Results_row(self, y - 1)
+
+
+    def __iter__(self):
+
+        for y in range(0, len(self)):
+            yield self[y]
+
+
+    def __repr__(self):
+        return repr([ list(row) for row in self ])
+
+
+
+
+class Results_row:
+    """the Results_row Class is a view on a single result row of a Results_matrix, behaving like a list"""
+
+    __slots__ = ("_results_matrix", "_y")
+
+    def __init__(self, results_matrix, y):
+
+        self._results_matrix = results_matrix
+        self._y = y
+
+
+    def __len__(self):
+        return len(self._results_matrix.header)
+
+
+    def __getitem__(self, x):
+
+        if type(x) is slice:
+            return [ self[i] for i in range(*x.indices(len(self))) ]
+
+        if x < 0:
+            x += len(self)
+
+        if x < 0 or x >= len(self):
+            raise IndexError("results row index out of range")
+
+        return self._results_matrix.get_value(self._y, x)
+
+
+    def __iter__(self):
+
+        for x in range(0, len(self)):
+            yield self._results_matrix.get_value(self._y, x)
+
+
+    def __eq__(self, other):
+
+        try:
+            return list(self) == list(other)
+        except TypeError:
+            return NotImplemented
+
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+
+
+class Json_stream:
+    """the Json_stream Class decodes a json document incrementally from a binary file, value by value, reading the file
+    in chunks. This way the elements of an array can be iterated without ever loading the whole document into memory."""
+
+    def __init__(self, json_file, buffer_size=65536):
+
+        self._file = json_file
+        self._buffer_size = buffer_size
+        self._decoder = json.JSONDecoder()
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._position = 0
+        self._is_eof = False
+
+
+    def _fill(self):
+        """Reads the next chunk from the file into the buffer, discarding the already decoded part of the buffer.
+        Returns False if the end of the file was reached."""
+
+        if self._is_eof:
+            return False
+
+        chunk = self._file.read(self._buffer_size)
+        if not chunk:
+            self._is_eof = True
+
+        self._buffer = self._buffer[self._position:] + self._text_decoder.decode(chunk, final=self._is_eof)
+        self._position = 0
+
+        return True
+
+
+    def peek(self):
+        """Returns the next character which is not whitespace, without consuming it ("" at the end of the document)"""
+
+        while True:
+
+            while self._position < len(self._buffer) and self._buffer[self._position] in " \t\n\r":
+                self._position += 1
+
+            if self._position < len(self._buffer):
+                return self._buffer[self._position]
+
+            if not self._fill():
+                return ""
+
+
+    def expect(self, character):
+        """Consumes the next character which is not whitespace, which must be the given one"""
+
+        found = self.peek()
+
+        if found != character:
+            raise ValueError(
+                "Invalid json document, expected '" + character + "' but found '" + found + "'")
+
+        self._position += 1
+
+
+    def decode_value(self):
+        """Decodes and returns the next complete json value"""
+
+        self.peek()
+
+        while True:
+
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._position)
+
+                # a number at the end of the buffer might continue in the next chunk
+                if end < len(self._buffer) or self._is_eof:
+                    self._position = end
+                    return value
+
+            except ValueError:
+                if self._is_eof:
+                    raise
+
+            self._fill()
+
+
+    def iterate_object_keys(self):
+        """Iterates over the keys of the next json object. The value of every key must be consumed by the caller
+        (e.g. by decode_value, iterate_object_keys or iterate_array) before the next key is requested."""
+
+        self.expect("{")
+
+        if self.peek() == "}":
+            self._position += 1
+            return
+
+        while True:
+
+            key = self.decode_value()
+            self.expect(":")
+
+            yield key
+
+            if self.peek() == ",":
+                self._position += 1
+            else:
+                self.expect("}")
+                return
+
+
+    def iterate_array(self):
+        """Iterates over the elements of the next json array, decoding them one by one"""
+
+        self.expect("[")
+
+        if self.peek() == "]":
+            self._position += 1
+            return
+
+        while True:
+
+            yield self.decode_value()
+
+            if self.peek() == ",":
+                self._position += 1
+            else:
+                self.expect("]")
+                return
+
+
+
+
+class Query_collection_data_object:
+    """Data object encapsulating all data around a query collection file,
+    while also providing some logic (especially regarding multi values)
+
+    Attributes provided by end-user:
+        title: title of the whole query collection (optional)
+        description: description of the whole query collection (optional)
+        output_destination: where to save the results (optional, default: current folder)
+        output_format: what format should the results be saved in (optional, default: csv)
+        summary_sample_limit: how many rows from the results should be used as sample (optional, default: 5)
+        cooldown_between_queries: how many seconds should the execution be paused between queries (optional)
+        count_the_results: should results of queries be counted (True, False, 'smart' or 'batched') (optional, default: True)
+        write_empty_results: should empty results be written into summaries (optional)
+        max_parallel_queries: how many queries should be executed at the same time (optional, default: 1)
+        endpoint_pool_size: how many persistent connections to the endpoint should be kept (optional, default: max_parallel_queries * max_parallel_pages,
+            plus max_parallel_queries if count_the_results is True or 'batched')
+        endpoint_idle_timeout: after how many seconds an unused connection to the endpoint is discarded (optional, default: 30)
+        endpoint_timeout: after how many seconds of waiting for the endpoint a request fails (optional, default: None)
+        cache_ttl: for how many seconds results should be cached (optional, default: 0, i.e. no caching)
+        cache_folder: in which folder the cached results are stored (optional, default: SparqLaborer_cache)
+        cache_max_size: how many megabytes the cached results may take up at most (optional, default: 1024)
+        stream_results: should results be read incrementally instead of as a whole (optional, default: False)
+        stream_buffer_size: how many kilobytes of a streamed result are kept in memory at most (optional, default: 1024)
+        max_parallel_pages: how many pages of a query with page_size are fetched at the same time (optional, default: 1)
+        page_retries: how often fetching a page of a query with page_size is retried, should it fail (optional, default: 2)
+        endpoint_max_rows: the maximum number of rows the endpoint returns for a query, used if count_the_results is 'smart' (optional)
+        google_flush_requests: after how many queued requests to google sheets these are sent together (optional, default: 100)
+        google_flush_cells: after how many queued cells of values to google sheets these are sent together (optional, default: 50000)
+        max_parallel_uploads: how many chunks of values are written into google sheets at the same time (optional, default: 4)
+        upload_retries: how often writing a chunk of values into google sheets is retried, should it fail (optional, default: 2)
+        endpoint_rate_limit: how many requests per second are sent to the endpoint at most (optional)
+        google_sheets_rate_limit: how many requests per second are sent to the google sheets api at most (optional, default: 1)
+        google_drive_rate_limit: how many requests per second are sent to the google drive api at most (optional, default: 10)
+        max_retries: how often requests failing due to transient errors are retried (optional, default: 3)
+        retry_backoff: how many seconds to wait at most before the first retry, doubled with every further one (optional, default: 1)
+        retry_max_backoff: how many seconds to wait at most before any retry (optional, default: 60)
+        max_parallel_variants: how many variants of multi-values are run at the same time, each in its own process (optional, default: 1)
+        output_compression: how result files written into a local folder are compressed: gzip, zstd or xz (optional, default: None)
+        output_compression_level: the level of the output_compression (optional, default: None, i.e. the default of the compression)
+        output_compression_threads: how many threads compress a result file, only used by zstd (optional, default: 1)
+        endpoint: which sparql endpoint (mandatory)
+        queries: the list containing query data objects
+        credentials_path: path to google credentials (optional)
+        client_secret_path: path to google client secrets (optional)
+
+    Attributes handled by SparqLaborer internally:
+        output_writer: object which handles all the output writing
+        endpoint_client: object which keeps the pooled connections to the endpoint during a run
+        retry_policy: object which retries requests to the endpoint failed due to transient errors
+        result_cache: object which reads and writes cached results (None if caching is not used)
+        cache_disabled: if the result cache was disabled by command line
+        cache_refresh: if cached results should be replaced by fresh ones, as requested by command line
+        resume_folder: the folder of an interrupted run, which is resumed as requested by command line (None otherwise)
+        shared_results_formats: the format in which the results shared between variants are fetched, by endpoint and query
+        shared_results: the results shared between variants which were fetched already, by endpoint and query
+        count_triples_in_endpoint_timestamp_cached: when the count of all triples was cached (None if not read from cache)
+        query_collection_module: the query collection file written by the end-user
+        query_collection_filename: the original file name of the query collection file
+        timestamp_start: start of execution
+        count_triples_in_endpoint: how many triples are there in the store in total
+        header_error_message: message if an error occured during counting of all triples
+        current_multi_value: which current multi value index is used
+        multi_value_length: how many multi value options are the maximumg
+
+
+
+    """
+
+    def __init__(self):
+
+        # current_multi_value represents the current index the query_collection is in regard to the possible
+        # multi values lists provided by the user
+        # e.g. two output_formats: [xml, csv], where current_multi_value represents the current element in the list.
+        # Is set to -1 because the method 'has_next' is called before the first item is accessed.
+        self._current_multi_value = 0
+
+        # multiv_value_length represents the possible length of a multi_value list.
+        self._multi_value_length = 1
+
+        # can be set by command line arguments only
+        self.cache_disabled = False
+        self.cache_refresh = False
+        self.resume_folder = None
+
+        # results executed only once for several variants (see plan_shared_results)
+        self.shared_results_formats = {}
+        self.shared_results = {}
+        self.shared_results_lock = threading.Lock()
+
+
+    # All the following variables could contain multi-values provided by the user,
+    # Thus when being read from the query collection file, they need to parsed into proper lists if needed,
+    # and when being used during processing, the correct current value of a multi-value list needs to be returned.
+
+
+    # title
+
+    @property
+    def title(self):
+        """Since the title is used as either file or folder or google sheet name, it's important for these
+        names to be unique. Thus the following if's are checking for duplicate titles and if detected
+        return them with a (n) attached where n represents the incrementing duplicate number.
+        Note that this logic here does not actually persist the title in the query_collection_data_object,
+        but only produces the adaptions on the fly when being queried."""
+
+        if self._multi_value_length > 1 :
+
+            if type(self._title) is list:
+
+                found_count = 0
+                for i in range(self._current_multi_value):
+                    if self._title[i] ==  self._title[self._current_multi_value]:
+                        found_count += 1
+
+                if found_count > 0:
+                    return self._title[self._current_multi_value] + " (" + str(found_count+1) + ")"
+                else:
+                    return self._title[self._current_multi_value]
+
+            else:
+                return self._title + " (" + str(self._current_multi_value+1) + ")"
+        else:
+            return self._title
+
+    @title.setter
+    def title(self, title):
+
+        if type(title) is list:
+            unsanitised_list = self.construct_multi_values(title)
+            self._title = [ str(e) for e in unsanitised_list ]
+        else:
+            self._title = str(title)
+
+
+    # description
+
+    @property
+    def description(self):
+        return self.return_current_multi_value_of(self._description)
+
+    @description.setter
+    def description(self, description):
+
+        def sanitise_description(unsanitised_description):
+
+            if unsanitised_description is None:
+                return ""
+            elif type(unsanitised_description) is str:
+                return unsanitised_description
+            else:
+                error_message = "Found invalid data type for description! \n" + \
+                    "Expected type: str\nFound type: " + str(type(unsanitised_description)) + \
+                    "\nFound value: " + str(unsanitised_description)
+                logging.error(error_message)
+                raise ValueError(error_message)
+
+
+        if type(description) is list:
+            unsanitised_list = self.construct_multi_values(description)
+            self._description = [ sanitise_description(e) for e in unsanitised_list ]
+        else:
+            self._description = sanitise_description(description)
+
+
+    # output_destination
+
+    @property
+    def output_destination(self):
+        return self.return_current_multi_value_of(self._output_destination)
+
+    @output_destination.setter
+    def output_destination(self, output_destination):
+
+        def sanitise_output_destination(unsanitised_output_destination):
+
+            if unsanitised_output_destination is None:
+                return "."
+            elif type(unsanitised_output_destination) is str:
+                if unsanitised_output_destination == "" or unsanitised_output_destination.isspace():
+                    return "."
+                else:
+                    return unsanitised_output_destination
+            else:
+                error_message = "Found invalid data type for output_destination! \n" + \
+                    "Expected type: str\nFound type: " + str(type(unsanitised_output_destination)) + \
+                    "\nFound value: " + str(unsanitised_output_destination)
+                logging.error(error_message)
+                raise ValueError(error_message)
+
+
+        if type(output_destination) is list:
+            unsanitised_list = self.construct_multi_values(output_destination)
+            self._output_destination = [ sanitise_output_destination(e) for e in unsanitised_list ]
+        else:
+            self._output_destination = sanitise_output_destination(output_destination)
+
+
+    # output_format
+
+    @property
+    def output_format(self):
+        return self.return_current_multi_value_of(self._output_format)
+
+    @output_format.setter
+    def output_format(self, output_format):
+
+        def sanitise_output_format(unsanitised_output_format):
+
+            if unsanitised_output_format is None or type(unsanitised_output_format) is not str:
+                error_message = "No valid output_format found. Possible formats are: \n" + \
+                                 "CSV, TSV, XML, JSON, XLSX, PARQUET, ARROW\n" + \
+                                 "Found format is " + str(unsanitised_output_format)
+                logging.error(error_message)
+                raise ValueError(error_message)
+
+            if unsanitised_output_format.upper() == "CSV" or unsanitised_output_format.upper() == CSV:
+                return CSV
+            elif unsanitised_output_format.upper() == "TSV" or unsanitised_output_format.upper() == TSV:
+                return TSV
+            elif unsanitised_output_format.upper() == "XML" or unsanitised_output_format.upper() == XML:
+                return XML
+            elif unsanitised_output_format.upper() == "JSON" or unsanitised_output_format.upper() == JSON:
+                return JSON
+            elif unsanitised_output_format.upper() == "XLSX":
+                return "XLSX"
+            elif unsanitised_output_format.upper() == "PARQUET" or unsanitised_output_format.upper() == "ARROW":
+                if pyarrow is None:
+                    error_message = "The output_format " + unsanitised_output_format + " requires the package pyarrow, " + \
+                                    "which can be installed with: pip install pyarrow"
+                    logging.error(error_message)
+                    raise ValueError(error_message)
+                return unsanitised_output_format.upper()
+            else:
+                error_message = "No valid output_format found. Possible formats are: \n" + \
+                                 "CSV, TSV, XML, JSON, XLSX, PARQUET, ARROW\n" + \
+                                 "Found format is " + str(unsanitised_output_format)
+                logging.error(error_message)
+                raise ValueError(error_message)
+
+
+        if type(output_format) is list:
+            unsanitised_list = self.construct_multi_values(output_format)
+            self._output_format = [ sanitise_output_format(e) for e in unsanitised_list ]
+        else:
+            self._output_format = sanitise_output_format(output_format)
+
+
+    # summary_sample_limit
+
+    @property
+    def summary_sample_limit(self):
+        return self.return_current_multi_value_of(self._summary_sample_limit)
+
+    @summary_sample_limit.setter
+    def summary_sample_limit(self, summary_sample_limit):
+
+        def sanitise_summary_sample_limit(unsanitised_summary_sample_limit):
+
+            if unsanitised_summary_sample_limit is None or type(unsanitised_summary_sample_limit) is not int:
+                error_message = "Found invalid data type for summary_sample_limit! \n" + \
+                    "Expected type: int\nFound type: " + str(type(unsanitised_count_the_results)) + \
+                    "\nFound value: " + str(unsanitised_count_the_results)
+                logging.error(error_message)
+                raise ValueError(error_message)
+
+            elif unsanitised_summary_sample_limit > 101:
+                message = "Found sample limit which is too high: " + str(unsanitised_summary_sample_limit) + \
+                          ", replaced it with limit of 100"
+                logging.info(message)
+                print(message)
+                return 101
+
+            elif unsanitised_summary_sample_limit < 0:
+                message = "Found invalid sample limit: " + str(unsanitised_summary_sample_limit) + \
+                          ", replaced it with limit of 5"
+                logging.info(message)
+                print(message)
+                return 5
+
+            else:
+                return unsanitised_summary_sample_limit
+
+
+        if type(summary_sample_limit) is list:
+            unsanitised_list = self.construct_multi_values(summary_sample_limit)
+            self._summary_sample_limit = [sanitise_summary_sample_limit(e) for e in unsanitised_list]
+        else:
+            self._summary_sample_limit = sanitise_summary_sample_limit(summary_sample_limit)
+
+
+    # cooldown_between_queries
+
+    @property
+    def cooldown_between_queries(self):
+        return self.return_current_multi_value_of(self._cooldown_between_queries)
+
+    @cooldown_between_queries.setter
+    def cooldown_between_queries(self, cooldown_between_queries):
+
+        def sanitise_cooldown_between_queries(unsanitised_cooldown_between_queries):
+
+            if unsanitised_cooldown_between_queries is None or type(unsanitised_cooldown_between_queries) is not int:
+                error_message = "Found invalid type of cooldown_between_queries.\n" + \
+                    "Expected type: int\nFound type: " + str(type(unsanitised_cooldown_between_queries)) + \
+                    "\nFound value: " + str(unsanitised_cooldown_between_queries)
+                logging.error(error_message)
+                raise ValueError(error_message)
+
+            else:
+
+                if unsanitised_cooldown_between_queries >= 0:
+                    return unsanitised_cooldown_between_queries
+
+                else:
+                    error_message = "Found invalid value for cooldown_between_queries: " + \
+                        "Expected value: greater than 0\n" + \
+                        "Found value:" + str(unsanitised_cooldown_between_queries)
+                    logging.error(error_message)
+                    raise ValueError(error_message)
+
+
+        if type(cooldown_between_queries) is list:
+            unsanitised_list = self.construct_multi_values(cooldown_between_queries)
+            self._cooldown_between_queries = [ sanitise_cooldown_between_queries(e) for e in unsanitised_list ]
+        else:
+            self._cooldown_between_queries = sanitise_cooldown_between_queries(cooldown_between_queries)
+
+
+    # write_empty_results
+
+    @property
+    def write_empty_results(self):
+        return self.return_current_multi_value_of(self._write_empty_results)
+
+    @write_empty_results.setter
+    def write_empty_results(self, write_empty_results):
+
+        def sanitise_write_empty_results(unsanitised_write_empty_results):
+
+            if unsanitised_write_empty_results is None or type(unsanitised_write_empty_results) is not bool:
+                error_message = "Found invalid type of write_empty_results.\n" + \
+                    "Expected type: bool\nFound type: " + str(type(unsanitised_write_empty_results)) + \
+                    "\nFound value: " + str(unsanitised_write_empty_results)
+                logging.error(error_message)
+                raise ValueError(error_message)
+
+            else:
+                return unsanitised_write_empty_results
+
+
+        if type(write_empty_results) is list:
+            unsanitised_list = self.construct_multi_values(write_empty_results)
+            self._write_empty_results = [ sanitise_write_empty_results(e) for e in unsanitised_list ]
+        else:
+            self._write_empty_results = sanitise_write_empty_results(write_empty_results)
+
+
+    # count_the_results
+
+    @property
+    def count_the_results(self):
+        return self.return_current_multi_value_of(self._count_the_results)
+
+    @count_the_results.setter
+    def count_the_results(self, count_the_results):
+
+        def sanitise_count_the_results(unsanitised_count_the_results):
+
+            if unsanitised_count_the_results is None or type(unsanitised_count_the_results) not in (bool, str):
+                error_message = "Found invalid type of count_the_results.\n" + \
+                    "Expected type: bool or str\nFound type: " + str(type(unsanitised_count_the_results)) + \
+                    "\nFound value: " + str(unsanitised_count_the_results)
+                logging.error(error_message)
+                raise ValueError(error_message)
+
+            elif type(unsanitised_count_the_results) is str and \
+                    unsanitised_count_the_results.lower() not in ("smart", "batched"):
+                error_message = "Found invalid value for count_the_results: " + \
+                    "Expected value: True, False, 'smart' or 'batched'\n" + \
+                    "Found value:" + str(unsanitised_count_the_results)
+                logging.error(error_message)
+                raise ValueError(error_message)
+
+            elif type(unsanitised_count_the_results) is str:
+                return unsanitised_count_the_results.lower()
+
+            else:
+                return unsanitised_count_the_results
+
+
+        if type(count_the_results) is list:
+            unsanitised_list = self.construct_multi_values(count_the_results)
+            self._count_the_results = [ sanitise_count_the_results(e) for e in unsanitised_list ]
+        else:
+            self._count_the_results = sanitise_count_the_results(count_the_results)
+
+
+    # max_parallel_queries
+
+    @property
+    def max_parallel_queries(self):
+        return self.return_current_multi_value_of(self._max_parallel_queries)
+
+    @max_parallel_queries.setter
+    def max_parallel_queries(self, max_parallel_queries):
+
+        def sanitise_max_parallel_queries(unsanitised_max_parallel_queries):
+
+            if unsanitised_max_parallel_queries is None or type(unsanitised_max_parallel_queries) is not int:
+                error_message = "Found invalid type of max_parallel_queries.\n" + \
+                    "Expected type: int\nFound type: " + str(type(unsanitised_max_parallel_queries)) + \
+                    "\nFound value: " + str(unsanitised_max_parallel_queries)
+                logging.error(error_message)
+                raise ValueError(error_message)
+
+            elif unsanitised_max_parallel_queries < 1:
+                error_message = "Found invalid value for max_parallel_queries: " + \
+                    "Expected value: 1 or greater\n" + \
+                    "Found value:" + str(unsanitised_max_parallel_queries)
+                logging.error(error_message)
+                raise ValueError(error_message)
+
+            else:
+                return unsanitised_max_parallel_queries
+
+
+        if type(max_parallel_queries) is list:
+            unsanitised_list = self.construct_multi_values(max_parallel_queries)
+            self._max_parallel_queries = [ sanitise_max_parallel_queries(e) for e in unsanitised_list ]
+        else:
+            self._max_parallel_queries = sanitise_max_parallel_queries(max_parallel_queries)
+
+
+    # endpoint_pool_size
+
+    @property
+    def endpoint_pool_size(self):
+        return self.return_current_multi_value_of(self._endpoint_pool_size)
+
+    @endpoint_pool_size.setter
+    def endpoint_pool_size(self, endpoint_pool_size):
+
+        def sanitise_endpoint_pool_size(unsanitised_endpoint_pool_size):
+
+            if unsanitised_endpoint_pool_size is None:
+                return None
+
+            elif type(unsanitised_endpoint_pool_size) is not int:
+                error_message = "Found invalid type of endpoint_pool_size.\n" + \
+                    "Expected type: int\nFound type: " + str(type(unsanitised_endpoint_pool_size)) + \
+                    "\nFound value: " + str(unsanitised_endpoint_pool_size)
+                logging.error(error_message)
+                raise ValueError(error_message)
+
+            elif unsanitised_endpoint_pool_size < 1:
+                error_message = "Found invalid value for endpoint_pool_size: " + \
+                    "Expected value: 1 or greater\n" + \
+                    "Found value:" + str(unsanitised_endpoint_pool_size)
+                logging.error(error_message)
+                raise ValueError(error_message)
+
+            else:
+                return unsanitised_endpoint_pool_size
+
+
+        if type(endpoint_pool_size) is list:
+            unsanitised_list = self.construct_multi_values(endpoint_pool_size)
+            self._endpoint_pool_size = [ sanitise_endpoint_pool_size(e) for e in unsanitised_list ]
+        else:
+            self._endpoint_pool_size = sanitise_endpoint_pool_size(endpoint_pool_size)
+
+
+    # endpoint_idle_timeout
+
+    @property
+    def endpoint_idle_timeout(self):
+        return self.return_current_multi_value_of(self._endpoint_idle_timeout)
+
+    @endpoint_idle_timeout.setter
+    def endpoint_idle_timeout(self, endpoint_idle_timeout):
+
+        def sanitise_endpoint_idle_timeout(unsanitised_endpoint_idle_timeout):
+
+            if unsanitised_endpoint_idle_timeout is None or type(unsanitised_endpoint_idle_timeout) not in (int, float):
+                error_message = "Found invalid type of endpoint_idle_timeout.\n" + \
+                    "Expected type: int or float\nFound type: " + str(type(unsanitised_endpoint_idle_timeout)) + \
+                    "\nFound value: " + str(unsanitised_endpoint_idle_timeout)
+                logging.error(error_message)
+                raise ValueError(error_message)
+
+            elif unsanitised_endpoint_idle_timeout < 0:
+                error_message = "Found invalid value for endpoint_idle_timeout: " + \
+                    "Expected value: 0 or greater\n" + \
+                    "Found value:" + str(unsanitised_endpoint_idle_timeout)
+                logging.error(error_message)
+                raise ValueError(error_message)
+
+            else:
+                return unsanitised_endpoint_idle_timeout
+
+
+        if type(endpoint_idle_timeout) is list:
+            unsanitised_list = self.construct_multi_values(endpoint_idle_timeout)
+            self._endpoint_idle_timeout = [ sanitise_endpoint_idle_timeout(e) for e in unsanitised_list ]
+        else:
+            self._endpoint_idle_timeout = sanitise_endpoint_idle_timeout(endpoint_idle_timeout)
+
+
+    # endpoint_timeout
+
+    @property
+    def endpoint_timeout(self):
+        return self.return_current_multi_value_of(self._endpoint_timeout)
+
+    @endpoint_timeout.setter
+    def endpoint_timeout(self, endpoint_timeout):
+
+        def sanitise_endpoint_timeout(unsanitised_endpoint_timeout):
+
+            if unsanitised_endpoint_timeout is None:
+                return None
+
+            elif type(unsanitised_endpoint_timeout) not in (int, float):
+                error_message = "Found invalid type of endpoint_timeout.\n" + \
+                    "Expected type: int or float\nFound type: " + str(type(unsanitised_endpoint_timeout)) + \
+                    "\nFound value: " + str(unsanitised_endpoint_timeout)
+                logging.error(error_message)
+                raise ValueError(error_message)
+
+            elif unsanitised_endpoint_timeout <= 0:
+                error_message = "Found invalid value for endpoint_timeout: " + \
+                    "Expected value: greater than 0\n" + \
+                    "Found value:" + str(unsanitised_endpoint_timeout)
+                logging.error(error_message)
+                raise ValueError(error_message)
+
+            else:
+                return unsanitised_endpoint_timeout
+
+
+        if type(endpoint_timeout) is list:
+            unsanitised_list = self.construct_multi_values(endpoint_timeout)
+            self._endpoint_timeout = [ sanitise_endpoint_timeout(e) for e in unsanitised_list ]
+        else:
+            self._endpoint_timeout = sanitise_endpoint_timeout(endpoint_timeout)
+
+
+    # cache_ttl
+
+    @property
+    def cache_ttl(self):
+        return self.return_current_multi_value_of(self._cache_ttl)
+
+    @cache_ttl.setter
+    def cache_ttl(self, cache_ttl):
+
+        def sanitise_cache_ttl(unsanitised_cache_ttl):
+
+            if unsanitised_cache_ttl is None or type(unsanitised_cache_ttl) not in (int, float):
+                error_message = "Found invalid type of cache_ttl.\n" + \
+                    "Expected type: int or float\nFound type: " + str(type(unsanitised_cache_ttl)) + \
+                    "\nFound value: " + str(unsanitised_cache_ttl)
+                logging.error(error_message)
+                raise ValueError(error_message)
+
+            elif unsanitised_cache_ttl < 0:
+                error_message = "Found invalid value for cache_ttl: " + \
+                    "Expected value: 0 or greater\n" + \
+                    "Found value:" + str(unsanitised_cache_ttl)
+                logging.error(error_message)
+                raise ValueError(error_message)
+
+            else:
+                return unsanitised_cache_ttl
+
+
+        if type(cache_ttl) is list:
+            unsanitised_list = self.construct_multi_values(cache_ttl)
+            self._cache_ttl = [ sanitise_cache_ttl(e) for e in unsanitised_list ]
+        else:
+            self._cache_ttl = sanitise_cache_ttl(cache_ttl)
+
+
+    # cache_folder
+
+    @property
+    def cache_folder(self):
+        return self.return_current_multi_value_of(self._cache_folder)
+
+    @cache_folder.setter
+    def cache_folder(self, cache_folder):
+
+        def sanitise_cache_folder(unsanitised_cache_folder):
+
+            if unsanitised_cache_folder is None or type(unsanitised_cache_folder) is not str:
+                error_message = "Found invalid type of cache_folder.\n" + \
+                    "Expected type: str\nFound type: " + str(type(unsanitised_cache_folder)) + \
+                    "\nFound value: " + str(unsanitised_cache_folder)
+                logging.error(error_message)
+                raise ValueError(error_message)
+
+            elif unsanitised_cache_folder == "" or unsanitised_cache_folder.isspace():
+                return "SparqLaborer_cache"
+
+            else:
+                return unsanitised_cache_folder
+
+
+        if type(cache_folder) is list:
+            unsanitised_list = self.construct_multi_values(cache_folder)
+            self._cache_folder = [ sanitise_cache_folder(e) for e in unsanitised_list ]
+        else:
+            self._cache_folder = sanitise_cache_folder(cache_folder)
+
+
+    # cache_max_size
+
+    @property
+    def cache_max_size(self):
+        return self.return_current_multi_value_of(self._cache_max_size)
+
+    @cache_max_size.setter
+    def cache_max_size(self, cache_max_size):
+
+        def sanitise_cache_max_size(unsanitised_cache_max_size):
+
+            if unsanitised_cache_max_size is None or type(unsanitised_cache_max_size) not in (int, float):
+                error_message = "Found invalid type of cache_max_size.\n" + \
+                    "Expected type: int or float\nFound type: " + str(type(unsanitised_cache_max_size)) + \
+                    "\nFound value: " + str(unsanitised_cache_max_size)
+                logging.error(error_message)
+                raise ValueError(error_message)
+
+            elif unsanitised_cache_max_size <= 0:
+                error_message = "Found invalid value for cache_max_size: " + \
+                    "Expected value: greater than 0\n" + \
+                    "Found value:" + str(unsanitised_cache_max_size)
+                logging.error(error_message)
+                raise ValueError(error_message)
+
+            else:
+                return unsanitised_cache_max_size
+
+
+        if type(cache_max_size) is list:
+            unsanitised_list = self.construct_multi_values(cache_max_size)
+            self._cache_max_size = [ sanitise_cache_max_size(e) for e in unsanitised_list ]
+        else:
+            self._cache_max_size = sanitise_cache_max_size(cache_max_size)
+
+
+    # stream_results
+
+    @property
+    def stream_results(self):
+        return self.return_current_multi_value_of(self._stream_results)
+
+    @stream_results.setter
+    def stream_results(self, stream_results):
+
+        def sanitise_stream_results(unsanitised_stream_results):
+
+            if unsanitised_stream_results is None or type(unsanitised_stream_results) is not bool:
+                error_message = "Found invalid type of stream_results.\n" + \
+                    "Expected type: bool\nFound type: " + str(type(unsanitised_stream_results)) + \
+                    "\nFound value: " + str(unsanitised_stream_results)
+                logging.error(error_message)
+                raise ValueError(error_message)
+
+            else:
+                return unsanitised_stream_results
+
+
+        if type(stream_results) is list:
+            unsanitised_list = self.construct_multi_values(stream_results)
+            self._stream_results = [ sanitise_stream_results(e) for e in unsanitised_list ]
+        else:
+            self._stream_results = sanitise_stream_results(stream_results)
+
+
+    # stream_buffer_size
+
+    @property
+    def stream_buffer_size(self):
+        return self.return_current_multi_value_of(self._stream_buffer_size)
+
+    @stream_buffer_size.setter
+    def stream_buffer_size(self, stream_buffer_size):
+
+        def sanitise_stream_buffer_size(unsanitised_stream_buffer_size):
+
+            if unsanitised_stream_buffer_size is None or type(unsanitised_stream_buffer_size) is not int:
+                error_message = "Found invalid type of stream_buffer_size.\n" + \
+                    "Expected type: int\nFound type: " + str(type(unsanitised_stream_buffer_size)) + \
+                    "\nFound value: " + str(unsanitised_stream_buffer_size)
+                logging.error(error_message)
+                raise ValueError(error_message)
+
+            elif unsanitised_stream_buffer_size < 1:
+                error_message = "Found invalid value for stream_buffer_size: " + \
+                    "Expected value: 1 or greater\n" + \
+                    "Found value:" + str(unsanitised_stream_buffer_size)
+                logging.error(error_message)
+                raise ValueError(error_message)
+
+            else:
+                return unsanitised_stream_buffer_size
+
+
+        if type(stream_buffer_size) is list:
+            unsanitised_list = self.construct_multi_values(stream_buffer_size)
+            self._stream_buffer_size = [ sanitise_stream_buffer_size(e) for e in unsanitised_list ]
+        else:
+            self._stream_buffer_size = sanitise_stream_buffer_size(stream_buffer_size)
+
+
+    # max_parallel_pages
+
+    @property
+    def max_parallel_pages(self):
+        return self.return_current_multi_value_of(self._max_parallel_pages)
+
+    @max_parallel_pages.setter
+    def max_parallel_pages(self, max_parallel_pages):
+
+        def sanitise_max_parallel_pages(unsanitised_max_parallel_pages):
+
+            if unsanitised_max_parallel_pages is None or type(unsanitised_max_parallel_pages) is not int:
+                error_message = "Found invalid type of max_parallel_pages.\n" + \
+                    "Expected type: int\nFound type: " + str(type(unsanitised_max_parallel_pages)) + \
+                    "\nFound value: " + str(unsanitised_max_parallel_pages)
+                logging.error(error_message)
+                raise ValueError(error_message)
 
-            sanitized_query_title = str(query_data_object.id) + sanitized_query_title
+            elif unsanitised_max_parallel_pages < 1:
+                error_message = "Found invalid value for max_parallel_pages: " + \
+                    "Expected value: a number of pages larger than 0\n" + \
+                    "Found value:" + str(unsanitised_max_parallel_pages)
+                logging.error(error_message)
+                raise ValueError(error_message)
 
-            if len(sanitized_query_title) > 30:
-                sanitized_query_title = sanitized_query_title[:29]
+            else:
+                return unsanitised_max_parallel_pages
 
-            worksheet = self.xlsx_workbook.add_worksheet( sanitized_query_title )
-            for y in range(0, len(query_data_object.results_matrix)):
-                for x in range(0, len(query_data_object.results_matrix[y])):
-                    column = query_data_object.results_matrix[y][x]
-                    if len(str(column)) > 255:
-                        column = str(column)[:255]
-                    worksheet.write(y, x, column)
 
+        if type(max_parallel_pages) is list:
+            unsanitised_list = self.construct_multi_values(max_parallel_pages)
+            self._max_parallel_pages = [ sanitise_max_parallel_pages(e) for e in unsanitised_list ]
+        else:
+            self._max_parallel_pages = sanitise_max_parallel_pages(max_parallel_pages)
 
-        def write_query_result_to_local_folder(query_data_object):
-            """Writes raw output using the respective data format into the specified local folder"""
 
+    # page_retries
 
-            # create file for query result
-            # (and replace "/" with "-" because the file-writer interprets "/" as subdirectory)
+    @property
+    def page_retries(self):
+        return self.return_current_multi_value_of(self._page_retries)
 
-            file_name = \
-                str(query_data_object.id) + ". " + \
-                query_data_object.title.replace("/", "-") + \
-                "." + self.output_format
-            local_file = Path(self.folder / file_name)
+    @page_retries.setter
+    def page_retries(self, page_retries):
 
+        def sanitise_page_retries(unsanitised_page_retries):
 
-            ## differentiate between different result-types which require different write-methods
+            if unsanitised_page_retries is None or type(unsanitised_page_retries) is not int:
+                error_message = "Found invalid type of page_retries.\n" + \
+                    "Expected type: int\nFound type: " + str(type(unsanitised_page_retries)) + \
+                    "\nFound value: " + str(unsanitised_page_retries)
+                logging.error(error_message)
+                raise ValueError(error_message)
 
-            # csv and tsv files need to be written as bytes
-            if self.output_format == CSV or self.output_format == TSV:
-                with local_file.open('wb') as fw:
-                    fw.write(query_data_object.results_raw)
+            elif unsanitised_page_retries < 0:
+                error_message = "Found invalid value for page_retries: " + \
+                    "Expected value: a number of retries not smaller than 0\n" + \
+                    "Found value:" + str(unsanitised_page_retries)
+                logging.error(error_message)
+                raise ValueError(error_message)
 
-            # xml document is passed a writer object
-            elif self.output_format == XML:
-                with local_file.open('w') as fw:
-                    query_data_object.results_raw.writexml(fw)
+            else:
+                return unsanitised_page_retries
 
-            # json needs json.dump() method
-            elif self.output_format == JSON:
-                with local_file.open('w') as fw:
-                    json.dump(query_data_object.results_raw, fw)
 
+        if type(page_retries) is list:
+            unsanitised_list = self.construct_multi_values(page_retries)
+            self._page_retries = [ sanitise_page_retries(e) for e in unsanitised_list ]
+        else:
+            self._page_retries = sanitise_page_retries(page_retries)
 
-        def write_query_result_to_google_sheets(query_data_object):
-            """Writes results as harmonized two-dimensional list into a separate sheet in the google sheets file"""
 
-            sanitized_query_title = query_data_object.title
-            if len(sanitized_query_title) > 100:
-                sanitized_query_title = sanitized_query_title[:99]
+    # endpoint_max_rows
 
-            sanitized_query_title = str(query_data_object.id) + ". " + sanitized_query_title
+    @property
+    def endpoint_max_rows(self):
+        return self.return_current_multi_value_of(self._endpoint_max_rows)
 
-            # create sheet
-            body_new_sheet = {
-                'requests' : [
-                    {
-                        'addSheet': {
-                            'properties': {
-                                'title': sanitized_query_title,
-                                'gridProperties': {
-                                    'rowCount': len(query_data_object.results_matrix),
-                                    'columnCount': len(query_data_object.results_matrix[0])
-                                }
-                            }
-                        }
-                    }
-                ]
-            }
-            result = self.google_service_sheets.spreadsheets().batchUpdate(
-                spreadsheetId=self.google_sheets_id,
-                body=body_new_sheet
-            ).execute()
-            google_sheet_id = result['replies'][0]['addSheet']['properties']['sheetId']
-            body_change_columns = {
-                'requests': [
-                    {
-                        "updateDimensionProperties": {
-                            "range": {
-                                "sheetId": google_sheet_id,
-                                "dimension": "COLUMNS",
-                                "startIndex": 0,
-                                "endIndex": 26
-                            },
-                            "properties": {
-                                "pixelSize": 300
-                            },
-                            "fields": "pixelSize"
-                        }
-                    }
-                ]
-            }
-            self.google_service_sheets.spreadsheets().batchUpdate(
-                spreadsheetId=self.google_sheets_id,
-                body=body_change_columns
-            ).execute()
+    @endpoint_max_rows.setter
+    def endpoint_max_rows(self, endpoint_max_rows):
 
-            # get range of harmonized results
-            google_sheet_range = \
-                sanitized_query_title + "!" + \
-                self.get_range_from_matrix(0, 0, query_data_object.results_matrix)
+        def sanitise_endpoint_max_rows(unsanitised_endpoint_max_rows):
 
-            # write into sheet
-            self.google_service_sheets.spreadsheets().values().update(
-                spreadsheetId=self.google_sheets_id,
-                range=google_sheet_range,
-                valueInputOption="RAW",
-                body={ 'values': query_data_object.results_matrix}
-            ).execute()
+            if unsanitised_endpoint_max_rows is None:
+                return None
 
-        main(query_data_object)
+            elif type(unsanitised_endpoint_max_rows) is not int:
+                error_message = "Found invalid type of endpoint_max_rows.\n" + \
+                    "Expected type: int\nFound type: " + str(type(unsanitised_endpoint_max_rows)) + \
+                    "\nFound value: " + str(unsanitised_endpoint_max_rows)
+                logging.error(error_message)
+                raise ValueError(error_message)
 
+            elif unsanitised_endpoint_max_rows < 1:
+                error_message = "Found invalid value for endpoint_max_rows: " + \
+                    "Expected value: a number of rows larger than 0\n" + \
+                    "Found value:" + str(unsanitised_endpoint_max_rows)
+                logging.error(error_message)
+                raise ValueError(error_message)
 
-    def write_query_summary(self, query_data_object):
-        """Writes the gist of the results of an executed query to a summary sheet"""
+            else:
+                return unsanitised_endpoint_max_rows
 
-        def main(query_data_object):
 
-            message = "Writing to summary"
-            logging.info(message)
-            print(message)
+        if type(endpoint_max_rows) is list:
+            unsanitised_list = self.construct_multi_values(endpoint_max_rows)
+            self._endpoint_max_rows = [ sanitise_endpoint_max_rows(e) for e in unsanitised_list ]
+        else:
+            self._endpoint_max_rows = sanitise_endpoint_max_rows(endpoint_max_rows)
 
-            if self.output_destination_type == 'local_xlsx' or self.output_destination_type == 'local_folder' :
-                write_query_summary_xlsx_file(query_data_object)
 
-            elif self.output_destination_type == 'google_sheets' or self.output_destination_type == 'google_folder':
-                write_query_summary_google_sheets(query_data_object)
+    # google_flush_requests
 
+    @property
+    def google_flush_requests(self):
+        return self.return_current_multi_value_of(self._google_flush_requests)
 
-        def write_query_summary_xlsx_file(query_data_object):
-            """Writes the gist of the results of an executed query to the summary sheet in the xlsx file"""
+    @google_flush_requests.setter
+    def google_flush_requests(self, google_flush_requests):
 
-            # query_title
-            self.xlsx_worksheet_summary.write(
-                self.line_number,
-                0,
-                str(query_data_object.id) + ". " + str(query_data_object.title),
-                self.title_2_format)
-            self.line_number += 1
+        def sanitise_google_flush_requests(unsanitised_google_flush_requests):
 
-            # query description
-            if not (query_data_object.description is None or
-                    query_data_object.description.isspace() or
-                    query_data_object.description == "") :
+            if unsanitised_google_flush_requests is None or type(unsanitised_google_flush_requests) is not int:
+                error_message = "Found invalid type of google_flush_requests.\n" + \
+                    "Expected type: int\nFound type: " + str(type(unsanitised_google_flush_requests)) + \
+                    "\nFound value: " + str(unsanitised_google_flush_requests)
+                logging.error(error_message)
+                raise ValueError(error_message)
 
-                self.xlsx_worksheet_summary.write(self.line_number, 0, query_data_object.description)
-                self.line_number += 1
+            elif unsanitised_google_flush_requests < 1:
+                error_message = "Found invalid value for google_flush_requests: " + \
+                    "Expected value: int >= 1\n" + \
+                    "Found value:" + str(unsanitised_google_flush_requests)
+                logging.error(error_message)
+                raise ValueError(error_message)
 
-            # query_text
-            size_of_query_text_row = 15 * (query_data_object.query.count("\n") + 2)
-            self.xlsx_worksheet_summary.set_row(self.line_number, size_of_query_text_row)
-            self.xlsx_worksheet_summary.write(self.line_number, 0, query_data_object.query, self.query_text_format)
-            self.line_number += 1
+            else:
+                return unsanitised_google_flush_requests
 
-            # results_execution_duration
-            self.xlsx_worksheet_summary.write(self.line_number, 0, "Duration of execution in seconds: " + str(query_data_object.results_execution_duration))
-            self.line_number += 1
 
-            if query_data_object.results_raw is None:
-                self.line_number += 1
-                self.xlsx_worksheet_summary.write(self.line_number, 0, "NO RESULTS DUE TO ERROR: " + query_data_object.error_message)
-                self.line_number += 1
+        if type(google_flush_requests) is list:
+            unsanitised_list = self.construct_multi_values(google_flush_requests)
+            self._google_flush_requests = [ sanitise_google_flush_requests(e) for e in unsanitised_list ]
+        else:
+            self._google_flush_requests = sanitise_google_flush_requests(google_flush_requests)
 
-            else:
-                # results_lines_count
-                if query_data_object.results_lines_count is not None:
-                    self.xlsx_worksheet_summary.write(self.line_number, 0, "Total count of lines in results: " + str(query_data_object.results_lines_count))
-                    self.line_number += 2
-                else:
-                    self.line_number += 1
 
-                # results
-                limit = self.summary_sample_limit
-                if limit != 0:
+    # google_flush_cells
 
-                    self.xlsx_worksheet_summary.write(self.line_number, 0, "Sample results: ", self.bold_format)
-                    self.line_number += 1
-                    harmonized_rows = query_data_object.results_matrix
+    @property
+    def google_flush_cells(self):
+        return self.return_current_multi_value_of(self._google_flush_cells)
 
-                    limit += 1
-                    if len(harmonized_rows) < limit:
-                        limit = len(harmonized_rows)
+    @google_flush_cells.setter
+    def google_flush_cells(self, google_flush_cells):
 
-                    y = 0
-                    for y in range(0, limit):
-                        for x in range(0, len(harmonized_rows[y])):
+        def sanitise_google_flush_cells(unsanitised_google_flush_cells):
 
-                            column = harmonized_rows[y][x]
+            if unsanitised_google_flush_cells is None or type(unsanitised_google_flush_cells) is not int:
+                error_message = "Found invalid type of google_flush_cells.\n" + \
+                    "Expected type: int\nFound type: " + str(type(unsanitised_google_flush_cells)) + \
+                    "\nFound value: " + str(unsanitised_google_flush_cells)
+                logging.error(error_message)
+                raise ValueError(error_message)
 
-                            if len(str(column)) > 255:
-                                column = str(column)[:255]
-                            self.xlsx_worksheet_summary.write(y + self.line_number, x, column)
+            elif unsanitised_google_flush_cells < 1:
+                error_message = "Found invalid value for google_flush_cells: " + \
+                    "Expected value: int >= 1\n" + \
+                    "Found value:" + str(unsanitised_google_flush_cells)
+                logging.error(error_message)
+                raise ValueError(error_message)
 
-                    self.line_number += 1
+            else:
+                return unsanitised_google_flush_cells
 
-                self.line_number += limit
 
-            self.line_number += 2
+        if type(google_flush_cells) is list:
+            unsanitised_list = self.construct_multi_values(google_flush_cells)
+            self._google_flush_cells = [ sanitise_google_flush_cells(e) for e in unsanitised_list ]
+        else:
+            self._google_flush_cells = sanitise_google_flush_cells(google_flush_cells)
 
 
-        def write_query_summary_google_sheets(query_data_object):
-            """Writes the gist of the results of an executed query to the summary sheet in the google sheets file"""
+    # max_parallel_uploads
 
-            # creating header
-            query_stats = []
-            query_stats.append([str(query_data_object.id) + ". " + query_data_object.title])
-            if not (query_data_object.description.isspace() or query_data_object.description == "") :
-                query_stats.append([query_data_object.description])
-            query_stats.append([query_data_object.query])
-            query_stats.append(
-                ["Duration of execution in seconds: " +
-                 str(query_data_object.results_execution_duration)])
+    @property
+    def max_parallel_uploads(self):
+        return self.return_current_multi_value_of(self._max_parallel_uploads)
 
+    @max_parallel_uploads.setter
+    def max_parallel_uploads(self, max_parallel_uploads):
 
-            if query_data_object.results_raw is None:
-                query_stats.append([])
-                query_stats.append(["NO RESULTS DUE TO ERROR: " + query_data_object.error_message])
+        def sanitise_max_parallel_uploads(unsanitised_max_parallel_uploads):
+
+            if unsanitised_max_parallel_uploads is None or type(unsanitised_max_parallel_uploads) is not int:
+                error_message = "Found invalid type of max_parallel_uploads.\n" + \
+                    "Expected type: int\nFound type: " + str(type(unsanitised_max_parallel_uploads)) + \
+                    "\nFound value: " + str(unsanitised_max_parallel_uploads)
+                logging.error(error_message)
+                raise ValueError(error_message)
+
+            elif unsanitised_max_parallel_uploads < 1:
+                error_message = "Found invalid value for max_parallel_uploads: " + \
+                    "Expected value: int >= 1\n" + \
+                    "Found value:" + str(unsanitised_max_parallel_uploads)
+                logging.error(error_message)
+                raise ValueError(error_message)
 
             else:
+                return unsanitised_max_parallel_uploads
 
-                if query_data_object.results_lines_count is not None:
-                    query_stats.append(
-                        ["Total count of lines in results: " +
-                         str(query_data_object.results_lines_count)])
 
-                # get sample results
-                limit = self.summary_sample_limit
-                if limit != 0:
+        if type(max_parallel_uploads) is list:
+            unsanitised_list = self.construct_multi_values(max_parallel_uploads)
+            self._max_parallel_uploads = [ sanitise_max_parallel_uploads(e) for e in unsanitised_list ]
+        else:
+            self._max_parallel_uploads = sanitise_max_parallel_uploads(max_parallel_uploads)
 
-                    query_stats.append([])
-                    query_stats.append(["Sample results: "])
-                    harmonized_rows = query_data_object.results_matrix
 
-                    # set limit as defined, readjust if results should be less than it or if it exceeds gsheets-capacities
-                    limit += 1
-                    if len(harmonized_rows) < limit:
-                        limit = len(harmonized_rows)
+    # upload_retries
 
-                    for y in range(0, limit):
-                        query_stats.append(harmonized_rows[y])
+    @property
+    def upload_retries(self):
+        return self.return_current_multi_value_of(self._upload_retries)
 
-            # write header and sample results to sheet
-            google_sheet_range = self.get_range_from_matrix(self.line_number, 0, query_stats)
-            google_sheet_range = "0. Summary!" + google_sheet_range
-            self.line_number += len(query_stats) + 3
+    @upload_retries.setter
+    def upload_retries(self, upload_retries):
 
-            self.google_service_sheets.spreadsheets().values().update(
-                spreadsheetId=self.google_sheets_id,
-                range=google_sheet_range,
-                valueInputOption="RAW",
-                body= { 'values': query_stats }
-            ).execute()
+        def sanitise_upload_retries(unsanitised_upload_retries):
 
-        main(query_data_object)
+            if unsanitised_upload_retries is None or type(unsanitised_upload_retries) is not int:
+                error_message = "Found invalid type of upload_retries.\n" + \
+                    "Expected type: int\nFound type: " + str(type(unsanitised_upload_retries)) + \
+                    "\nFound value: " + str(unsanitised_upload_retries)
+                logging.error(error_message)
+                raise ValueError(error_message)
 
+            elif unsanitised_upload_retries < 0:
+                error_message = "Found invalid value for upload_retries: " + \
+                    "Expected value: int >= 0\n" + \
+                    "Found value:" + str(unsanitised_upload_retries)
+                logging.error(error_message)
+                raise ValueError(error_message)
 
-    def get_range_from_matrix(self, start_y, start_x, matrix):
-        """Input: starting y- and x-coordinates and a matrix.
-        Output: Coordinates of the matrix (left upper cell and lower right cell) in A1-notation for updating google sheets"""
+            else:
+                return unsanitised_upload_retries
 
-        max_len_x = 0
-        for row in matrix:
-            if len(row) > max_len_x:
-                max_len_x = len(row)
 
-        max_len_y = len(matrix)
+        if type(upload_retries) is list:
+            unsanitised_list = self.construct_multi_values(upload_retries)
+            self._upload_retries = [ sanitise_upload_retries(e) for e in unsanitised_list ]
+        else:
+            self._upload_retries = sanitise_upload_retries(upload_retries)
 
-        range_start = chr(64 + start_x + 1) + str(start_y + 1)
 
-        range_end = chr(64 + start_x + max_len_x) + str(start_y + max_len_y)
+    # endpoint_rate_limit
 
-        return range_start + ":" + range_end
+    @property
+    def endpoint_rate_limit(self):
+        return self.return_current_multi_value_of(self._endpoint_rate_limit)
 
+    @endpoint_rate_limit.setter
+    def endpoint_rate_limit(self, endpoint_rate_limit):
 
-    def close(self):
-        """Closes the xlsx writer object"""
+        def sanitise_endpoint_rate_limit(unsanitised_endpoint_rate_limit):
 
-        if self.output_destination_type == "local_xlsx" or self.output_destination_type == 'local_folder' :
-            logging.info("close writer")
-            self.xlsx_workbook.close()
+            if unsanitised_endpoint_rate_limit is None:
+                return None
 
+            elif type(unsanitised_endpoint_rate_limit) not in (int, float):
+                error_message = "Found invalid type of endpoint_rate_limit.\n" + \
+                    "Expected type: int or float\nFound type: " + str(type(unsanitised_endpoint_rate_limit)) + \
+                    "\nFound value: " + str(unsanitised_endpoint_rate_limit)
+                logging.error(error_message)
+                raise ValueError(error_message)
 
+            elif unsanitised_endpoint_rate_limit <= 0:
+                error_message = "Found invalid value for endpoint_rate_limit: " + \
+                    "Expected value: number > 0\n" + \
+                    "Found value:" + str(unsanitised_endpoint_rate_limit)
+                logging.error(error_message)
+                raise ValueError(error_message)
 
+            else:
+                return unsanitised_endpoint_rate_limit
 
-class Query_collection_data_object:
-    """Data object encapsulating all data around a query collection file,
-    while also providing some logic (especially regarding multi values)
 
-    Attributes provided by end-user:
-        title: title of the whole query collection (optional)
-        description: description of the whole query collection (optional)
-        output_destination: where to save the results (optional, default: current folder)
-        output_format: what format should the results be saved in (optional, default: csv)
-        summary_sample_limit: how many rows from the results should be used as sample (optional, default: 5)
-        cooldown_between_queries: how many seconds should the execution be paused between queries (optional)
-        count_the_results: should results of queries be counted (optional, default: yes)
-        write_empty_results: should empty results be written into summaries (optional)
-        endpoint: which sparql endpoint (mandatory)
-        queries: the list containing query data objects
-        credentials_path: path to google credentials (optional)
-        client_secret_path: path to google client secrets (optional)
+        if type(endpoint_rate_limit) is list:
+            unsanitised_list = self.construct_multi_values(endpoint_rate_limit)
+            self._endpoint_rate_limit = [ sanitise_endpoint_rate_limit(e) for e in unsanitised_list ]
+        else:
+            self._endpoint_rate_limit = sanitise_endpoint_rate_limit(endpoint_rate_limit)
 
-    Attributes handled by SparqLaborer internally:
-        output_writer: object which handles all the output writing
-        query_collection_module: the query collection file written by the end-user
-        query_collection_filename: the original file name of the query collection file
-        timestamp_start: start of execution
-        count_triples_in_endpoint: how many triples are there in the store in total
-        header_error_message: message if an error occured during counting of all triples
-        current_multi_value: which current multi value index is used
-        multi_value_length: how many multi value options are the maximumg
 
+    # google_sheets_rate_limit
 
+    @property
+    def google_sheets_rate_limit(self):
+        return self.return_current_multi_value_of(self._google_sheets_rate_limit)
 
-    """
+    @google_sheets_rate_limit.setter
+    def google_sheets_rate_limit(self, google_sheets_rate_limit):
 
-    def __init__(self):
+        def sanitise_google_sheets_rate_limit(unsanitised_google_sheets_rate_limit):
 
-        # current_multi_value represents the current index the query_collection is in regard to the possible
-        # multi values lists provided by the user
-        # e.g. two output_formats: [xml, csv], where current_multi_value represents the current element in the list.
-        # Is set to -1 because the method 'has_next' is called before the first item is accessed.
-        self._current_multi_value = 0
+            if unsanitised_google_sheets_rate_limit is None:
+                return None
 
-        # multiv_value_length represents the possible length of a multi_value list.
-        self._multi_value_length = 1
+            elif type(unsanitised_google_sheets_rate_limit) not in (int, float):
+                error_message = "Found invalid type of google_sheets_rate_limit.\n" + \
+                    "Expected type: int or float\nFound type: " + str(type(unsanitised_google_sheets_rate_limit)) + \
+                    "\nFound value: " + str(unsanitised_google_sheets_rate_limit)
+                logging.error(error_message)
+                raise ValueError(error_message)
 
+            elif unsanitised_google_sheets_rate_limit <= 0:
+                error_message = "Found invalid value for google_sheets_rate_limit: " + \
+                    "Expected value: number > 0\n" + \
+                    "Found value:" + str(unsanitised_google_sheets_rate_limit)
+                logging.error(error_message)
+                raise ValueError(error_message)
 
-    # All the following variables could contain multi-values provided by the user,
-    # Thus when being read from the query collection file, they need to parsed into proper lists if needed,
-    # and when being used during processing, the correct current value of a multi-value list needs to be returned.
+            else:
+                return unsanitised_google_sheets_rate_limit
+
+
+        if type(google_sheets_rate_limit) is list:
+            unsanitised_list = self.construct_multi_values(google_sheets_rate_limit)
+            self._google_sheets_rate_limit = [ sanitise_google_sheets_rate_limit(e) for e in unsanitised_list ]
+        else:
+            self._google_sheets_rate_limit = sanitise_google_sheets_rate_limit(google_sheets_rate_limit)
 
 
-    # title
+    # google_drive_rate_limit
 
     @property
-    def title(self):
-        """Since the title is used as either file or folder or google sheet name, it's important for these
-        names to be unique. Thus the following if's are checking for duplicate titles and if detected
-        return them with a (n) attached where n represents the incrementing duplicate number.
-        Note that this logic here does not actually persist the title in the query_collection_data_object,
-        but only produces the adaptions on the fly when being queried."""
+    def google_drive_rate_limit(self):
+        return self.return_current_multi_value_of(self._google_drive_rate_limit)
 
-        if self._multi_value_length > 1 :
+    @google_drive_rate_limit.setter
+    def google_drive_rate_limit(self, google_drive_rate_limit):
 
-            if type(self._title) is list:
+        def sanitise_google_drive_rate_limit(unsanitised_google_drive_rate_limit):
 
-                found_count = 0
-                for i in range(self._current_multi_value):
-                    if self._title[i] ==  self._title[self._current_multi_value]:
-                        found_count += 1
+            if unsanitised_google_drive_rate_limit is None:
+                return None
 
-                if found_count > 0:
-                    return self._title[self._current_multi_value] + " (" + str(found_count+1) + ")"
-                else:
-                    return self._title[self._current_multi_value]
+            elif type(unsanitised_google_drive_rate_limit) not in (int, float):
+                error_message = "Found invalid type of google_drive_rate_limit.\n" + \
+                    "Expected type: int or float\nFound type: " + str(type(unsanitised_google_drive_rate_limit)) + \
+                    "\nFound value: " + str(unsanitised_google_drive_rate_limit)
+                logging.error(error_message)
+                raise ValueError(error_message)
+
+            elif unsanitised_google_drive_rate_limit <= 0:
+                error_message = "Found invalid value for google_drive_rate_limit: " + \
+                    "Expected value: number > 0\n" + \
+                    "Found value:" + str(unsanitised_google_drive_rate_limit)
+                logging.error(error_message)
+                raise ValueError(error_message)
 
             else:
-                return self._title + " (" + str(self._current_multi_value+1) + ")"
-        else:
-            return self._title
+                return unsanitised_google_drive_rate_limit
 
-    @title.setter
-    def title(self, title):
 
-        if type(title) is list:
-            unsanitised_list = self.construct_multi_values(title)
-            self._title = [ str(e) for e in unsanitised_list ]
+        if type(google_drive_rate_limit) is list:
+            unsanitised_list = self.construct_multi_values(google_drive_rate_limit)
+            self._google_drive_rate_limit = [ sanitise_google_drive_rate_limit(e) for e in unsanitised_list ]
         else:
-            self._title = str(title)
+            self._google_drive_rate_limit = sanitise_google_drive_rate_limit(google_drive_rate_limit)
 
 
-    # description
+    # max_retries
 
     @property
-    def description(self):
-        return self.return_current_multi_value_of(self._description)
+    def max_retries(self):
+        return self.return_current_multi_value_of(self._max_retries)
 
-    @description.setter
-    def description(self, description):
+    @max_retries.setter
+    def max_retries(self, max_retries):
 
-        def sanitise_description(unsanitised_description):
+        def sanitise_max_retries(unsanitised_max_retries):
 
-            if unsanitised_description is None:
-                return ""
-            elif type(unsanitised_description) is str:
-                return unsanitised_description
-            else:
-                error_message = "Found invalid data type for description! \n" + \
-                    "Expected type: str\nFound type: " + str(type(unsanitised_description)) + \
-                    "\nFound value: " + str(unsanitised_description)
+            if unsanitised_max_retries is None or type(unsanitised_max_retries) is not int:
+                error_message = "Found invalid type of max_retries.\n" + \
+                    "Expected type: int\nFound type: " + str(type(unsanitised_max_retries)) + \
+                    "\nFound value: " + str(unsanitised_max_retries)
+                logging.error(error_message)
+                raise ValueError(error_message)
+
+            elif unsanitised_max_retries < 0:
+                error_message = "Found invalid value for max_retries: " + \
+                    "Expected value: int >= 0\n" + \
+                    "Found value:" + str(unsanitised_max_retries)
                 logging.error(error_message)
                 raise ValueError(error_message)
 
+            else:
+                return unsanitised_max_retries
 
-        if type(description) is list:
-            unsanitised_list = self.construct_multi_values(description)
-            self._description = [ sanitise_description(e) for e in unsanitised_list ]
+
+        if type(max_retries) is list:
+            unsanitised_list = self.construct_multi_values(max_retries)
+            self._max_retries = [ sanitise_max_retries(e) for e in unsanitised_list ]
         else:
-            self._description = sanitise_description(description)
+            self._max_retries = sanitise_max_retries(max_retries)
 
 
-    # output_destination
+    # retry_backoff
 
     @property
-    def output_destination(self):
-        return self.return_current_multi_value_of(self._output_destination)
+    def retry_backoff(self):
+        return self.return_current_multi_value_of(self._retry_backoff)
 
-    @output_destination.setter
-    def output_destination(self, output_destination):
+    @retry_backoff.setter
+    def retry_backoff(self, retry_backoff):
 
-        def sanitise_output_destination(unsanitised_output_destination):
+        def sanitise_retry_backoff(unsanitised_retry_backoff):
 
-            if unsanitised_output_destination is None:
-                return "."
-            elif type(unsanitised_output_destination) is str:
-                if unsanitised_output_destination == "" or unsanitised_output_destination.isspace():
-                    return "."
-                else:
-                    return unsanitised_output_destination
-            else:
-                error_message = "Found invalid data type for output_destination! \n" + \
-                    "Expected type: str\nFound type: " + str(type(unsanitised_output_destination)) + \
-                    "\nFound value: " + str(unsanitised_output_destination)
+            if unsanitised_retry_backoff is None or type(unsanitised_retry_backoff) not in (int, float):
+                error_message = "Found invalid type of retry_backoff.\n" + \
+                    "Expected type: int or float\nFound type: " + str(type(unsanitised_retry_backoff)) + \
+                    "\nFound value: " + str(unsanitised_retry_backoff)
                 logging.error(error_message)
                 raise ValueError(error_message)
 
+            elif unsanitised_retry_backoff < 0:
+                error_message = "Found invalid value for retry_backoff: " + \
+                    "Expected value: number >= 0\n" + \
+                    "Found value:" + str(unsanitised_retry_backoff)
+                logging.error(error_message)
+                raise ValueError(error_message)
 
-        if type(output_destination) is list:
-            unsanitised_list = self.construct_multi_values(output_destination)
-            self._output_destination = [ sanitise_output_destination(e) for e in unsanitised_list ]
+            else:
+                return unsanitised_retry_backoff
+
+
+        if type(retry_backoff) is list:
+            unsanitised_list = self.construct_multi_values(retry_backoff)
+            self._retry_backoff = [ sanitise_retry_backoff(e) for e in unsanitised_list ]
         else:
-            self._output_destination = sanitise_output_destination(output_destination)
+            self._retry_backoff = sanitise_retry_backoff(retry_backoff)
 
 
-    # output_format
+    # retry_max_backoff
 
     @property
-    def output_format(self):
-        return self.return_current_multi_value_of(self._output_format)
+    def retry_max_backoff(self):
+        return self.return_current_multi_value_of(self._retry_max_backoff)
 
-    @output_format.setter
-    def output_format(self, output_format):
+    @retry_max_backoff.setter
+    def retry_max_backoff(self, retry_max_backoff):
 
-        def sanitise_output_format(unsanitised_output_format):
+        def sanitise_retry_max_backoff(unsanitised_retry_max_backoff):
 
-            if unsanitised_output_format is None or type(unsanitised_output_format) is not str:
-                error_message = "No valid output_format found. Possible formats are: \n" + \
-                                 "CSV, TSV, XML, JSON, XLSX\n" + \
-                                 "Found format is " + str(unsanitised_output_format)
+            if unsanitised_retry_max_backoff is None or type(unsanitised_retry_max_backoff) not in (int, float):
+                error_message = "Found invalid type of retry_max_backoff.\n" + \
+                    "Expected type: int or float\nFound type: " + str(type(unsanitised_retry_max_backoff)) + \
+                    "\nFound value: " + str(unsanitised_retry_max_backoff)
                 logging.error(error_message)
                 raise ValueError(error_message)
 
-            if unsanitised_output_format.upper() == "CSV" or unsanitised_output_format.upper() == CSV:
-                return CSV
-            elif unsanitised_output_format.upper() == "TSV" or unsanitised_output_format.upper() == TSV:
-                return TSV
-            elif unsanitised_output_format.upper() == "XML" or unsanitised_output_format.upper() == XML:
-                return XML
-            # TODO: json not working, look into why
-            # elif unsanitised_output_format.upper() == "JSON":
-            #     return JSON
-            elif unsanitised_output_format.upper() == "XLSX" or unsanitised_output_format.upper() == XLSX:
-                return "XLSX"
-            else:
-                error_message = "No valid output_format found. Possible formats are: \n" + \
-                                 "CSV, TSV, XML, XLSX\n" + \
-                                 "Found format is " + str(unsanitised_output_format)
+            elif unsanitised_retry_max_backoff < 0:
+                error_message = "Found invalid value for retry_max_backoff: " + \
+                    "Expected value: number >= 0\n" + \
+                    "Found value:" + str(unsanitised_retry_max_backoff)
                 logging.error(error_message)
                 raise ValueError(error_message)
 
+            else:
+                return unsanitised_retry_max_backoff
 
-        if type(output_format) is list:
-            unsanitised_list = self.construct_multi_values(output_format)
-            self._output_format = [ sanitise_output_format(e) for e in unsanitised_list ]
+
+        if type(retry_max_backoff) is list:
+            unsanitised_list = self.construct_multi_values(retry_max_backoff)
+            self._retry_max_backoff = [ sanitise_retry_max_backoff(e) for e in unsanitised_list ]
         else:
-            self._output_format = sanitise_output_format(output_format)
+            self._retry_max_backoff = sanitise_retry_max_backoff(retry_max_backoff)
 
 
-    # summary_sample_limit
+    # max_parallel_variants
 
     @property
-    def summary_sample_limit(self):
-        return self.return_current_multi_value_of(self._summary_sample_limit)
+    def max_parallel_variants(self):
+        return self.return_current_multi_value_of(self._max_parallel_variants)
 
-    @summary_sample_limit.setter
-    def summary_sample_limit(self, summary_sample_limit):
+    @max_parallel_variants.setter
+    def max_parallel_variants(self, max_parallel_variants):
 
-        def sanitise_summary_sample_limit(unsanitised_summary_sample_limit):
+        def sanitise_max_parallel_variants(unsanitised_max_parallel_variants):
 
-            if unsanitised_summary_sample_limit is None or type(unsanitised_summary_sample_limit) is not int:
-                error_message = "Found invalid data type for summary_sample_limit! \n" + \
-                    "Expected type: int\nFound type: " + str(type(unsanitised_count_the_results)) + \
-                    "\nFound value: " + str(unsanitised_count_the_results)
+            if unsanitised_max_parallel_variants is None or type(unsanitised_max_parallel_variants) is not int:
+                error_message = "Found invalid type of max_parallel_variants.\n" + \
+                    "Expected type: int\nFound type: " + str(type(unsanitised_max_parallel_variants)) + \
+                    "\nFound value: " + str(unsanitised_max_parallel_variants)
                 logging.error(error_message)
                 raise ValueError(error_message)
 
-            elif unsanitised_summary_sample_limit > 101:
-                message = "Found sample limit which is too high: " + str(unsanitised_summary_sample_limit) + \
-                          ", replaced it with limit of 100"
-                logging.info(message)
-                print(message)
-                return 101
-
-            elif unsanitised_summary_sample_limit < 0:
-                message = "Found invalid sample limit: " + str(unsanitised_summary_sample_limit) + \
-                          ", replaced it with limit of 5"
-                logging.info(message)
-                print(message)
-                return 5
+            elif unsanitised_max_parallel_variants < 1:
+                error_message = "Found invalid value for max_parallel_variants: " + \
+                    "Expected value: int >= 1\n" + \
+                    "Found value:" + str(unsanitised_max_parallel_variants)
+                logging.error(error_message)
+                raise ValueError(error_message)
 
             else:
-                return unsanitised_summary_sample_limit
+                return unsanitised_max_parallel_variants
 
 
-        if type(summary_sample_limit) is list:
-            unsanitised_list = self.construct_multi_values(summary_sample_limit)
-            self._summary_sample_limit = [sanitise_summary_sample_limit(e) for e in unsanitised_list]
+        if type(max_parallel_variants) is list:
+            unsanitised_list = self.construct_multi_values(max_parallel_variants)
+            self._max_parallel_variants = [ sanitise_max_parallel_variants(e) for e in unsanitised_list ]
         else:
-            self._summary_sample_limit = sanitise_summary_sample_limit(summary_sample_limit)
+            self._max_parallel_variants = sanitise_max_parallel_variants(max_parallel_variants)
 
 
-    # cooldown_between_queries
+    # output_compression
 
     @property
-    def cooldown_between_queries(self):
-        return self.return_current_multi_value_of(self._cooldown_between_queries)
+    def output_compression(self):
+        return self.return_current_multi_value_of(self._output_compression)
 
-    @cooldown_between_queries.setter
-    def cooldown_between_queries(self, cooldown_between_queries):
+    @output_compression.setter
+    def output_compression(self, output_compression):
 
-        def sanitise_cooldown_between_queries(unsanitised_cooldown_between_queries):
+        def sanitise_output_compression(unsanitised_output_compression):
 
-            if unsanitised_cooldown_between_queries is None or type(unsanitised_cooldown_between_queries) is not int:
-                error_message = "Found invalid type of cooldown_between_queries.\n" + \
-                    "Expected type: int\nFound type: " + str(type(unsanitised_cooldown_between_queries)) + \
-                    "\nFound value: " + str(unsanitised_cooldown_between_queries)
+            if unsanitised_output_compression is None:
+                return None
+
+            elif type(unsanitised_output_compression) is not str or unsanitised_output_compression.lower() not in ("gzip", "zstd", "xz"):
+                error_message = "Found invalid value for output_compression: " + \
+                    "Expected value: None, gzip, zstd or xz\n" + \
+                    "Found value:" + str(unsanitised_output_compression)
                 logging.error(error_message)
                 raise ValueError(error_message)
 
-            else:
-
-                if unsanitised_cooldown_between_queries >= 0:
-                    return unsanitised_cooldown_between_queries
+            elif unsanitised_output_compression.lower() == "zstd" and zstandard is None:
+                error_message = "The output_compression zstd requires the package zstandard, " + \
+                                "which can be installed with: pip install zstandard"
+                logging.error(error_message)
+                raise ValueError(error_message)
 
-                else:
-                    error_message = "Found invalid value for cooldown_between_queries: " + \
-                        "Expected value: greater than 0\n" + \
-                        "Found value:" + str(unsanitised_cooldown_between_queries)
-                    logging.error(error_message)
-                    raise ValueError(error_message)
+            else:
+                return unsanitised_output_compression.lower()
 
 
-        if type(cooldown_between_queries) is list:
-            unsanitised_list = self.construct_multi_values(cooldown_between_queries)
-            self._cooldown_between_queries = [ sanitise_cooldown_between_queries(e) for e in unsanitised_list ]
+        if type(output_compression) is list:
+            unsanitised_list = self.construct_multi_values(output_compression)
+            self._output_compression = [ sanitise_output_compression(e) for e in unsanitised_list ]
         else:
-            self._cooldown_between_queries = sanitise_cooldown_between_queries(cooldown_between_queries)
+            self._output_compression = sanitise_output_compression(output_compression)
 
 
-    # write_empty_results
+    # output_compression_level
 
     @property
-    def write_empty_results(self):
-        return self.return_current_multi_value_of(self._write_empty_results)
+    def output_compression_level(self):
+        return self.return_current_multi_value_of(self._output_compression_level)
 
-    @write_empty_results.setter
-    def write_empty_results(self, write_empty_results):
+    @output_compression_level.setter
+    def output_compression_level(self, output_compression_level):
 
-        def sanitise_write_empty_results(unsanitised_write_empty_results):
+        def sanitise_output_compression_level(unsanitised_output_compression_level):
 
-            if unsanitised_write_empty_results is None or type(unsanitised_write_empty_results) is not bool:
-                error_message = "Found invalid type of write_empty_results.\n" + \
-                    "Expected type: bool\nFound type: " + str(type(unsanitised_write_empty_results)) + \
-                    "\nFound value: " + str(unsanitised_write_empty_results)
+            if unsanitised_output_compression_level is None:
+                return None
+
+            elif type(unsanitised_output_compression_level) is not int:
+                error_message = "Found invalid type of output_compression_level.\n" + \
+                    "Expected type: int\nFound type: " + str(type(unsanitised_output_compression_level)) + \
+                    "\nFound value: " + str(unsanitised_output_compression_level)
+                logging.error(error_message)
+                raise ValueError(error_message)
+
+            elif unsanitised_output_compression_level < 0:
+                error_message = "Found invalid value for output_compression_level: " + \
+                    "Expected value: int >= 0 or None\n" + \
+                    "Found value:" + str(unsanitised_output_compression_level)
                 logging.error(error_message)
                 raise ValueError(error_message)
 
             else:
-                return unsanitised_write_empty_results
+                return unsanitised_output_compression_level
 
 
-        if type(write_empty_results) is list:
-            unsanitised_list = self.construct_multi_values(write_empty_results)
-            self._write_empty_results = [ sanitise_write_empty_results(e) for e in unsanitised_list ]
+        if type(output_compression_level) is list:
+            unsanitised_list = self.construct_multi_values(output_compression_level)
+            self._output_compression_level = [ sanitise_output_compression_level(e) for e in unsanitised_list ]
         else:
-            self._write_empty_results = sanitise_write_empty_results(write_empty_results)
+            self._output_compression_level = sanitise_output_compression_level(output_compression_level)
 
 
-    # count_the_results
+    # output_compression_threads
 
     @property
-    def count_the_results(self):
-        return self.return_current_multi_value_of(self._count_the_results)
+    def output_compression_threads(self):
+        return self.return_current_multi_value_of(self._output_compression_threads)
 
-    @count_the_results.setter
-    def count_the_results(self, count_the_results):
+    @output_compression_threads.setter
+    def output_compression_threads(self, output_compression_threads):
 
-        def sanitise_count_the_results(unsanitised_count_the_results):
+        def sanitise_output_compression_threads(unsanitised_output_compression_threads):
 
-            if unsanitised_count_the_results is None or type(unsanitised_count_the_results) is not bool:
-                error_message = "Found invalid type of count_the_results.\n" + \
-                    "Expected type: bool\nFound type: " + str(type(unsanitised_count_the_results)) + \
-                    "\nFound value: " + str(unsanitised_count_the_results)
+            if unsanitised_output_compression_threads is None or type(unsanitised_output_compression_threads) is not int:
+                error_message = "Found invalid type of output_compression_threads.\n" + \
+                    "Expected type: int\nFound type: " + str(type(unsanitised_output_compression_threads)) + \
+                    "\nFound value: " + str(unsanitised_output_compression_threads)
+                logging.error(error_message)
+                raise ValueError(error_message)
+
+            elif unsanitised_output_compression_threads < 1:
+                error_message = "Found invalid value for output_compression_threads: " + \
+                    "Expected value: int >= 1\n" + \
+                    "Found value:" + str(unsanitised_output_compression_threads)
                 logging.error(error_message)
                 raise ValueError(error_message)
 
             else:
-                return unsanitised_count_the_results
+                return unsanitised_output_compression_threads
 
 
-        if type(count_the_results) is list:
-            unsanitised_list = self.construct_multi_values(count_the_results)
-            self._count_the_results = [ sanitise_count_the_results(e) for e in unsanitised_list ]
+        if type(output_compression_threads) is list:
+            unsanitised_list = self.construct_multi_values(output_compression_threads)
+            self._output_compression_threads = [ sanitise_output_compression_threads(e) for e in unsanitised_list ]
         else:
-            self._count_the_results = sanitise_count_the_results(count_the_results)
+            self._output_compression_threads = sanitise_output_compression_threads(output_compression_threads)
 
 
     # endpoint
@@ -2059,6 +7016,20 @@ class Query_collection_data_object:
 
         return processed_list
 
+    def release_shared_results(self):
+        """Closes the files of the results shared between variants, once all variants are run"""
+
+        with self.shared_results_lock:
+            for shared_result in self.shared_results.values():
+                if shared_result.get('results_raw') is not None:
+                    shared_result['results_raw'].close()
+            self.shared_results = {}
+
+    def select_multi_value(self, index):
+        """Fixes the current multi-value index, so that only the values of a single variant are read"""
+
+        self._current_multi_value = index
+
     def has_next(self):
         """Returns a boolean value expressing whether or not there is more multi-values not yet read.
         Also increments the current multi-value index."""
@@ -2077,6 +7048,8 @@ class Query_data_object:
         title: query title (optional)
         description: query description (optional)
         query: the sparql query (mandatory)
+        page_size: if set, the results are fetched in pages of this many lines (optional)
+        indexes: the columns to be indexed, if the results are written into a sqlite database (optional)
         custom_meta_function: arbitrary python code included in the query collection file; if present will be executed
         custom_data_container: arbitrary data field which can be used in conjunction with a custom_meta_function
 
@@ -2084,8 +7057,23 @@ class Query_data_object:
         query_collection_data_object: the associated collection data object (important for multi value coordination)
         id: query data object id (mostly for logging, but also to provide identification for meta function calls)
         results_raw: the result from the sparql query, raw since they are saved as whatever data format was used for it
-        results_matrix: the results converted into a matrix (first row: variables, all others: their values)
+        results_matrix: the results converted into a Results_matrix (first row: variables, all others: their values).
+            For streamed results it only contains the header and the sample rows for the summary.
+        results_format: the format in which the results were requested from the endpoint
+        results_column_types: the types inferred for the columns of the results (int, decimal, float, boolean, date,
+            datetime or string), by which their values were converted. None, if an error occured.
+        results_streamed: if the results are read incrementally from results_raw, which is then a binary file
         results_execution_duration: the duration it took the query to be run until a result was returned (or an error)
+        results_pages_durations: the durations of fetching each page, if the results were fetched in pages
+        results_pages_lines_count: the number of result lines of all pages, if the results were fetched in pages
+        results_timestamp_cached: when the results were cached, if they were read from the result cache (None otherwise)
+        results_retries: a message for each retry of the query (or its pages or query for counting) after transient errors
+        results_size: the number of bytes of the results written into a file of a local folder (None otherwise)
+        results_size_compressed: the number of bytes of that file, if it was compressed (None otherwise)
+        results_file: the path of the file the results were written into, if written into a local folder (None otherwise)
+        results_table: the name of the table of the results, if written into a sqlite database (None otherwise)
+        results_rows_written: the number of rows written into that table (None otherwise)
+        results_rows_read: the number of rows read from streamed results by writing them completely (None otherwise)
         query_for_count: an automatically created query adapted from the base query, in order to count the results
         results_line_count: the total number of result lines from a given sparql query
         error_message: in case of an error encountered, the message will be saved and returned using this attribute
@@ -2097,6 +7085,18 @@ class Query_data_object:
         # mandatory attribute: the associated collection_data_object. Thus no default value (=None) assigned to it.
         self._query_collection_data_object = query_collection_data_object
 
+        self.results_streamed = False
+        self.results_column_types = None
+        self.results_file = None
+        self.results_size = None
+        self.results_size_compressed = None
+        self.results_table = None
+        self.results_rows_written = None
+        self.results_rows_read = None
+        self.results_pages_durations = None
+        self.results_pages_lines_count = None
+        self.results_retries = []
+
 
 
     # title
@@ -2226,6 +7226,123 @@ class Query_data_object:
             self._query = query
 
 
+    # page_size
+    #
+    # Overriden getters and setters are necessary here since they could contain multi values
+
+    @property
+    def page_size(self):
+        return self._query_collection_data_object.return_current_multi_value_of( self._page_size )
+
+    @page_size.setter
+    def page_size(self, page_size):
+
+        def sanitise_page_size(unsanitised_page_size):
+
+            if unsanitised_page_size is None:
+                return None
+
+            elif type(unsanitised_page_size) is not int:
+                error_message = "Found invalid type of page_size of query.\n" + \
+                    "Expected type: int\nFound type: " + str(type(unsanitised_page_size)) + \
+                    "\nFound value: " + str(unsanitised_page_size)
+                logging.error(error_message)
+                raise ValueError(error_message)
+
+            elif unsanitised_page_size < 1:
+                error_message = "Found invalid page_size of query: " + str(unsanitised_page_size) + \
+                    "\nExpected value: a positive number of lines per page"
+                logging.error(error_message)
+                raise ValueError(error_message)
+
+            else:
+                return unsanitised_page_size
+
+
+        if type(page_size) is list:
+            unsanitised_list = self._query_collection_data_object.construct_multi_values( page_size )
+            self._page_size = [ sanitise_page_size(e) for e in unsanitised_list ]
+        else:
+            self._page_size = sanitise_page_size(page_size)
+
+
+    # indexes
+    #
+    # Given as tuple, since lists are multi values. Each index is either the name of a column or a tuple of such names,
+    # they are kept as tuple of tuples of names.
+
+    @property
+    def indexes(self):
+        return self._query_collection_data_object.return_current_multi_value_of( self._indexes )
+
+    @indexes.setter
+    def indexes(self, indexes):
+
+        def sanitise_index(unsanitised_index):
+
+            if type(unsanitised_index) is str:
+                return (unsanitised_index,)
+
+            elif type(unsanitised_index) is tuple and len(unsanitised_index) > 0 and \
+                    all(type(column) is str for column in unsanitised_index):
+                return unsanitised_index
+
+            else:
+                error_message = "Found invalid index of query: " + str(unsanitised_index) + \
+                    "\nExpected value: the name of a column, or a tuple of names of columns"
+                logging.error(error_message)
+                raise ValueError(error_message)
+
+        def sanitise_indexes(unsanitised_indexes):
+
+            if unsanitised_indexes is None:
+                return None
+
+            elif type(unsanitised_indexes) is str:
+                return ( sanitise_index(unsanitised_indexes), )
+
+            elif type(unsanitised_indexes) is tuple:
+                return tuple( sanitise_index(index) for index in unsanitised_indexes )
+
+            else:
+                error_message = "Found invalid type of indexes of query.\n" + \
+                    "Expected type: str or tuple\nFound type: " + str(type(unsanitised_indexes)) + \
+                    "\nFound value: " + str(unsanitised_indexes)
+                logging.error(error_message)
+                raise ValueError(error_message)
+
+
+        if type(indexes) is list:
+            unsanitised_list = self._query_collection_data_object.construct_multi_values( indexes )
+            self._indexes = [ sanitise_indexes(e) for e in unsanitised_list ]
+        else:
+            self._indexes = sanitise_indexes(indexes)
+
+
+    # results
+
+    def iterate_results_matrix(self):
+        """Returns an iterator over all rows of the results (first row: variables, all others: their values).
+        Streamed results are read incrementally from results_raw, all others are taken from results_matrix.
+        Once streamed results were read completely, the number of their rows is kept in results_rows_read."""
+
+        def count_rows(rows):
+
+            results_rows_read = -1
+            for row in rows:
+                results_rows_read += 1
+                yield row
+
+            self.results_rows_read = max(results_rows_read, 0)
+
+        if self.results_streamed:
+            self.results_raw.seek(0)
+            return count_rows(iterate_typed_rows(
+                iterate_harmonized_rows(self.results_raw, self.results_format), self.results_column_types))
+        else:
+            return iter(self.results_matrix)
+
+
     # custom_meta_function
 
     def call_custom_meta_function(self):
@@ -2257,4 +7374,5 @@ class Query_data_object:
 
 
 
-main()
\ No newline at end of file
+if __name__ == "__main__":
+    main()
\ No newline at end of file
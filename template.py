@@ -20,6 +20,8 @@ description = "This set of queries is used as a template for showcasing a valid
 # * a local path to a folder 
 # * a URL for a google sheets document  
 # * a URL for a google folder
+# * a sqlite database, as url like sqlite:///relative/path/results.db or sqlite:////absolute/path/results.db (each query
+#   gets a table of its own, the summary is written into the tables sparqlaborer_runs and sparqlaborer_queries)
 # NOTE: On windows, folders in a path use backslashes, in such a case it is mandatory to attach a 'r' in front of the quotes, e.g. r"C:\Users\sresch\.."
 # In the other cases the 'r' is simply ignored; thus best would be to always leave it there.
 # OPTIONAL, if not set, folder of executed script will be used
@@ -27,7 +29,7 @@ output_destination = r"."
 
 
 # output_format
-# defines the format in which the result data shall be saved (currently available: csv, tsv, xml, json, xlsx)
+# defines the format in which the result data shall be saved (currently available: csv, tsv, xml, json, xlsx, parquet, arrow)
 # OPTIONAL, if not set, csv will be used
 output_format = "csv"
 
@@ -39,7 +41,7 @@ summary_sample_limit = 3
 
 
 # cooldown_between_queries
-# defines how many seconds should be waited between execution of individual queries in order to prevent exhaustion of Google API due to too many writes per time-interval
+# defines how many seconds should be waited between execution of individual queries in order to prevent exhaustion of Google API due to too many writes per time-interval. DEPRECATED: The rate of requests is limited adaptively now (see endpoint_rate_limit and google_sheets_rate_limit), which makes such pauses unnecessary
 # OPTIONAL, if not set, 0 will be used
 cooldown_between_queries = 0
 
@@ -50,6 +52,205 @@ cooldown_between_queries = 0
 write_empty_results = False
 
 
+# count_the_results
+# defines if the results of each query should be counted by the endpoint, by executing an additional query for counting
+# at the same time as the query itself. If set to 'smart', the results are only counted by the endpoint if it's not clear
+# they were fetched completely, i.e. if they have as many lines as endpoint_max_rows (and were not fetched in pages, see
+# page_size below). Otherwise the number of fetched lines is used as their count, also if endpoint_max_rows is not set.
+# If set to 'batched', the results of all queries are counted with a single query (together with all triples in the
+# endpoint) before executing them, instead of one query for counting per query.
+# Possible values: True, False, "smart", "batched"
+# OPTIONAL, if not set, True will be used
+count_the_results = True
+
+
+# max_parallel_queries
+# defines how many queries should be executed at the same time against the endpoint. The results are nevertheless written in the order of the queries below.
+# Queries after one with a custom_meta_function are only started once it was executed, since it may change them.
+# Can be overridden with the command line argument '-p'
+# OPTIONAL, if not set, 1 will be used (i.e. the queries are executed one after another)
+max_parallel_queries = 1
+
+
+# endpoint_pool_size
+# defines how many persistent connections to the endpoint are kept open and shared by all queries during a run
+# OPTIONAL, if not set, the value of max_parallel_queries multiplied by max_parallel_pages will be used
+# (plus max_parallel_queries, if count_the_results is True or 'batched')
+# endpoint_pool_size = 4
+
+
+# endpoint_idle_timeout
+# defines after how many seconds an unused connection to the endpoint is discarded and replaced by a new one
+# OPTIONAL, if not set, 30 will be used
+endpoint_idle_timeout = 30
+
+
+# endpoint_timeout
+# defines after how many seconds of waiting for the endpoint (for connecting, or for the next part of its response) a
+# request fails. Failed requests are retried as defined by max_retries.
+# OPTIONAL, if not set, None will be used (i.e. there is no timeout)
+endpoint_timeout = None
+
+
+# cache_ttl
+# defines for how many seconds the results of queries are cached on disk. As long as a cached result is younger than this, 
+# re-running this file uses the cached result instead of executing the same query again against the same endpoint. 
+# Cached results are marked as such in the summary. Use the command line argument '--refresh' to replace cached results
+# with fresh ones, or '--no-cache' to not use the cache at all.
+# OPTIONAL, if not set, 0 will be used (i.e. no results are cached)
+cache_ttl = 0
+
+
+# cache_folder
+# defines the folder in which cached results are stored
+# OPTIONAL, if not set, 'SparqLaborer_cache' will be used
+cache_folder = r"SparqLaborer_cache"
+
+
+# cache_max_size
+# defines how many megabytes the cached results may take up at most. If exceeded, the least recently used results are deleted.
+# OPTIONAL, if not set, 1024 will be used
+cache_max_size = 1024
+
+
+# stream_results
+# Should results be read and written incrementally, instead of being loaded into memory as a whole? This keeps the memory 
+# usage bounded by the stream_buffer_size regardless of the size of the results, which is useful for very big results.
+# Note that with streaming only the header and the sample rows are kept in the 'results_matrix' of a query.
+# Currently available for the formats: csv, tsv, xml, json, xlsx, parquet, arrow
+# Possible values are python boolean values: True, False
+# OPTIONAL, if not set, False will be used
+stream_results = False
+
+
+# stream_buffer_size
+# defines how many kilobytes of a streamed result are kept in memory at most, the rest is buffered in a temporary file
+# OPTIONAL, if not set, 1024 will be used
+stream_buffer_size = 1024
+
+
+# max_parallel_pages
+# defines how many pages of a query with a page_size (see below) are fetched at the same time against the endpoint.
+# The pages are nevertheless merged in their order.
+# OPTIONAL, if not set, 1 will be used (i.e. the pages are fetched one after another)
+max_parallel_pages = 1
+
+
+# page_retries
+# defines how often fetching a page of a query with a page_size is retried, should it fail (e.g. due to a timeout),
+# before the whole query is given up
+# OPTIONAL, if not set, 2 will be used
+page_retries = 2
+
+
+# endpoint_max_rows
+# defines the maximum number of rows the endpoint returns for a query (e.g. 'ResultSetMaxRows' of Virtuoso), beyond which
+# results are cut off silently. Used if count_the_results is 'smart', and for reducing the page_size of queries to it.
+# OPTIONAL, if not set, results are regarded as complete
+# endpoint_max_rows = 10000
+
+
+# google_flush_requests
+# defines after how many requests to a google sheets file (creating sheets, formatting them or writing values into them)
+# these are sent together. Requests are queued and sent in as few calls as possible, at the latest at the end of the run,
+# which keeps the google api from being exhausted by too many calls.
+# OPTIONAL, if not set, 100 will be used
+google_flush_requests = 100
+
+
+# google_flush_cells
+# defines after how many cells of values queued for a google sheets file the queued requests are sent, which keeps the
+# size of the calls within the limits of the google api
+# OPTIONAL, if not set, 50000 will be used
+google_flush_cells = 50000
+
+
+# max_parallel_uploads
+# defines how many chunks of values are written into a google sheets file at the same time. Values of big results are
+# split into chunks of rows of up to google_flush_cells cells, each written with its own call.
+# OPTIONAL, if not set, 4 will be used
+max_parallel_uploads = 4
+
+
+# upload_retries
+# defines how often writing a chunk of values into a google sheets file is retried, should it fail (e.g. due to a timeout
+# or exceeded quota), before the whole run is given up
+# OPTIONAL, if not set, 2 will be used
+upload_retries = 2
+
+
+# endpoint_rate_limit
+# defines how many requests per second are sent to the endpoint at most. Should the endpoint signal it's overloaded
+# (with http status 429 or 503), requests are paused for as long as it asks for (with a 'Retry-After' header, otherwise
+# for a second) and their rate is halved, to be increased again step by step with every successful request.
+# OPTIONAL, if not set, the rate is not limited (though requests are still paused if the endpoint is overloaded)
+# endpoint_rate_limit = 10
+
+
+# google_sheets_rate_limit
+# defines how many requests per second are sent to the google sheets api at most, adapting to it like endpoint_rate_limit
+# OPTIONAL, if not set, 1 will be used (the default quota of the google sheets api being 60 requests per minute and user)
+google_sheets_rate_limit = 1
+
+
+# google_drive_rate_limit
+# defines how many requests per second are sent to the google drive api at most, adapting to it like endpoint_rate_limit
+# OPTIONAL, if not set, 10 will be used
+google_drive_rate_limit = 10
+
+
+# max_retries
+# defines how often requests to the endpoint or to google apis are retried, should they fail due to a transient error
+# (e.g. a timeout, an internal error of the service, or exceeded quota). Errors caused by the request itself (e.g. a badly
+# formed query) are not retried. The retries of each query are listed in the summary.
+# Pages of queries and chunks of values for google sheets are retried as often as page_retries and upload_retries define.
+# OPTIONAL, if not set, 3 will be used
+max_retries = 3
+
+
+# retry_backoff
+# defines how many seconds are waited at most before the first retry of a request, doubled with every further retry.
+# The actual wait is chosen randomly up to that, so that requests failed at the same time are not retried all at once.
+# OPTIONAL, if not set, 1 will be used
+retry_backoff = 1
+
+
+# retry_max_backoff
+# defines how many seconds are waited at most before any retry of a request
+# OPTIONAL, if not set, 60 will be used
+retry_max_backoff = 60
+
+
+# max_parallel_variants
+# defines how many variants are run at the same time, if multiple values are given for settings (e.g. a list of endpoints
+# or output_destinations). Each variant is run in its own process, independent of the others, writing its own log file
+# 'SparqLaborer (variant n).log'. Note that google authentication with a client_secret is only supported with variants
+# run one after another (unless the resulting credentials.json already exists).
+# OPTIONAL, if not set, 1 will be used (i.e. the variants are run one after another)
+max_parallel_variants = 1
+
+
+# output_compression
+# defines how the csv, tsv, xml and json result files written into a local folder are compressed while they are written
+# (currently available: gzip, zstd, xz), which saves a lot of disk space and I/O for big results. The extension of the
+# compression is appended to the file names (.gz, .zst or .xz). Parquet, arrow and xlsx files are not affected, as they
+# are compressed already. Note that zstd requires the package zstandard (pip install zstandard).
+# OPTIONAL, if not set, None will be used (i.e. result files are not compressed)
+output_compression = None
+
+
+# output_compression_level
+# defines the level of the output_compression, higher levels compressing better but slower (gzip and xz: 0 to 9, zstd: 1 to 22)
+# OPTIONAL, if not set, None will be used (i.e. the default level of the compression: 6 for gzip and xz, 3 for zstd)
+output_compression_level = None
+
+
+# output_compression_threads
+# defines how many threads compress a result file at the same time. Only used by zstd, gzip and xz always use one thread.
+# OPTIONAL, if not set, 1 will be used
+output_compression_threads = 1
+
+
 # -------------------- MANDATORY SETTINGS -------------------- 
 
 # endpoint
@@ -70,6 +271,19 @@ queries = [
         # OPTIONAL, if not set, nothing will be used or displayed
         "description" : "Optional description of first query, used to describe the purpose of the query." ,
 
+        # page_size
+        # fetches the results in pages of this many lines, each page being requested by an ordered LIMIT and OFFSET,
+        # until a page returns fewer lines. Useful for endpoints which cut off or time out on large results.
+        # The results of select queries fetched in pages are always streamed (see stream_results).
+        # OPTIONAL, if not set, all results are fetched with a single request
+        # "page_size" : 10000 ,
+
+        # indexes
+        # the columns to be indexed, if the results are written into a sqlite database (see output_destination). Given as
+        # tuple of names of columns, each indexed on its own, or of tuples of names, each indexed together.
+        # OPTIONAL, if not set, no indexes are created
+        # "indexes" : ("s", ("s", "o")) ,
+
         # query
         # the sparql query itself
         # NOTE: best practise is to attach a 'r' before the string so that python would not interpret some characters as metacharacters, e.g. "\n"
@@ -124,7 +338,7 @@ This dictionary has the following keys and respective values:
 
 * most likely to be needed are these two keys and values:
 'query_title' - title of an individual query, as defined above.
-'results_matrix' - the result data organized as a two dimensional list, where the first row contains the headers. 
+'results_matrix' - the result data organized like a two dimensional list, where the first row contains the headers. (Internally the data is stored column by column for compactness, where its rows are provided as read-only views behaving like lists.) 
 This value is what you would most likely need to post process the result data.  
 
 * other than these two, each query dictionary also contains data from and for SparqLaborer, which might be of use:
@@ -132,7 +346,7 @@ This value is what you would most likely need to post process the result data.
 'query_text' - the sparql query itself.
 'results_execution_duration' - the duration it took to run the sparql query.
 'results_lines_count' - the number of lines the sparql query produced at the triplestore.
-'results_raw' - the result data in the specified format, encapsulated by its respective python class (e.g. a python json object).
+'results_raw' - the result data in the specified format, as the raw bytes returned by the endpoint (or as a binary file, if stream_results is set or the query is fetched in pages).
 'query_for_count' - an infered query from the original query, is used to get number of result lines at the triplestore.
 
 As an example to print the raw data from the second query defined above, write: